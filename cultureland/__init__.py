@@ -1,3 +1,10 @@
+from .cash_log_store import CashLogStore
+from .client_config import ClientConfig, SharedConnectionPool
 from .cultureland import Cultureland
+from .login_coordinator import LoginCoordinator
+from .mTranskey import TranskeyPool, KeypadTemplateMatcher
 from .pin import Pin
+from .quota import QuotaTracker
+from .session_store import SessionData, SessionStore, FileSessionStore, SQLiteSessionStore
+from .voucher_cache import VoucherCache
 from ._types import *
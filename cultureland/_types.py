@@ -1,3 +1,5 @@
+import time
+
 from dataclasses import dataclass
 from typing import Literal, Optional
 from .pin import Pin
@@ -164,9 +166,10 @@ class CulturelandBalance:
         return self.__total_balance
 
 class CulturelandCharge:
-    def __init__(self, message: Literal["충전 완료", "상품권지갑 보관", "잔액이 0원인 상품권", "상품권 번호 불일치", "등록제한(20번 등록실패)"], amount: int):
+    def __init__(self, message: Literal["충전 완료", "상품권지갑 보관", "잔액이 0원인 상품권", "상품권 번호 불일치", "등록제한(20번 등록실패)"], amount: int, pin: Optional[Pin] = None):
         self.__message = message
         self.__amount = amount
+        self.__pin = pin
 
     @property
     def message(self):
@@ -184,6 +187,83 @@ class CulturelandCharge:
         """
         return self.__amount
 
+    @property
+    def pin(self):
+        """
+        충전한 상품권의 핀번호
+        """
+        return self.__pin
+
+class PreparedCharge:
+    """
+    충전 요청 전 작업(트랜스키 세션, 키패드 배열 분석, 핀번호 암호화)이 끝난 충전 요청입니다.
+    `Cultureland.submit_charge` 로 한 번만 제출할 수 있으며, 만료 시간이 지나면 제출할 수 없습니다.
+    """
+
+    def __init__(self, pins: tuple[Pin, ...], only_mobile_vouchers: bool, payload: dict[str, str], ttl: float):
+        self.__pins = pins
+        self.__only_mobile_vouchers = only_mobile_vouchers
+        self.__payload = payload
+        self.__prepared_at = time.monotonic()
+        self.__ttl = ttl
+        self.__submitted = False
+
+    @property
+    def pins(self):
+        """
+        충전할 상품권의 핀번호
+        """
+        return self.__pins
+
+    @property
+    def only_mobile_vouchers(self):
+        """
+        모바일문화상품권만 있는지 여부
+        """
+        return self.__only_mobile_vouchers
+
+    @property
+    def payload(self):
+        """
+        충전 요청에 사용할 페이로드
+        """
+        return self.__payload
+
+    @property
+    def expires_at(self):
+        """
+        만료 시각 (`time.monotonic()`)
+        """
+        return self.__prepared_at + self.__ttl
+
+    @property
+    def expired(self):
+        """
+        만료 여부
+        """
+        return time.monotonic() >= self.expires_at
+
+    @property
+    def submitted(self):
+        """
+        제출 여부
+        """
+        return self.__submitted
+
+    def consume(self):
+        """
+        충전 요청을 제출된 상태로 바꿉니다.
+        이미 제출되었거나 만료된 경우 오류가 발생합니다.
+        """
+
+        if self.__submitted:
+            raise Exception("이미 제출된 충전 요청입니다.")
+
+        if self.expired:
+            raise Exception("만료된 충전 요청입니다.")
+
+        self.__submitted = True
+
 @dataclass
 class PhoneInfoResponse:
     recvType: str # H | M | str
@@ -0,0 +1,239 @@
+import contextlib
+import sqlite3
+import time
+
+from typing import TYPE_CHECKING, Optional
+from ._types import CulturelandCashLog
+
+if TYPE_CHECKING:
+    from .cultureland import Cultureland
+
+CASH_LOG_STORE_VERSION = 1
+
+class CashLogStore:
+    """
+    계정별 컬쳐캐쉬 충전 / 사용 내역을 SQLite에 저장하고 새로 생긴 내역만 동기화합니다.
+    마지막으로 동기화한 내역의 시각을 기준으로 그보다 새로운 페이지만 가져옵니다.
+
+    ```py
+    store = CashLogStore("cash_logs.db")
+    await store.sync(client) # 새로 추가된 내역 수
+    store.query(client.id, since=1704034800) # 오프라인 조회
+    ```
+    """
+
+    def __init__(self, path = ":memory:"):
+        """
+        파라미터:
+            * path (str): SQLite 데이터베이스 경로 (default: 메모리)
+        """
+
+        self.__path = path
+        self.__connection = sqlite3.connect(path)
+        self.__create_tables()
+
+    @property
+    def path(self):
+        """
+        SQLite 데이터베이스 경로
+        """
+        return self.__path
+
+    def __create_tables(self):
+        with self.__connection:
+            self.__connection.executescript(f"""
+                PRAGMA user_version = {CASH_LOG_STORE_VERSION};
+
+                CREATE TABLE IF NOT EXISTS cash_logs (
+                    account TEXT NOT NULL,
+                    timestamp INTEGER NOT NULL,
+                    amount INTEGER NOT NULL,
+                    merchant_code TEXT NOT NULL,
+                    merchant_name TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    balance INTEGER NOT NULL,
+                    spend_type TEXT NOT NULL,
+                    -- 페이지 경계에서 겹치는 내역 중복 제거
+                    UNIQUE (account, timestamp, amount, merchant_code, balance, spend_type)
+                );
+
+                CREATE INDEX IF NOT EXISTS cash_logs_lookup
+                    ON cash_logs (account, timestamp, amount, merchant_code);
+
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    account TEXT PRIMARY KEY,
+                    high_water_mark INTEGER NOT NULL,
+                    synced_at REAL NOT NULL
+                );
+            """)
+
+    def high_water_mark(self, account: str) -> Optional[int]:
+        """
+        마지막으로 동기화된 가장 최근 내역의 시각을 가져옵니다.
+
+        파라미터:
+            * account (str): 계정 ID
+
+        반환값:
+            가장 최근 내역의 시각 (Unix Timestamp, 동기화한 적이 없다면 None)
+        """
+
+        row = self.__connection.execute(
+            "SELECT high_water_mark FROM sync_state WHERE account = ?",
+            (account,)
+        ).fetchone()
+
+        return row[0] if row else None
+
+    def insert(self, account: str, cash_logs: list[CulturelandCashLog]) -> int:
+        """
+        내역을 저장합니다. 이미 저장된 내역은 무시합니다.
+        최근 내역 시각은 갱신하지 않으며, `sync` 가 끝까지 성공했을 때만 갱신됩니다.
+
+        파라미터:
+            * account (str): 계정 ID
+            * cash_logs (list[CulturelandCashLog]): 저장할 내역
+
+        반환값:
+            새로 저장된 내역 수
+        """
+
+        inserted = 0
+
+        with self.__connection:
+            for cash_log in cash_logs:
+                cursor = self.__connection.execute(
+                    "INSERT OR IGNORE INTO cash_logs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        account,
+                        cash_log.timestamp,
+                        cash_log.amount,
+                        cash_log.merchant_code,
+                        cash_log.merchant_name,
+                        cash_log.title,
+                        cash_log.balance,
+                        cash_log.spend_type
+                    )
+                )
+                inserted += cursor.rowcount
+
+        return inserted
+
+    def __set_high_water_mark(self, account: str, high_water_mark: int):
+        with self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)",
+                (account, high_water_mark, time.time())
+            )
+
+    async def sync(self, client: "Cultureland", days = 30, page_size = 100, account: Optional[str] = None) -> int:
+        """
+        마지막 동기화 이후 새로 생긴 내역만 가져와 저장합니다.
+        내역은 최신순으로 반환되므로 마지막으로 저장된 내역보다 오래된 내역이 나오면 요청을 멈춥니다.
+        중간에 실패하면 최근 내역 시각을 갱신하지 않으므로, 다음 동기화에서 빠진 내역을 다시 가져옵니다.
+        두 번째 동기화부터는 `days` 와 관계없이 마지막 동기화 이후의 기간 전체를 조회합니다.
+
+        파라미터:
+            * client (Cultureland): 로그인된 클라이언트
+            * days (int): 처음 동기화할 때 가져올 조회 일수 (default: 30)
+            * page_size (int): 한 번에 가져올 내역 수 (default: 100)
+            * account (str | None): 계정 ID (default: 클라이언트의 컬쳐랜드 ID)
+
+        반환값:
+            새로 저장된 내역 수
+        """
+
+        account = account or client.id
+        high_water_mark = self.high_water_mark(account)
+
+        # 마지막 동기화 이후의 기간만 조회
+        # days로 제한하면 동기화가 오래 멈췄을 때 그 사이의 내역을 영영 가져오지 못하므로 제한하지 않음
+        if high_water_mark is not None:
+            days = int((time.time() - high_water_mark) // 86400) + 2
+
+        batch: list[CulturelandCashLog] = []
+        inserted = 0
+        newest = high_water_mark
+
+        # 중간에 멈추더라도 미리 요청한 다음 페이지가 바로 취소되도록 닫음
+        async with contextlib.aclosing(client.iter_culture_cash_logs(days, page_size)) as cash_logs:
+            async for cash_log in cash_logs:
+                # 같은 시각의 내역은 중복일 수 있으므로 저장 시 중복 제거
+                if high_water_mark is not None and cash_log.timestamp < high_water_mark:
+                    break
+
+                if newest is None or cash_log.timestamp > newest:
+                    newest = cash_log.timestamp
+
+                batch.append(cash_log)
+                if len(batch) >= page_size:
+                    inserted += self.insert(account, batch)
+                    batch = []
+
+        if batch:
+            inserted += self.insert(account, batch)
+
+        # 최신순으로 내려가므로 중간에 실패하면 더 오래된 내역이 남아있음
+        # 끝까지 성공했을 때만 최근 내역 시각을 갱신하여 다음 동기화에서 이어서 가져옴
+        if newest is not None:
+            self.__set_high_water_mark(account, newest)
+
+        return inserted
+
+    def query(self, account: str, since: Optional[int] = None, until: Optional[int] = None, amount: Optional[int] = None, merchant_code: Optional[str] = None, limit: Optional[int] = None):
+        """
+        저장된 내역을 최신순으로 조회합니다.
+
+        파라미터:
+            * account (str): 계정 ID
+            * since (int | None): 이 시각 이후의 내역만 조회 (Unix Timestamp)
+            * until (int | None): 이 시각 이전의 내역만 조회 (Unix Timestamp)
+            * amount (int | None): 사용 금액이 일치하는 내역만 조회
+            * merchant_code (str | None): 사용 가맹점 코드가 일치하는 내역만 조회
+            * limit (int | None): 최대 내역 수
+
+        반환값:
+            내역 목록 (list[CulturelandCashLog])
+        """
+
+        query = "SELECT title, merchant_code, merchant_name, amount, balance, spend_type, timestamp FROM cash_logs WHERE account = ?"
+        parameters: list = [account]
+
+        if since is not None:
+            query += " AND timestamp >= ?"
+            parameters.append(since)
+        if until is not None:
+            query += " AND timestamp <= ?"
+            parameters.append(until)
+        if amount is not None:
+            query += " AND amount = ?"
+            parameters.append(amount)
+        if merchant_code is not None:
+            query += " AND merchant_code = ?"
+            parameters.append(merchant_code)
+
+        query += " ORDER BY timestamp DESC, rowid ASC"
+
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters.append(limit)
+
+        return [
+            CulturelandCashLog(
+                title=row[0],
+                merchant_code=row[1],
+                merchant_name=row[2],
+                amount=row[3],
+                balance=row[4],
+                spend_type=row[5],
+                timestamp=row[6]
+            )
+            for row in self.__connection.execute(query, parameters)
+        ]
+
+    def close(self):
+        """
+        데이터베이스 연결을 닫습니다.
+        """
+
+        self.__connection.close()
@@ -0,0 +1,261 @@
+import ssl
+import httpx
+
+from httpx._utils import get_environment_proxies
+from typing import Optional
+from ._types import version, repository_url
+
+BASE_URL = "https://m.cultureland.co.kr"
+
+class ClientConfig:
+    """
+    컬쳐랜드 요청에 사용할 커넥션 풀, HTTP/2, 타임아웃 설정입니다.
+    같은 설정으로 만든 트랜스포트는 TLS 컨텍스트(인증서 로드 결과)를 공유합니다.
+    기본값은 httpx의 기본값과 같습니다.
+    """
+
+    def __init__(self, max_connections: Optional[int] = 100, max_keepalive_connections: Optional[int] = 20, keepalive_expiry: Optional[float] = 5.0, http2 = False, timeout: float | httpx.Timeout = 5.0, retries = 0, verify: bool | str | ssl.SSLContext = True, trust_env = True):
+        """
+        파라미터:
+            * max_connections (int | None): 최대 동시 연결 수 (None이면 제한 없음, default: 100)
+            * max_keepalive_connections (int | None): 유지할 유휴 연결 수 (None이면 제한 없음, default: 20)
+            * keepalive_expiry (float | None): 유휴 연결을 유지할 시간 (초, default: 5)
+            * http2 (bool): HTTP/2 사용 여부, `h2` 패키지 필요 (default: False)
+            * timeout (float | httpx.Timeout): 요청 타임아웃 (초, default: 5)
+            * retries (int): 연결 실패 시 재시도 횟수 (default: 0)
+            * verify (bool | str | ssl.SSLContext): TLS 인증서 검증 설정 (default: True)
+            * trust_env (bool): 환경 변수의 프록시, 인증서 설정 사용 여부 (default: True)
+        """
+
+        if retries < 0:
+            raise ValueError("retries는 0 이상이어야 합니다.")
+
+        if http2:
+            try:
+                import h2 # type: ignore
+            except ImportError:
+                raise ImportError("HTTP/2를 사용하려면 h2 패키지가 필요합니다. (pip install cultureland.py[http2])")
+
+        self.__limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.__http2 = http2
+        self.__timeout = timeout if isinstance(timeout, httpx.Timeout) else httpx.Timeout(timeout)
+        self.__retries = retries
+        self.__verify = verify
+        self.__trust_env = trust_env
+        self.__ssl_context: Optional[ssl.SSLContext] = None
+
+    @property
+    def limits(self):
+        """
+        커넥션 풀 제한
+        """
+        return self.__limits
+
+    @property
+    def http2(self):
+        """
+        HTTP/2 사용 여부
+        """
+        return self.__http2
+
+    @property
+    def timeout(self):
+        """
+        요청 타임아웃
+        """
+        return self.__timeout
+
+    @property
+    def retries(self):
+        """
+        연결 실패 시 재시도 횟수
+        """
+        return self.__retries
+
+    @property
+    def ssl_context(self):
+        """
+        트랜스포트들이 공유하는 TLS 컨텍스트
+        """
+
+        # 인증서 로드는 비용이 크므로 한 번만 생성
+        if self.__ssl_context is None:
+            self.__ssl_context = httpx.create_ssl_context(verify=self.__verify, trust_env=self.__trust_env, http2=self.__http2)
+
+        return self.__ssl_context
+
+    def create_transport(self, proxy: Optional[httpx.Proxy] = None):
+        """
+        설정이 적용된 새 커넥션 풀(트랜스포트)을 생성합니다.
+
+        파라미터:
+            * proxy (httpx.Proxy | None): 사용할 프록시
+
+        반환값:
+            트랜스포트 (httpx.AsyncHTTPTransport)
+        """
+
+        return httpx.AsyncHTTPTransport(
+            verify=self.ssl_context,
+            http2=self.__http2,
+            limits=self.__limits,
+            trust_env=self.__trust_env,
+            proxy=proxy,
+            retries=self.__retries
+        )
+
+    def create_proxy_mounts(self) -> dict[str, Optional[httpx.AsyncHTTPTransport]]:
+        """
+        환경 변수(`HTTP_PROXY`, `HTTPS_PROXY`, `ALL_PROXY`, `NO_PROXY`)의 프록시 설정으로 트랜스포트를 생성합니다.
+        httpx는 트랜스포트를 직접 지정하면 환경 변수의 프록시를 무시하므로 같은 규칙으로 직접 마운트합니다.
+
+        반환값:
+            URL 패턴별 트랜스포트 (프록시를 사용하지 않는 패턴은 None, `trust_env` 가 꺼져 있다면 빈 dict)
+        """
+
+        if not self.__trust_env:
+            return {}
+
+        return {
+            pattern: None if url is None else self.create_transport(httpx.Proxy(url=url))
+            for pattern, url in get_environment_proxies().items()
+        }
+
+    def create_client(self, transport: Optional[httpx.AsyncBaseTransport] = None, mounts: Optional[dict[str, Optional[httpx.AsyncBaseTransport]]] = None):
+        """
+        설정이 적용된 컬쳐랜드 클라이언트를 생성합니다.
+
+        파라미터:
+            * transport (httpx.AsyncBaseTransport | None): 사용할 트랜스포트 (default: 새 트랜스포트와 환경 변수의 프록시)
+            * mounts (dict[str, httpx.AsyncBaseTransport | None] | None): URL 패턴별 트랜스포트
+
+        반환값:
+            클라이언트 (httpx.AsyncClient)
+        """
+
+        if transport is None:
+            transport = self.create_transport()
+            if mounts is None:
+                mounts = self.create_proxy_mounts()
+
+        return httpx.AsyncClient(
+            base_url=BASE_URL,
+            headers={
+                "User-Agent": f"cultureland.py/{version} (+{repository_url})"
+            },
+            timeout=self.__timeout,
+            trust_env=self.__trust_env,
+            transport=transport,
+            mounts=mounts
+        )
+
+DEFAULT_CLIENT_CONFIG = ClientConfig()
+
+class _SharedTransportView(httpx.AsyncBaseTransport):
+    """
+    공유 커넥션 풀로 요청을 넘기되, 클라이언트가 닫혀도 풀은 닫지 않는 트랜스포트입니다.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.__transport = transport
+
+    async def handle_async_request(self, request: httpx.Request):
+        return await self.__transport.handle_async_request(request)
+
+    async def aclose(self):
+        pass
+
+class SharedConnectionPool:
+    """
+    여러 계정(Cultureland 인스턴스)이 하나의 커넥션 풀을 공유하게 해줍니다.
+    풀에서 만든 클라이언트는 연결만 공유하고, 쿠키와 헤더는 클라이언트마다 따로 가집니다.
+
+    ```py
+    async with SharedConnectionPool() as pool:
+        clients = [Cultureland(connection_pool=pool) for _ in range(100)]
+    ```
+    """
+
+    def __init__(self, config: Optional[ClientConfig] = None, transport: Optional[httpx.AsyncBaseTransport] = None):
+        """
+        파라미터:
+            * config (ClientConfig | None): 풀과 클라이언트에 적용할 설정 (default: 기본 설정)
+            * transport (httpx.AsyncBaseTransport | None): 공유할 트랜스포트 (default: config로 새로 생성, 환경 변수의 프록시 포함)
+        """
+
+        self.__config = config or DEFAULT_CLIENT_CONFIG
+        self.__closed = False
+
+        # httpx와 같이 트랜스포트를 직접 지정한 경우에는 환경 변수의 프록시를 사용하지 않음
+        if transport:
+            self.__transport = transport
+            self.__mounts: dict[str, Optional[httpx.AsyncBaseTransport]] = {}
+        else:
+            self.__transport = self.__config.create_transport()
+            self.__mounts = self.__config.create_proxy_mounts()
+
+    @property
+    def config(self):
+        """
+        풀과 클라이언트에 적용된 설정
+        """
+        return self.__config
+
+    @property
+    def transport(self):
+        """
+        공유 중인 트랜스포트
+        """
+        return self.__transport
+
+    @property
+    def is_closed(self):
+        """
+        풀이 닫혔는지 여부
+        """
+        return self.__closed
+
+    def create_client(self):
+        """
+        공유 커넥션 풀을 사용하는 새 클라이언트를 생성합니다.
+        클라이언트를 닫아도 풀은 닫히지 않습니다.
+
+        반환값:
+            쿠키와 헤더가 분리된 클라이언트 (httpx.AsyncClient)
+        """
+
+        if self.__closed:
+            raise Exception("이미 닫힌 커넥션 풀입니다.")
+
+        return self.__config.create_client(
+            _SharedTransportView(self.__transport),
+            {
+                pattern: None if transport is None else _SharedTransportView(transport)
+                for pattern, transport in self.__mounts.items()
+            }
+        )
+
+    async def aclose(self):
+        """
+        공유 커넥션 풀을 닫습니다.
+        """
+
+        if self.__closed:
+            return
+
+        self.__closed = True
+        await self.__transport.aclose()
+
+        for transport in self.__mounts.values():
+            if transport:
+                await transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
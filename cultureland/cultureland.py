@@ -1,14 +1,24 @@
+import asyncio
 import base64
+import hashlib
 import json
 import os
 import re
+import weakref
 import httpx
+from concurrent.futures import Executor
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterable, Iterable, Optional
 from urllib import parse
 from bs4 import BeautifulSoup
-from .mTranskey import mTranskey
+from .client_config import BASE_URL, ClientConfig, DEFAULT_CLIENT_CONFIG, SharedConnectionPool
+from .login_coordinator import LoginCoordinator
+from .login_state import LoginState
+from .mTranskey import mTranskey, TranskeyPool, KeyInfoCache, KeypadLayoutCache, KeypadTemplateMatcher
 from .pin import Pin
+from .quota import QuotaTracker
+from .session_store import SessionData, SessionStore, create_credential, verify_credential
+from .voucher_cache import VoucherCache
 from ._types import *
 
 class Cultureland:
@@ -22,16 +32,101 @@ class Cultureland:
     __keep_login_info: str
     __user_info: CulturelandUser
 
-    def __init__(self, client: Optional[httpx.AsyncClient] = None):
-        self.__client = client or httpx.AsyncClient(
-            base_url="https://m.cultureland.co.kr",
-            headers={
-                "User-Agent": f"cultureland.py/{version} (+{repository_url})"
-            }
-        )
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, transkey_pool: Optional[TranskeyPool] = None, key_info_cache: Optional[KeyInfoCache] = None, keypad_layout_cache: Optional[KeypadLayoutCache] = None, keypad_concurrency = 10, executor: Optional[Executor] = None, keypad_matchers: Optional[list[KeypadTemplateMatcher]] = None, login_ttl: float = 0, client_config: Optional[ClientConfig] = None, connection_pool: Optional[SharedConnectionPool] = None, voucher_cache: Optional[VoucherCache] = None, quota_tracker: Optional[QuotaTracker] = None, session_store: Optional[SessionStore] = None, login_coordinator: Optional[LoginCoordinator] = None):
+        """
+        파라미터:
+            * client (httpx.AsyncClient | None): 요청에 사용할 클라이언트
+            * transkey_pool (TranskeyPool | None): 미리 생성된 트랜스키 세션을 꺼내 쓸 풀
+            * key_info_cache (KeyInfoCache | None): 키 좌표 캐시 (default: 프로세스 전역 캐시)
+            * keypad_layout_cache (KeypadLayoutCache | None): 키패드 배열 캐시 (default: 프로세스 전역 캐시)
+            * keypad_concurrency (int): 충전 시 동시에 가져올 키패드 배열 수 (default: 10)
+            * executor (Executor | None): 키패드 사진 분석과 SEED 암호화를 실행할 스레드/프로세스 executor (default: 이벤트 루프에서 실행)
+            * keypad_matchers (list[KeypadTemplateMatcher] | None): 해시 대신 키패드 인식에 사용할 키패드 종류별 템플릿 분류기
+            * login_ttl (float): 로그인 확인 결과를 신뢰할 시간 (초, 0이면 매번 확인, default: 0)
+            * client_config (ClientConfig | None): client가 없을 때 새 클라이언트를 만들 커넥션 풀, HTTP/2, 타임아웃 설정 (default: 기본 설정)
+            * connection_pool (SharedConnectionPool | None): client가 없을 때 다른 계정과 공유할 커넥션 풀 (쿠키는 계정마다 분리됨)
+            * voucher_cache (VoucherCache | None): 상품권 조회 결과 캐시 (default: 캐싱하지 않음)
+            * quota_tracker (QuotaTracker | None): 상품권 조회, 충전 실패, 선물 한도 추적기 (default: 추적하지 않음)
+            * session_store (SessionStore | None): 로그인 세션을 저장하고 재개할 저장소 (default: 저장하지 않음)
+            * login_coordinator (LoginCoordinator | None): 같은 계정의 동시 로그인을 하나로 합칠 조정기 (default: 합치지 않음, lock_directory 사용 시 session_store 필요)
+        """
+
+        if keypad_concurrency < 1:
+            raise ValueError("keypad_concurrency는 1 이상이어야 합니다.")
+
+        # 다른 프로세스의 로그인 결과는 세션 저장소로만 공유할 수 있음
+        if login_coordinator and login_coordinator.lock_directory and not session_store:
+            raise ValueError("프로세스 간 로그인을 합치려면 session_store가 필요합니다.")
+
+        self.__transkey_pool = transkey_pool
+        self.__key_info_cache = key_info_cache
+        self.__keypad_layout_cache = keypad_layout_cache
+        self.__keypad_concurrency = keypad_concurrency
+        self.__executor = executor
+        self.__keypad_matchers = keypad_matchers
+        self.__voucher_cache = voucher_cache
+        self.__quota_tracker = quota_tracker
+        self.__session_store = session_store
+        self.__login_coordinator = login_coordinator
+        self.__credential: Optional[str] = None # 세션과 함께 저장할 비밀번호 검증값
+
+        # 직접 생성한 클라이언트만 aclose()에서 닫음
+        self.__owns_client = client is None
+        if client:
+            self.__client = client
+        elif connection_pool:
+            self.__client = connection_pool.create_client()
+        else:
+            self.__client = (client_config or DEFAULT_CLIENT_CONFIG).create_client()
 
         if client:
-            self.__client._base_url = "https://m.cultureland.co.kr"
+            self.__client.base_url = BASE_URL
+
+        # 로그아웃, 로그인 페이지로의 리다이렉트, 오류 응답 시 로그인 상태 무효화
+        self.__login_state = LoginState(login_ttl)
+        self.__login_response_hook = Cultureland.__create_login_response_hook(self)
+
+        response_hooks = self.__client.event_hooks["response"]
+        # 외부 클라이언트를 여러 인스턴스가 공유하는 경우 이미 사라진 인스턴스의 훅 정리
+        response_hooks[:] = [hook for hook in response_hooks if getattr(hook, "is_alive", lambda: True)()]
+        response_hooks.append(self.__login_response_hook)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        직접 생성한 클라이언트의 커넥션 풀을 닫습니다.
+        외부에서 전달받은 클라이언트와 공유 커넥션 풀은 닫지 않고, 로그인 상태 확인 훅만 제거합니다.
+
+        ```py
+        async with Cultureland() as client:
+            await client.login("keep_login_info")
+        ```
+        """
+
+        response_hooks = self.__client.event_hooks["response"]
+        if self.__login_response_hook in response_hooks:
+            response_hooks.remove(self.__login_response_hook)
+
+        if self.__owns_client and not self.__client.is_closed:
+            await self.__client.aclose()
+
+    @staticmethod
+    def __create_login_response_hook(cultureland: "Cultureland"):
+        # 훅이 인스턴스를 붙잡아 두지 않도록 약한 참조 사용
+        check_login_response = weakref.WeakMethod(cultureland.__check_login_response)
+
+        async def login_response_hook(response: httpx.Response):
+            method = check_login_response()
+            if method:
+                await method(response)
+
+        login_response_hook.is_alive = lambda: check_login_response() is not None
+        return login_response_hook
 
     @property
     def client(self):
@@ -53,11 +148,16 @@ class Cultureland:
     def user_info(self):
         return self.__user_info
 
+    @property
+    def login_state(self):
+        return self.__login_state
+
     async def check_voucher(self, pin: Pin):
         """
         컬쳐랜드상품권(모바일문화상품권, 16자리)의 정보를 가져옵니다.
         로그인이 필요합니다.
         계정당 일일 조회수 10회 한도가 있습니다.
+        `voucher_cache` 가 설정되어 있다면 캐시된 결과를 반환합니다.
 
         파라미터:
             * pin (Pin): 상품권의 핀번호
@@ -79,21 +179,31 @@ class Cultureland:
                 * timestamp (int): 사용 시각 (Unix Timestamp)
         """
 
-        if not await self.is_login():
-            raise Exception("로그인이 필요한 서비스 입니다.")
+        await self.__ensure_login()
 
         # 핀번호가 유효하지 않거나 41로 시작하지 않거나 311~319로 시작하지 않는다면 리턴
         # /assets/js/egovframework/com/cland/was/util/ClandCmmUtl.js L1281
         if not pin.parts or not (pin.parts[0].startswith("41") or (pin.parts[0].startswith("31") and pin.parts[0][2] != "0")):
             raise Exception("정확한 모바일 상품권 번호를 입력하세요.")
 
-        transkey = mTranskey(self.__client)
+        # 같은 핀번호의 조회는 캐시하고, 동시에 들어온 조회는 한 번만 요청
+        if self.__voucher_cache:
+            return await self.__voucher_cache.get_or_fetch(pin, lambda: self.__check_voucher(pin))
+
+        return await self.__check_voucher(pin)
+
+    async def __check_voucher(self, pin: Pin):
+        quota_account = self.__quota_account()
+        if quota_account:
+            self.__quota_tracker.check_voucher_lookup(quota_account)
+
+        transkey = await self.__create_transkey()
         servlet_data = await transkey.get_servlet_data()
 
         # <input type="tel" title="네 번째 6자리 입력" id="input-14" name="culturelandInput">
         keypad = transkey.create_keypad(servlet_data, "number", "input-14", "culturelandInput", "tel")
         keypad_layout = await keypad.get_keypad_layout()
-        encrypted_pin, encrypted_hmac = keypad.encrypt_password(pin.parts[3], keypad_layout)
+        encrypted_pin, encrypted_hmac = await keypad.encrypt_password_async(pin.parts[3], keypad_layout)
 
         payload = {
             "culturelandNo": pin.parts[0] + pin.parts[1] + pin.parts[2],
@@ -117,6 +227,9 @@ class Cultureland:
 
         voucher_data = VoucherResponse(**voucher_data_request.json())
 
+        if quota_account:
+            self.__quota_tracker.record_voucher_lookup(quota_account, exhausted=voucher_data.resultCd == "1")
+
         if voucher_data.resultCd != "0":
             if voucher_data.resultCd == "1":
                 raise Exception("일일 조회수를 초과하셨습니다.")
@@ -163,8 +276,7 @@ class Cultureland:
             * total_balance (int): 총 잔액 (사용 가능 금액 + 보관중인 금액)
         """
 
-        if not await self.is_login():
-            raise Exception("로그인이 필요한 서비스 입니다.")
+        await self.__ensure_login()
 
         balance_request = await self.__client.post("/tgl/getBalance.json")
 
@@ -206,23 +318,165 @@ class Cultureland:
         반환값:
             * message (str): 성공 여부 메시지 `충전 완료` | `상품권지갑 보관` | `잔액이 0원인 상품권` | `상품권 번호 불일치` | `등록제한(20번 등록실패)`
             * amount (int): 충전 금액
+            * pin (Pin): 충전한 상품권의 핀번호
         """
 
-        if not await self.is_login():
-            raise Exception("로그인이 필요한 서비스 입니다.")
+        await self.__ensure_login()
+
+        prepared = await self.prepare_charge(*pins)
+        results = await self.__submit_charge(prepared)
+
+        return results[0] if len(results) == 1 else results
+
+    async def prepare_charge(self, *pins: Pin, ttl: float = 300):
+        """
+        충전 요청 전 작업(트랜스키 세션, 키패드 배열 분석, 핀번호 암호화)을 미리 수행합니다.
+        반환된 충전 요청은 `submit_charge` 로 제출하며, 제출 시에는 선행 페이지 요청과 충전 요청만 보냅니다.
+
+        파라미터:
+            * *pins (Pin): 상품권의 핀번호 (최대 10개)
+            * ttl (float): 충전 요청을 제출할 수 있는 시간 (초, default: 300)
+
+        ```py
+        prepared = await client.prepare_charge(Pin("3110-0123-4567-8901"))
+        charge = await client.submit_charge(prepared)
+        print(charge.message) # 충전 완료
+        ```
+
+        반환값:
+            한 번만 제출 가능한 충전 요청 (PreparedCharge)
+        """
 
         if len(pins) == 0 or len(pins) > 10:
             raise ValueError("핀번호는 1개 이상, 10개 이하여야 합니다.")
 
+        if ttl <= 0:
+            raise ValueError("ttl은 0보다 커야 합니다.")
+
+        # 충전 실패 한도를 넘겼다면 트랜스키 작업 전에 실패
+        quota_account = self.__quota_account()
+        if quota_account:
+            self.__quota_tracker.check_charge(quota_account)
+
         only_mobile_vouchers = all(len(pin.parts[3]) == 4 for pin in pins) # 모바일문화상품권만 있는지
 
-        # 선행 페이지 요청을 보내지 않으면 잘못된 접근 오류 발생
-        await self.__client.get(
-            "/csh/cshGiftCard.do" if only_mobile_vouchers # 모바일문화상품권
-            else "/csh/cshGiftCardOnline.do" # 문화상품권(18자리)
-        ) # 문화상품권(18자리)에서 모바일문화상품권도 충전 가능, 모바일문화상품권에서 문화상품권(18자리) 충전 불가능
+        payload = await self.__prepare_charge(pins)
+        return PreparedCharge(pins, only_mobile_vouchers, payload, ttl)
 
-        transkey = mTranskey(self.__client)
+    async def submit_charge(self, prepared: PreparedCharge):
+        """
+        `prepare_charge` 로 준비한 충전 요청을 제출합니다.
+        이미 제출되었거나 만료된 충전 요청은 제출할 수 없습니다.
+
+        파라미터:
+            * prepared (PreparedCharge): 준비된 충전 요청
+
+        반환값:
+            * message (str): 성공 여부 메시지 `충전 완료` | `상품권지갑 보관` | `잔액이 0원인 상품권` | `상품권 번호 불일치` | `등록제한(20번 등록실패)`
+            * amount (int): 충전 금액
+            * pin (Pin): 충전한 상품권의 핀번호
+        """
+
+        await self.__ensure_login()
+
+        results = await self.__submit_charge(prepared)
+
+        return results[0] if len(results) == 1 else results
+
+    async def charge_many(self, pins: Iterable[Pin] | AsyncIterable[Pin]):
+        """
+        개수 제한 없이 핀번호를 충전하고 결과를 하나씩 반환합니다.
+        핀번호는 종류별로 최대 10개씩 묶어 충전하며, 다음 묶음의 암호화는 현재 묶음을 충전하는 동안 미리 수행합니다.
+        결과는 입력 순서가 아닌 충전 순서대로 반환되므로 `pin` 으로 구분해야 합니다.
+
+        파라미터:
+            * pins (Iterable[Pin] | AsyncIterable[Pin]): 상품권의 핀번호 목록
+
+        ```py
+        async for charge in client.charge_many(Pin(line) for line in open("pins.txt")):
+            print(charge.pin, charge.message) # 3110-0123-4567-8901 충전 완료
+        ```
+
+        반환값 (CulturelandCharge):
+            * message (str): 성공 여부 메시지
+            * amount (int): 충전 금액
+            * pin (Pin): 충전한 상품권의 핀번호
+        """
+
+        await self.__ensure_login()
+
+        pending: Optional[asyncio.Task[PreparedCharge]] = None # 충전할 차례인 묶음
+        preparing: Optional[asyncio.Task[PreparedCharge]] = None # 미리 암호화 중인 다음 묶음
+
+        try:
+            async for batch in self.__batch_pins(pins):
+                # 다음 묶음을 미리 암호화하면서 이전 묶음을 충전
+                preparing = asyncio.create_task(self.prepare_charge(*batch))
+
+                if pending:
+                    prepared = await pending
+                    pending = None
+                    for result in await self.__submit_charge(prepared):
+                        yield result
+
+                pending, preparing = preparing, None
+
+            if pending:
+                prepared = await pending
+                pending = None
+                for result in await self.__submit_charge(prepared):
+                    yield result
+        finally:
+            # 중간에 멈추거나 오류가 발생하면 충전하지 않은 묶음의 암호화 작업 취소 (작업의 오류도 회수)
+            tasks = [task for task in (pending, preparing) if task]
+            for task in tasks:
+                task.cancel()
+
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def __batch_pins(pins: Iterable[Pin] | AsyncIterable[Pin]):
+        # 모바일문화상품권(4자리)과 문화상품권(6자리)을 각각 10개씩 모아 반환
+        # 남은 핀번호는 문화상품권(18자리) 충전 페이지에서 함께 충전하여 요청 수를 최소화
+        mobile: list[Pin] = []
+        online: list[Pin] = []
+
+        async def iterate():
+            if isinstance(pins, AsyncIterable):
+                async for pin in pins:
+                    yield pin
+            else:
+                for pin in pins:
+                    yield pin
+
+        async for pin in iterate():
+            if not pin.parts:
+                raise ValueError("존재하지 않는 상품권입니다.")
+
+            if len(pin.parts[3]) == 4:
+                mobile.append(pin)
+                if len(mobile) == 10:
+                    yield tuple(mobile)
+                    mobile = []
+            else:
+                online.append(pin)
+                if len(online) == 10:
+                    yield tuple(online)
+                    online = []
+
+        # 문화상품권(18자리) 충전 페이지에서 모바일문화상품권도 충전 가능
+        if online:
+            fill = 10 - len(online)
+            yield tuple(online + mobile[:fill])
+            mobile = mobile[fill:]
+
+        if mobile:
+            yield tuple(mobile)
+
+    async def __prepare_charge(self, pins: tuple[Pin, ...]):
+        # 트랜스키 세션 생성, 키패드 배열 분석, 핀번호 암호화까지 충전 요청 전 작업을 수행
+        transkey = await self.__create_transkey()
         servlet_data = await transkey.get_servlet_data()
 
         payload = {
@@ -231,18 +485,32 @@ class Cultureland:
             "transkeyUuid": transkey.transkey_data.transkey_uuid
         }
 
+        # 키패드는 서로 독립적이므로 배열을 동시에 가져옴 (최대 keypad_concurrency개)
+        semaphore = asyncio.Semaphore(self.__keypad_concurrency)
+
+        async def get_keypad(pin_count: int):
+            txtScr4 = f"txtScr{pin_count}4"
+
+            # <input type="password" name="{scr4}" id="{txtScr4}">
+            keypad = transkey.create_keypad(servlet_data, "number", txtScr4, f"scr{pin_count}4")
+            async with semaphore:
+                keypad_layout = await keypad.get_keypad_layout()
+
+            return keypad, keypad_layout
+
+        keypads = await asyncio.gather(*[get_keypad(i + 1) for i in range(len(pins))]) # scr0x이 아닌 scr1x부터 시작하기 때문에 1부터 시작
+
+        # 페이로드는 핀번호 순서대로 조립
         for i in range(len(pins)):
             pin = pins[i]
 
             parts = pin.parts or ["", "", "", ""]
-            pin_count = i + 1 # scr0x이 아닌 scr1x부터 시작하기 때문에 1부터 시작
+            pin_count = i + 1
 
             txtScr4 = f"txtScr{pin_count}4"
 
-            # <input type="password" name="{scr4}" id="{txtScr4}">
-            keypad = transkey.create_keypad(servlet_data, "number", txtScr4, f"scr{pin_count}4")
-            keypad_layout = await keypad.get_keypad_layout()
-            encrypted_pin, encrypted_hmac = keypad.encrypt_password(parts[3], keypad_layout)
+            keypad, keypad_layout = keypads[i]
+            encrypted_pin, encrypted_hmac = await keypad.encrypt_password_async(parts[3], keypad_layout)
 
             # scratch (핀번호)
             payload[f"scr{pin_count}1"] = parts[0]
@@ -258,6 +526,21 @@ class Cultureland:
             payload["transkey_" + txtScr4] = encrypted_pin
             payload["transkey_HM_" + txtScr4] = encrypted_hmac
 
+        return payload
+
+    async def __submit_charge(self, prepared: PreparedCharge):
+        prepared.consume()
+
+        pins = prepared.pins
+        only_mobile_vouchers = prepared.only_mobile_vouchers
+        payload = prepared.payload
+
+        # 선행 페이지 요청을 보내지 않으면 잘못된 접근 오류 발생
+        await self.__client.get(
+            "/csh/cshGiftCard.do" if only_mobile_vouchers # 모바일문화상품권
+            else "/csh/cshGiftCardOnline.do" # 문화상품권(18자리)
+        ) # 문화상품권(18자리)에서 모바일문화상품권도 충전 가능, 모바일문화상품권에서 문화상품권(18자리) 충전 불가능
+
         charge_request = await self.__client.post(
             "/csh/cshGiftCardProcess.do" if only_mobile_vouchers # 모바일문화상품권
             else "/csh/cshGiftCardOnlineProcess.do", # 문화상품권(18자리)
@@ -270,16 +553,26 @@ class Cultureland:
         parsed_results = BeautifulSoup(charge_result_request.text, "html.parser") # 충전 결과 HTML 파싱
         parsed_results = parsed_results.find("tbody").find_all("tr")
 
+        # 충전 후 잔액이 바뀌므로 상품권 조회 캐시 제거
+        if self.__voucher_cache:
+            for pin in pins:
+                self.__voucher_cache.invalidate(pin)
+
         results: list[CulturelandCharge] = []
         for i in range(len(pins)):
             charge_result = parsed_results[i].find_all("td")
 
             results.append(CulturelandCharge(
                 message=charge_result[2].text,
-                amount=int(charge_result[3].text.replace(",", "").replace("원", ""))
+                amount=int(charge_result[3].text.replace(",", "").replace("원", "")),
+                pin=pins[i]
             ))
 
-        return results[0] if len(results) == 1 else results
+        quota_account = self.__quota_account()
+        if quota_account:
+            self.__quota_tracker.record_charge(quota_account, results)
+
+        return results
 
     async def gift(self, amount: int, quantity = 1):
         """
@@ -302,8 +595,7 @@ class Cultureland:
             * url (str): 선물 바코드 URL
         """
 
-        if not await self.is_login():
-            raise Exception("로그인이 필요한 서비스 입니다.")
+        await self.__ensure_login()
 
         # 구매 금액이 조건에 맞지 않을 때
         if amount % 100 != 0 or amount < 1000 or amount > 50000:
@@ -316,6 +608,11 @@ class Cultureland:
             raise ValueError("구매 수량은 최소 1개부터 최대 5개까지 입력 가능합니다.")
         """
 
+        # 선물 한도를 넘겼다면 요청 전에 실패
+        quota_account = self.__quota_account()
+        if quota_account:
+            self.__quota_tracker.check_gift(quota_account, amount * quantity)
+
         # 선행 페이지 요청을 보내지 않으면 잘못된 접근 오류 발생
         await self.__client.get("/gft/gftPhoneApp.do")
 
@@ -377,6 +674,9 @@ class Cultureland:
             # 선물 결과에서 핀번호(바코드 번호) 파싱
             pin_code = barcode_data.split("<span>바코드번호</span>")[1].split("</span>")[0].split("<span>")[1]
 
+            if quota_account:
+                self.__quota_tracker.record_gift(quota_account, amount * quantity)
+
             return CulturelandGift(
                 pin=Pin(pin_code),
                 url=str(self.__client.base_url.join(barcode_path))
@@ -402,8 +702,7 @@ class Cultureland:
             * remain (int): 잔여 선물 한도
             * limit (int): 최대 선물 한도
         """
-        if not await self.is_login():
-            raise Exception("로그인이 필요한 서비스 입니다.")
+        await self.__ensure_login()
 
         limit_info_request = await self.__client.post("/gft/chkGiftLimitAmt.json")
 
@@ -415,6 +714,11 @@ class Cultureland:
                 raise Exception(limit_info.errMsg)
 
         gift_vo = GiftVO(**limit_info.giftVO)
+
+        quota_account = self.__quota_account()
+        if quota_account:
+            self.__quota_tracker.record_gift_limit(quota_account, gift_vo.ccashRemainAmt)
+
         return CulturelandGiftLimit(
             remain=gift_vo.ccashRemainAmt,
             limit=gift_vo.ccashLimitAmt
@@ -440,9 +744,11 @@ class Cultureland:
             * index (int | None): 유저 고유 인덱스
         """
 
-        if not await self.is_login():
-            raise Exception("로그인이 필요한 서비스 입니다.")
+        await self.__ensure_login()
+
+        return await self.__fetch_user_info()
 
+    async def __fetch_user_info(self):
         user_info_request = await self.__client.post("/tgl/flagSecCash.json")
 
         user_info = UserInfoResponse(**user_info_request.json())
@@ -478,8 +784,7 @@ class Cultureland:
             * verification_level (str): 멤버의 인증 등급
         """
 
-        if not await self.is_login():
-            raise Exception("로그인이 필요한 서비스 입니다.")
+        await self.__ensure_login()
 
         member_info_request = await self.__client.post("/mmb/mmbMain.do")
         member_info = member_info_request.text
@@ -524,9 +829,65 @@ class Cultureland:
             * timestamp (int): 사용 시각 (Unix Timestamp)
         """
 
-        if not await self.is_login():
-            raise Exception("로그인이 필요한 서비스 입니다.")
+        await self.__ensure_login()
+
+        cultureland_cash_logs, _ = await self.__get_cash_logs_page(days, page_size, page)
+        return cultureland_cash_logs
+
+    async def iter_culture_cash_logs(self, days: int, page_size = 20):
+        """
+        컬쳐캐쉬 충전 / 사용 내역을 모든 페이지에 걸쳐 하나씩 반환합니다.
+        현재 페이지를 처리하는 동안 다음 페이지를 미리 가져오며, 한 번에 최대 두 페이지만 메모리에 유지합니다.
+
+        파라미터:
+            * days (int): 조회 일수
+            * page_size (int): 한 번에 가져올 내역 수 (default: 20)
+
+        ```py
+        # 최근 30일간의 모든 내역
+        async for cash_log in client.iter_culture_cash_logs(30, 100):
+            print(cash_log.title, cash_log.amount)
+        ```
+
+        반환값 (CulturelandCashLog):
+            * title (str): 내역 제목
+            * merchant_code (str): 사용 가맹점 코드
+            * merchant_name (str): 사용 가맹점 이름
+            * amount (int): 사용 금액
+            * balance (int): 사용 후 남은 잔액
+            * spend_type (str): 사용 종류 `사용` | `사용취소` | `충전`
+            * timestamp (int): 사용 시각 (Unix Timestamp)
+        """
+
+        if page_size < 1:
+            raise ValueError("page_size는 1 이상이어야 합니다.")
+
+        await self.__ensure_login()
+
+        page = 1
+        fetched = 0
+        pending: Optional[asyncio.Task[tuple[list[CulturelandCashLog], Optional[int]]]] = asyncio.create_task(self.__get_cash_logs_page(days, page_size, page))
+
+        try:
+            while pending:
+                cultureland_cash_logs, total = await pending
+                pending = None
+                fetched += len(cultureland_cash_logs)
 
+                # 마지막 페이지가 아니라면 다음 페이지를 미리 요청
+                if len(cultureland_cash_logs) == page_size and (total is None or fetched < total):
+                    page += 1
+                    pending = asyncio.create_task(self.__get_cash_logs_page(days, page_size, page))
+
+                for cash_log in cultureland_cash_logs:
+                    yield cash_log
+        finally:
+            if pending and not pending.done():
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+
+    async def __get_cash_logs_page(self, days: int, page_size: int, page: int):
+        # 내역 한 페이지와 전체 내역 수(첫번째 내역의 cnt)를 반환
         cash_logs_request = await self.__client.post(
             "/tgl/cashList.json",
             data={
@@ -542,10 +903,15 @@ class Cultureland:
         cash_logs_json = cash_logs_request.json()
         cultureland_cash_logs: list[CulturelandCashLog] = []
         if len(cash_logs_json) == 0 or cash_logs_json[0].get("item").get("cnt") == "0":
-            return cultureland_cash_logs
+            return cultureland_cash_logs, 0
+
+        cnt = cash_logs_json[0].get("item").get("cnt")
+        total = int(cnt) if cnt else None
 
         for cash_log in cash_logs_json:
-            item = CashLogItem(**cash_log.get("item"))
+            item = dict(cash_log.get("item"))
+            item.pop("cnt", None)
+            item = CashLogItem(**item)
             cultureland_cash_logs.append(CulturelandCashLog(
                 title=item.Note,
                 merchant_code=item.memberCode,
@@ -556,27 +922,183 @@ class Cultureland:
                 timestamp=int(datetime.strptime(item.accDate + item.accTime, "%Y%m%d%H%M%S").timestamp())
             ))
 
-        return cultureland_cash_logs
+        return cultureland_cash_logs, total
+
+    async def __create_transkey(self):
+        """
+        트랜스키 세션을 생성합니다.
+        트랜스키 풀이 설정되어 있다면 미리 생성된 세션 정보를 사용합니다.
+        """
+
+        transkey_data = await self.__transkey_pool.get() if self.__transkey_pool else None
+        return mTranskey(
+            self.__client,
+            transkey_data,
+            key_info_cache=self.__key_info_cache,
+            layout_cache=self.__keypad_layout_cache,
+            executor=self.__executor,
+            matchers=self.__keypad_matchers
+        )
+
+    def __quota_account(self):
+        # 할당량은 로그인한 컬쳐랜드 ID 단위로 추적
+        if not self.__quota_tracker:
+            return None
+
+        try:
+            return self.__id
+        except AttributeError: # 로그인하지 않은 경우
+            return None
+
+    async def __ensure_login(self):
+        if not await self.is_login(verify=False):
+            raise Exception("로그인이 필요한 서비스 입니다.")
 
-    async def is_login(self) -> bool:
+    async def __check_login_response(self, response: httpx.Response):
+        location = response.headers.get("location", "")
+        if (
+            "logout" in response.request.url.path.lower() # 로그아웃
+            or (response.is_redirect and "/mmb/loginMain.do" in location) # 로그인 페이지로 리다이렉트
+            or response.is_error # 오류 응답
+        ):
+            self.__login_state.invalidate()
+
+    async def is_login(self, verify = True) -> bool:
         """
         현재 세션이 컬쳐랜드에 로그인되어 있는지 확인합니다.
 
+        파라미터:
+            * verify (bool): `login_ttl` 과 관계없이 서버에 확인할지 여부 (default: True)
+
         ```py
         await client.is_login() # True | False
+        await client.is_login(verify=False) # login_ttl 안에 확인된 적이 있다면 요청 생략
         ```
 
         반환값:
             로그인 여부 (bool)
         """
 
+        if not verify and self.__login_state.is_fresh():
+            return True
+
         is_login_request = await self.__client.post("/mmb/isLogin.json")
         is_login = is_login_request.json()
+
+        if is_login:
+            self.__login_state.mark_logged_in()
+        else:
+            self.__login_state.invalidate()
+
         return is_login
 
+    def export_session(self):
+        """
+        현재 로그인 세션(쿠키, 로그인 유지 쿠키, ID, 유저 정보)을 가져옵니다.
+
+        반환값:
+            세션 정보 (SessionData)
+        """
+
+        try:
+            return SessionData(
+                id=self.__id,
+                keep_login_info=self.__keep_login_info,
+                cookies=[
+                    {
+                        "name": cookie.name,
+                        "value": cookie.value,
+                        "domain": cookie.domain,
+                        "path": cookie.path
+                    }
+                    for cookie in self.__client.cookies.jar
+                ],
+                user_info=self.__user_info,
+                credential=self.__credential
+            )
+        except AttributeError: # 로그인하지 않은 경우
+            raise Exception("로그인이 필요한 서비스 입니다.")
+
+    def import_session(self, session: SessionData):
+        """
+        세션 정보의 쿠키와 로그인 정보를 현재 클라이언트에 적용합니다.
+        요청을 보내지 않으며, 첫 로그인 필요 요청에서 로그인 여부를 확인합니다.
+
+        파라미터:
+            * session (SessionData): 세션 정보
+        """
+
+        for cookie in session.cookies:
+            self.__client.cookies.set(cookie["name"], cookie["value"], cookie["domain"], cookie["path"])
+
+        self.__id = session.id
+        self.__password = None
+        self.__keep_login_info = session.keep_login_info
+        self.__credential = session.credential
+        if session.user_info:
+            self.__user_info = session.user_info
+
+    def save_session(self):
+        """
+        현재 로그인 세션(쿠키, 로그인 유지 쿠키, ID, 유저 정보)을 세션 저장소에 저장합니다.
+        `login` 성공 시 자동으로 호출됩니다.
+
+        반환값:
+            저장된 세션 정보 (SessionData)
+        """
+
+        if not self.__session_store:
+            raise Exception("세션 저장소가 설정되지 않았습니다.")
+
+        session = self.export_session()
+        self.__session_store.save(self.__id, session)
+        return session
+
+    async def resume(self, id: str, verify = False):
+        """
+        세션 저장소에 저장된 세션으로 로그인 없이 세션을 재개합니다.
+        `verify` 가 꺼져 있다면 요청을 보내지 않고, 첫 로그인 필요 요청에서 로그인 여부를 확인합니다.
+
+        파라미터:
+            * id (str): 컬쳐랜드 ID
+            * verify (bool): 재개 직후 로그인 여부를 확인할지 여부 (default: False)
+
+        ```py
+        if not await client.resume("test1234"):
+            await client.login("test1234", "test1234!")
+        ```
+
+        반환값:
+            세션 재개 여부 (bool, 저장된 세션이 없거나 만료되었다면 False)
+        """
+
+        if not self.__session_store:
+            raise Exception("세션 저장소가 설정되지 않았습니다.")
+
+        session = self.__session_store.load(id)
+        if session is None:
+            return False
+
+        return await self.__resume_session(id, session, verify)
+
+    async def __resume_session(self, key: str, session: SessionData, verify: bool):
+        self.import_session(session)
+
+        if verify and not await self.is_login():
+            self.__session_store.delete(key)
+            return False
+
+        return True
+
+    @staticmethod
+    def __keep_login_session_key(keep_login_info: str):
+        # 로그인 유지 쿠키로는 ID를 알 수 없으므로 쿠키의 해시로 세션을 찾음
+        return "keep_login:" + hashlib.sha256(parse.unquote_plus(keep_login_info).encode()).hexdigest()
+
     async def login(self, id: str, password: Optional[str] = None):
         """
         ID와 비밀번호 또는 로그인 유지 쿠키로 컬쳐랜드에 로그인합니다.
+        `login_coordinator` 가 설정되어 있다면 같은 계정, 같은 비밀번호의 동시 로그인은 한 번만 수행하고 결과를 공유합니다.
 
         파라미터:
             * id (str): 컬쳐랜드 ID (비밀번호 필요) / 로그인 유지 쿠키 (비밀번호 불필요)
@@ -592,6 +1114,54 @@ class Cultureland:
             * keep_login_info (str): 로그인 유지 쿠키
         """
 
+        # 같은 계정의 동시 로그인은 한 번만 수행
+        if self.__login_coordinator:
+            return await self.__login_coordinator.run(
+                self,
+                id,
+                lambda: self.__coordinated_login(id, password),
+                lambda started_at: self.__resume_login(id, password, started_at),
+                lambda session: self.__adopt_session(session, password),
+                password
+            )
+
+        return await self.__login(id, password)
+
+    async def __coordinated_login(self, id: str, password: Optional[str]):
+        result = await self.__login(id, password)
+        return result, self.export_session()
+
+    def __adopt_session(self, session: SessionData, password: Optional[str]):
+        # 같은 프로세스의 다른 클라이언트가 같은 비밀번호로 방금 로그인한 세션이므로 확인 요청 생략
+        self.import_session(session)
+        self.__password = password
+        self.__login_state.mark_logged_in()
+
+    async def __resume_login(self, id: str, password: Optional[str], started_at: float):
+        # 로그인을 기다리는 동안 다른 프로세스가 저장한 세션이 있다면 재개
+        if not self.__session_store:
+            return None
+
+        is_idp_login = isinstance(password, str)
+        key = id if is_idp_login else Cultureland.__keep_login_session_key(id)
+        session = self.__session_store.load(key)
+        if session is None or session.saved_at < started_at:
+            return None
+
+        # 다른 비밀번호로 로그인한 세션은 재개하지 않음 (로그인 유지 쿠키는 키 자체가 자격 증명)
+        if is_idp_login and not await asyncio.to_thread(verify_credential, password, session.credential):
+            return None
+
+        if not await self.__resume_session(key, session, verify=True):
+            return None
+
+        self.__password = password if is_idp_login else None
+        return CulturelandLogin(
+            user_id=self.__id,
+            keep_login_info=self.__keep_login_info
+        ), session
+
+    async def __login(self, id: str, password: Optional[str]):
         is_idp_login = isinstance(password, str)
         keep_login_info = None if is_idp_login else parse.unquote_plus(id)
         _id = id if is_idp_login else None
@@ -621,12 +1191,17 @@ class Cultureland:
                 raise Exception("입력하신 로그인 유지 정보는 만료된 정보입니다.")
             _id = user_id_match[1]
 
-        transkey = mTranskey(self.__client)
+        transkey = await self.__create_transkey()
         servlet_data = await transkey.get_servlet_data()
 
         keypad = transkey.create_keypad(servlet_data, "qwerty", "passwd", "passwd")
-        keypad_layout = await keypad.get_keypad_layout()
-        encrypted_password, encrypted_hmac = keypad.encrypt_password(password if is_idp_login else "", keypad_layout)
+        if is_idp_login:
+            keypad_layout = await keypad.get_keypad_layout()
+        else:
+            # 로그인 유지 쿠키로 로그인 시 빈 문자열만 암호화하므로 키패드 사진은 필요 없음
+            await keypad.get_key_index()
+            keypad_layout = []
+        encrypted_password, encrypted_hmac = await keypad.encrypt_password_async(password if is_idp_login else "", keypad_layout)
 
         payload = {
             "keepLoginInfo": "" if is_idp_login else keep_login_info,
@@ -683,12 +1258,24 @@ class Cultureland:
         if not keep_login_info:
             raise Exception("잘못된 응답이 반환되었습니다.")
 
-        self.__user_info = await self.get_user_info()
+        # 로그인 직후이므로 로그인 여부 확인 생략
+        self.__login_state.mark_logged_in()
+        self.__user_info = await self.__fetch_user_info()
 
         # 변수 저장
         self.__id = _id
         self.__password = password if is_idp_login else None
         self.__keep_login_info = keep_login_info
+        self.__credential = None
+
+        if self.__session_store:
+            # 다른 프로세스가 같은 비밀번호로 로그인할 때만 이 세션을 재개하도록 비밀번호 검증값도 저장
+            if is_idp_login:
+                self.__credential = await asyncio.to_thread(create_credential, password)
+                self.save_session()
+            else:
+                # 로그인 유지 쿠키로는 ID를 알 수 없으므로 쿠키의 해시로 저장
+                self.__session_store.save(Cultureland.__keep_login_session_key(id), self.export_session())
 
         return CulturelandLogin(
             user_id=_id,
@@ -0,0 +1,174 @@
+import asyncio
+import contextlib
+import hashlib
+import hmac
+import os
+import secrets
+import time
+
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
+from ._types import CulturelandLogin
+
+if TYPE_CHECKING:
+    from .session_store import SessionData
+
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+    import msvcrt
+
+"""
+다른 프로세스가 가진 파일 잠금이 풀렸는지 다시 확인하는 간격 (초)
+"""
+LOCK_POLL_INTERVAL = 0.05
+
+def lock_file(fd: int):
+    """
+    파일에 배타적 잠금을 시도합니다. 다른 프로세스가 잠금을 가지고 있다면 기다리지 않습니다.
+
+    파라미터:
+        * fd (int): 잠금 파일의 파일 디스크립터
+
+    반환값:
+        잠금 성공 여부 (bool)
+    """
+
+    if fcntl:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    os.lseek(fd, 0, os.SEEK_SET)
+    try:
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+def unlock_file(fd: int):
+    """
+    파일 잠금을 해제합니다.
+
+    파라미터:
+        * fd (int): 잠금 파일의 파일 디스크립터
+    """
+
+    if fcntl:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        return
+
+    os.lseek(fd, 0, os.SEEK_SET)
+    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+LoginResult = tuple[CulturelandLogin, "SessionData"]
+
+class LoginCoordinator:
+    """
+    같은 계정의 동시 로그인을 하나로 합칩니다.
+    한 프로세스 안에서는 계정과 비밀번호가 모두 같은 로그인 하나를 공유하고, 다른 클라이언트는 그 세션을 그대로 가져옵니다.
+    비밀번호가 다른 호출은 진행 중인 로그인의 결과를 받지 않고 따로 로그인합니다.
+    여러 프로세스 사이에서는 파일 잠금으로 로그인을 직렬화하고, 잠금을 기다리는 동안 다른 프로세스가 세션 저장소에 저장한 세션으로 재개합니다.
+    따라서 `lock_directory` 를 사용하려면 `Cultureland` 에 `session_store` 가 필요합니다.
+    """
+
+    def __init__(self, lock_directory: Optional[str] = None):
+        """
+        파라미터:
+            * lock_directory (str | None): 프로세스 간 잠금 파일을 둘 디렉토리 (default: 프로세스 안에서만 합침)
+        """
+
+        self.__lock_directory = lock_directory
+        self.__in_flight: dict[str, tuple[object, asyncio.Task[LoginResult]]] = {}
+        # 진행 중인 로그인의 비밀번호를 비교하기 위한 프로세스별 비밀 키 (비밀번호를 그대로 들고 있지 않음)
+        self.__secret = secrets.token_bytes(32)
+
+        if lock_directory:
+            os.makedirs(lock_directory, exist_ok=True)
+
+    @property
+    def lock_directory(self):
+        """
+        프로세스 간 잠금 파일을 둘 디렉토리
+        """
+        return self.__lock_directory
+
+    async def run(self, client: object, account: str, login: Callable[[], Awaitable[LoginResult]], resume: Optional[Callable[[float], Awaitable[Optional[LoginResult]]]] = None, adopt: Optional[Callable[["SessionData"], None]] = None, credential: Optional[str] = None):
+        """
+        계정의 로그인을 단일 실행합니다.
+
+        파라미터:
+            * client (object): 로그인하는 클라이언트
+            * account (str): 계정 ID 또는 로그인 유지 쿠키
+            * login (Callable[[], Awaitable[tuple[CulturelandLogin, SessionData]]]): 실제 로그인을 수행하는 함수
+            * resume (Callable[[float], Awaitable[tuple[CulturelandLogin, SessionData] | None]] | None): 주어진 시각 이후 다른 프로세스가 저장한 세션으로 재개하는 함수
+            * adopt (Callable[[SessionData], None] | None): 다른 클라이언트가 로그인한 세션을 가져오는 함수
+            * credential (str | None): 비밀번호, 같은 비밀번호의 로그인끼리만 합침 (default: 로그인 유지 쿠키 등 계정 자체가 자격 증명인 경우)
+
+        반환값:
+            로그인 결과 (CulturelandLogin)
+        """
+
+        account_key = hashlib.sha256(account.encode()).hexdigest()
+
+        # 비밀번호가 다른 호출이 진행 중인 로그인의 결과를 받지 않도록 비밀번호의 HMAC도 키에 포함
+        flight_key = account_key
+        if credential is not None:
+            flight_key += ":" + hmac.new(self.__secret, credential.encode(), hashlib.sha256).hexdigest()
+
+        entry = self.__in_flight.get(flight_key)
+        if entry is None:
+            task = asyncio.ensure_future(self.__run(account_key, login, resume, time.time()))
+            entry = (client, task)
+            self.__in_flight[flight_key] = entry
+
+            def done(_):
+                if self.__in_flight.get(flight_key) is entry:
+                    del self.__in_flight[flight_key]
+
+            task.add_done_callback(done)
+
+        owner, task = entry
+
+        # 기다리던 호출이 취소되어도 다른 호출의 로그인은 계속되도록 shield
+        result, session = await asyncio.shield(task)
+
+        # 다른 클라이언트가 로그인했다면 그 세션을 가져옴
+        if owner is not client:
+            if adopt is None:
+                raise Exception("다른 클라이언트의 로그인 세션을 가져올 수 없습니다.")
+
+            adopt(session)
+
+        return result
+
+    async def __run(self, account_key: str, login: Callable[[], Awaitable[LoginResult]], resume: Optional[Callable[[float], Awaitable[Optional[LoginResult]]]], started_at: float):
+        async with self.__file_lock(account_key):
+            # 기다리는 동안 다른 프로세스가 로그인했다면 그 세션을 재사용
+            if resume:
+                result = await resume(started_at)
+                if result:
+                    return result
+
+            return await login()
+
+    @contextlib.asynccontextmanager
+    async def __file_lock(self, account_key: str):
+        if not self.__lock_directory:
+            yield
+            return
+
+        fd = os.open(os.path.join(self.__lock_directory, account_key + ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            # 스레드에서 막힌 채로 기다리면 취소 후 닫힌 fd 번호가 재사용될 수 있으므로, 막히지 않는 잠금을 주기적으로 시도
+            while not lock_file(fd):
+                await asyncio.sleep(LOCK_POLL_INTERVAL)
+
+            try:
+                yield
+            finally:
+                unlock_file(fd)
+        finally:
+            os.close(fd)
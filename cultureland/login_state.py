@@ -0,0 +1,56 @@
+import time
+
+from typing import Optional
+
+class LoginState:
+    """
+    로그인 여부 확인 결과를 일정 시간 동안 신뢰하는 로그인 상태 추적기입니다.
+    유효 시간 안에는 `/mmb/isLogin.json` 요청을 생략합니다.
+    """
+
+    def __init__(self, ttl: float = 0):
+        """
+        파라미터:
+            * ttl (float): 로그인 확인 결과를 신뢰할 시간 (초, 0이면 매번 확인, default: 0)
+        """
+
+        if ttl < 0:
+            raise ValueError("ttl은 0 이상이어야 합니다.")
+
+        self.__ttl = ttl
+        self.__verified_at: Optional[float] = None
+
+    @property
+    def ttl(self):
+        """
+        로그인 확인 결과를 신뢰할 시간 (초)
+        """
+        return self.__ttl
+
+    @property
+    def verified_at(self):
+        """
+        마지막으로 로그인이 확인된 시각 (`time.monotonic()`)
+        """
+        return self.__verified_at
+
+    def is_fresh(self):
+        """
+        마지막 로그인 확인 결과를 아직 신뢰할 수 있는지 확인합니다.
+        """
+
+        return self.__verified_at is not None and time.monotonic() - self.__verified_at < self.__ttl
+
+    def mark_logged_in(self):
+        """
+        로그인이 확인되었음을 기록합니다.
+        """
+
+        self.__verified_at = time.monotonic()
+
+    def invalidate(self):
+        """
+        로그인 확인 결과를 무효화합니다.
+        """
+
+        self.__verified_at = None
@@ -1,5 +1,8 @@
-from .rsa import CULTURELAND_PUBLICKEY, rsa_encrypt, build_certificate
-from .keypad import Keypad
+from .rsa import CULTURELAND_PUBLICKEY, rsa_encrypt, build_certificate, get_cipher
+from .keypad import Keypad, CompiledKeypad, KeypadLayoutCache, KEYPAD_LAYOUT_CACHE, recognize_keypad_layout
 from .seed import Seed
-from .transkey import mTranskey
+from .matcher import KeypadTemplateMatcher
+from .key_info import KeyInfoCache, KEY_INFO_CACHE, parse_key_info
+from .transkey import mTranskey, create_transkey_data
+from .pool import TranskeyPool
 from ._types import *
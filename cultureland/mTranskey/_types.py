@@ -1,10 +1,15 @@
+from typing import Optional
 from .rsa import CULTURELAND_PUBLICKEY, rsa_encrypt
+from .seed import Seed
 
 class TranskeyData:
     def __init__(self, transkey_uuid: str, generated_session_key: str, allocation_index: int):
         self.__transkey_uuid = transkey_uuid
         self.__generated_session_key = generated_session_key
         self.__allocation_index = allocation_index
+        self.__session_key: Optional[tuple[int, ...]] = None
+        self.__round_key: Optional[tuple[int, ...]] = None
+        self.__encrypted_session_key: Optional[str] = None
 
     @property
     def transkey_uuid(self):
@@ -27,20 +32,33 @@ class TranskeyData:
         """
         return self.__allocation_index
 
+    @property
+    def round_key(self):
+        """
+        `sessionKey` 로 생성한 SEED 라운드 키 (세션당 한 번만 생성)
+        """
+        if self.__round_key is None:
+            self.__round_key = Seed.SeedRoundKeyFast(self.get_session_key())
+        return self.__round_key
+
     def get_session_key(self):
         """
         `sessionKey`
         """
-        return [int(self.__generated_session_key[i], 16) for i in range(16)]
+        if self.__session_key is None:
+            self.__session_key = tuple(int(self.__generated_session_key[i], 16) for i in range(16))
+        return list(self.__session_key)
 
     def get_encrypted_session_key(self):
         """
-        `encSessionKey`
+        `encSessionKey` (세션당 한 번만 암호화)
         """
-        return rsa_encrypt(self.__generated_session_key, CULTURELAND_PUBLICKEY)
+        if self.__encrypted_session_key is None:
+            self.__encrypted_session_key = rsa_encrypt(self.__generated_session_key, CULTURELAND_PUBLICKEY)
+        return self.__encrypted_session_key
 
 class ServletData:
-    def __init__(self, request_token: str, init_time: str, qwerty_info: list[int], number_info: list[int]):
+    def __init__(self, request_token: str, init_time: str, qwerty_info: tuple[tuple[int, int], ...], number_info: tuple[tuple[int, int], ...]):
         self.__request_token = request_token
         self.__init_time = init_time
         self.__qwerty_info = qwerty_info
@@ -0,0 +1,83 @@
+import re
+
+from typing import Optional
+
+KeyInfo = tuple[tuple[int, int], ...]
+
+def parse_key_info(text: str):
+    """
+    `getKeyInfo` 응답에서 키 좌표를 파싱합니다.
+
+    파라미터:
+        * text (str): `getKeyInfo` 응답
+
+    반환값:
+        (qwerty 키패드 키 좌표, 숫자 키패드 키 좌표)
+    """
+
+    [qwerty, number] = text.split("var numberMobile = new Array();")
+    points_regex = re.compile("key\\.addPoint\\((\\d+), (\\d+)\\);")
+
+    # keyInfo.qwerty
+    qwerty_info: list[tuple[int, int]] = []
+    qwerty_points = qwerty.split("qwertyMobile.push(key);")
+    qwerty_points.pop()
+
+    for p in qwerty_points:
+        key = points_regex.search(p)
+        qwerty_info.append((int(key[1]), int(key[2]))) # 키 좌표
+
+    # keyInfo.number
+    number_info: list[tuple[int, int]] = []
+    number_points = number.split("numberMobile.push(key);")
+    number_points.pop()
+
+    for p in number_points:
+        key = points_regex.search(p)
+        number_info.append((int(key[1]), int(key[2]))) # 키 좌표
+
+    return (tuple(qwerty_info), tuple(number_info))
+
+class KeyInfoCache:
+    """
+    세션마다 동일한 키 좌표(`getKeyInfo`)를 프로세스 단위로 캐싱합니다.
+
+    `getKeyInfo` 요청은 서버에 세션 키를 전달하므로 항상 보내되, 응답이 직전 응답과 같다면 파싱을 건너뛰고 같은 튜플을 공유합니다.
+    """
+
+    def __init__(self):
+        self.__text: Optional[str] = None
+        self.__key_info: tuple[KeyInfo, KeyInfo] = ((), ())
+
+    def parse(self, text: str):
+        """
+        `getKeyInfo` 응답의 키 좌표를 반환합니다.
+        응답이 직전 응답과 같다면 파싱하지 않고 캐시를 반환하며, 다르다면 파싱 후 캐시를 갱신합니다.
+
+        파라미터:
+            * text (str): `getKeyInfo` 응답
+
+        반환값:
+            (qwerty 키패드 키 좌표, 숫자 키패드 키 좌표)
+        """
+
+        # 문자열 비교는 정규식 파싱이나 해시 계산보다 훨씬 저렴함
+        if text == self.__text:
+            return self.__key_info
+
+        self.__key_info = parse_key_info(text)
+        self.__text = text
+        return self.__key_info
+
+    def clear(self):
+        """
+        캐시를 비웁니다.
+        """
+
+        self.__text = None
+        self.__key_info = ((), ())
+
+"""
+프로세스 전역 키 좌표 캐시
+"""
+KEY_INFO_CACHE = KeyInfoCache()
@@ -1,13 +1,19 @@
+import asyncio
 import hashlib
 import hmac
 import httpx
 
-from typing import Literal
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Literal, Optional
 from io import BytesIO
-from PIL import Image
+from PIL import BmpImagePlugin, Image
 from .seed import Seed
 from ._types import TranskeyData, ServletData
 
+if TYPE_CHECKING:
+    from .matcher import KeypadTemplateMatcher
+
 SPECIAL_CHARS = ["`", "~", "!", "@", "#", "$", "%", "^", "&", "*", "(", ")", "-", "_", "=", "+", "[", "{", "]", "}", "\\", "|", ";", ":", "/", "?", ",", "<", ".", ">", "'", "\"", "+", "-", "*", "/"]
 LOWER_CHARS = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "0", "q", "w", "e", "r", "t", "y", "u", "i", "o", "p", "a", "s", "d", "f", "g", "h", "j", "k", "l", "z", "x", "c", "v", "b", "n", "m"]
 NUMBER_KEY_HASHES = [
@@ -24,9 +30,305 @@ NUMBER_KEY_HASHES = [
     "9c36f62dca0fe9b2174f5129f2a44283" # empty
 ]
 BLANK_KEY_HASH = "be2e2eb24d35ec52b7205dc1b8d78b08" # qwerty 키패드 빈칸
+NUMBER_KEY_INDEX = { key_hash: i for i, key_hash in enumerate(NUMBER_KEY_HASHES) } # 해시 -> 숫자 키
+
+"""
+키패드 칸의 중앙만 남기는 자르기 영역 (시작점 x, 시작점 y, 끝점 x, 끝점 y)
+qwerty 키패드의 shift, backspace 키는 제외됩니다.
+"""
+KEY_BOXES: dict[str, tuple[tuple[int, int, int, int], ...]] = {
+    "qwerty": tuple(
+        (x * 54 + 22, y * 80 + 30, x * 54 + 37, y * 80 + 75)
+        for y in range(4) for x in range(11)
+        if not ((x == 0 and y == 3) or ((x == 9 or x == 10) and y == 3)) # shift or backspace
+    ),
+    "number": tuple(
+        (x * 160 + 70, y * 102 + 45, x * 160 + 90, y * 102 + 70)
+        for y in range(3) for x in range(4)
+    )
+}
+
+def get_key_hashes(key_image: Image.Image, keyboard_type: Literal["qwerty", "number"]):
+    """
+    키패드 사진의 각 칸을 BMP로 저장했을 때의 MD5 해시를 계산합니다.
+    칸마다 잘라낸 사진을 BMP로 인코딩하지 않고, BMP와 같은 형식(아래 행부터, 4바이트 패딩)으로 꺼낸 픽셀 데이터만 해싱합니다.
+    BMP 인코딩은 헤더를 얻기 위해 첫 칸에서 한 번만 수행합니다. (`tests/bench_keypad.py` 참고)
+
+    파라미터:
+        * key_image (Image.Image): 키패드 사진
+        * keyboard_type (str): 키패드 종류 `qwerty` | `number`
+
+    반환값:
+        칸별 해시 (list[str])
+    """
+
+    boxes = KEY_BOXES[keyboard_type]
+
+    # 모든 칸의 크기가 같으므로 BMP 헤더(+팔레트)는 첫 칸을 한 번만 저장하여 재사용
+    sample_bytes = BytesIO()
+    key_image.crop(boxes[0]).save(sample_bytes, "BMP")
+    sample = sample_bytes.getvalue()
+    header_hash = hashlib.md5(sample[:int.from_bytes(sample[10:14], "little")])
+
+    rawmode, bits, _ = BmpImagePlugin.SAVE[key_image.mode]
+    stride = (((boxes[0][2] - boxes[0][0]) * bits + 7) // 8 + 3) & ~3
+
+    key_hashes: list[str] = []
+    for box in boxes:
+        key_hash = header_hash.copy()
+        key_hash.update(key_image.crop(box).tobytes("raw", (rawmode, stride, -1)))
+        key_hashes.append(key_hash.hexdigest())
+
+    return key_hashes
+
+def recognize_keypad_layout(content: bytes, keyboard_type: Literal["qwerty", "number"]):
+    """
+    키패드 사진을 분석하여 키패드 배열을 가져옵니다.
+
+    파라미터:
+        * content (bytes): 키패드 사진 (`getKey` 응답)
+        * keyboard_type (str): 키패드 종류 `qwerty` | `number`
+
+    반환값:
+        키패드 배열
+    """
+
+    key_image = Image.open(BytesIO(content))
+
+    layout: list[int] = []
+    i = 0
+    for key_hash in get_key_hashes(key_image, keyboard_type):
+        if keyboard_type == "qwerty":
+            if key_hash == BLANK_KEY_HASH:
+                layout.append(-1) # 빈 칸
+            else:
+                layout.append(i)
+                i += 1
+        else:
+            key = NUMBER_KEY_INDEX.get(key_hash) # 사진의 해시를 이용해 어떤 키인지 찾아냄
+            if key is None:
+                raise ValueError("키패드 사진에서 알 수 없는 키가 발견되었습니다.")
+            layout.append(key)
+
+    return layout
+
+class KeypadLayoutCache:
+    """
+    키패드 사진의 해시로 키패드 배열을 캐싱하는 LRU 캐시입니다.
+    같은 키패드 사진이 다시 내려오면 사진 디코딩과 분석을 건너뜁니다.
+    """
+
+    def __init__(self, maxsize = 256):
+        """
+        파라미터:
+            * maxsize (int): 최대 캐시 항목 수 (0이면 캐싱하지 않음, default: 256)
+        """
+
+        self.__maxsize = maxsize
+        self.__layouts: OrderedDict[tuple[str, str], tuple[int, ...]] = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    @property
+    def maxsize(self):
+        """
+        최대 캐시 항목 수
+        """
+        return self.__maxsize
+
+    @property
+    def size(self):
+        """
+        현재 캐시 항목 수
+        """
+        return len(self.__layouts)
+
+    @property
+    def hits(self):
+        """
+        캐시 적중 횟수
+        """
+        return self.__hits
+
+    @property
+    def misses(self):
+        """
+        캐시 부적중 횟수
+        """
+        return self.__misses
+
+    @property
+    def evictions(self):
+        """
+        용량 초과로 제거된 항목 수
+        """
+        return self.__evictions
+
+    @staticmethod
+    def digest(content: bytes):
+        """
+        키패드 사진의 캐시 키로 사용할 해시를 계산합니다.
+        """
+        return hashlib.md5(content).hexdigest()
+
+    def get(self, keyboard_type: Literal["qwerty", "number"], digest: str):
+        """
+        캐시된 키패드 배열을 가져옵니다.
+
+        반환값:
+            키패드 배열 | None
+        """
+
+        layout = self.__layouts.get((keyboard_type, digest))
+        if layout is None:
+            self.__misses += 1
+            return None
+
+        self.__layouts.move_to_end((keyboard_type, digest))
+        self.__hits += 1
+        return list(layout)
+
+    def set(self, keyboard_type: Literal["qwerty", "number"], digest: str, layout: list[int]):
+        """
+        키패드 배열을 캐시에 저장합니다.
+        """
+
+        if self.__maxsize <= 0:
+            return
+
+        self.__layouts[(keyboard_type, digest)] = tuple(layout)
+        self.__layouts.move_to_end((keyboard_type, digest))
+        self.__evict()
+
+    def resize(self, maxsize: int):
+        """
+        최대 캐시 항목 수를 변경합니다.
+        """
+
+        self.__maxsize = maxsize
+        self.__evict()
+
+    def clear(self):
+        """
+        캐시와 통계를 초기화합니다.
+        """
+
+        self.__layouts.clear()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def __evict(self):
+        while len(self.__layouts) > max(self.__maxsize, 0):
+            self.__layouts.popitem(last=False)
+            self.__evictions += 1
+
+"""
+프로세스 전역 키패드 배열 캐시
+"""
+KEYPAD_LAYOUT_CACHE = KeypadLayoutCache()
+
+class CompiledKeypad:
+    """
+    키패드 배열에 따라 입력 가능한 모든 키의 암호문을 미리 계산해둔 키패드입니다.
+    하나의 키패드로 여러 입력을 암호화하거나, 사전 계산을 미리 해둘 수 있을 때 유용합니다.
+    """
+
+    def __init__(self, transkey_data: TranskeyData, keyboard_type: Literal["qwerty", "number"], keyboard: tuple[tuple[int, int], ...], layout: list[int], precompute = True):
+        """
+        파라미터:
+            * transkey_data (TranskeyData): 트랜스키 세션 정보
+            * keyboard_type (str): 키패드 종류 `qwerty` | `number`
+            * keyboard (tuple[tuple[int, int], ...]): 키패드 키 좌표
+            * layout (list[int]): 키패드 배열
+            * precompute (bool): 모든 키의 암호문을 미리 계산할지 여부 (default: True)
+        """
+
+        self.__transkey_data = transkey_data
+        self.__keyboard_type = keyboard_type
+        self.__layout = tuple(layout)
+
+        # 키패드 배열의 역색인 (키 -> 키패드 위치)
+        positions: dict[int, int] = {}
+        for position, key in enumerate(self.__layout):
+            positions.setdefault(key, position)
+
+        # 입력 가능한 키 -> (키 번호, 좌표 접두사)
+        if keyboard_type == "qwerty":
+            keys: dict[str, tuple[int, str]] = {}
+            for i, val in enumerate(SPECIAL_CHARS):
+                keys.setdefault(val, (i, "s ")) # 특수문자
+            for i, val in enumerate(LOWER_CHARS):
+                keys[val] = (i, "u " if val == val.upper() else "l ") # 소문자 또는 숫자
+                keys[val.upper()] = (i, "u ") # 대문자
+        else:
+            keys = { str(i): (i, "") for i in range(10) } # 숫자
+
+        self.__geo_strings: dict[str, str] = {}
+        for val, (key, prefix) in keys.items():
+            position = positions.get(key)
+            if position is None or position >= len(keyboard):
+                continue # 키패드에 존재하지 않는 키
+
+            self.__geo_strings[val] = prefix + " ".join(map(str, keyboard[position]))
+
+        self.__encrypted_keys: dict[str, str] = {}
+        if precompute:
+            self.precompute()
+
+    @property
+    def layout(self):
+        """
+        키패드 배열
+        """
+        return self.__layout
+
+    def precompute(self):
+        """
+        입력 가능한 모든 키의 암호문을 계산합니다.
+        """
+
+        for val in self.__geo_strings:
+            if val not in self.__encrypted_keys:
+                self.__encrypt_key(val)
+
+    def __encrypt_key(self, val: str):
+        geo_string = self.__geo_strings.get(val)
+        if geo_string is None:
+            raise Exception("입력할 수 없는 키가 입력되었습니다.") # 키패드에 존재하지 않는 키
+
+        encrypted_key = "$" + Seed.SeedEnc(geo_string, roundKey=self.__transkey_data.round_key)
+        self.__encrypted_keys[val] = encrypted_key
+        return encrypted_key
+
+    def encrypt_password(self, pw: str):
+        """
+        비밀번호를 미리 계산된 암호문으로 암호화합니다.
+
+        파라미터:
+            * pw (str): 비밀번호
+
+        반환값:
+            (암호화된 비밀번호, 암호화된 비밀번호의 HMAC 해시값)
+        """
+
+        encrypted_keys = self.__encrypted_keys
+        encrypted = "".join([
+            encrypted_keys[val] if val in encrypted_keys else self.__encrypt_key(val)
+            for val in pw
+        ])
+
+        encrypted_hmac = hmac.new(
+            msg=encrypted.encode(),
+            key=self.__transkey_data.generated_session_key.encode(),
+            digestmod=hashlib.sha256
+        ).hexdigest()
+
+        return (encrypted, encrypted_hmac)
 
 class Keypad:
-    def __init__(self, transkey_data: TranskeyData, servlet_data: ServletData, client: httpx.AsyncClient, keyboard_type: Literal["qwerty", "number"], name: str, input_name: str, field_type: str):
+    def __init__(self, transkey_data: TranskeyData, servlet_data: ServletData, client: httpx.AsyncClient, keyboard_type: Literal["qwerty", "number"], name: str, input_name: str, field_type: str, layout_cache: Optional[KeypadLayoutCache] = None, executor: Optional[Executor] = None, matcher: Optional["KeypadTemplateMatcher"] = None):
         self.transkey_data = transkey_data
         self.servlet_data = servlet_data
         self.client = client
@@ -35,6 +337,39 @@ class Keypad:
         self.input_name = input_name
         self.field_type = field_type
         self.key_index = ""
+        self.layout_cache = layout_cache or KEYPAD_LAYOUT_CACHE
+        self.executor = executor # 사진 분석과 SEED 암호화를 실행할 executor (None이면 이벤트 루프에서 실행)
+        self.matcher = matcher # 해시 대신 사용할 템플릿 분류기
+        self.__compiled_keypad: Optional[CompiledKeypad] = None
+
+    def compile(self, layout: list[int], precompute = True):
+        """
+        키패드 배열로 입력 가능한 모든 키의 암호문을 가진 키패드를 생성합니다.
+        같은 배열로 다시 호출하면 이전에 생성한 키패드를 재사용합니다.
+
+        파라미터:
+            * layout (list[int]): 키패드 배열
+            * precompute (bool): 모든 키의 암호문을 미리 계산할지 여부 (default: True)
+
+        반환값:
+            CompiledKeypad
+        """
+
+        compiled_keypad = self.__compiled_keypad
+        if compiled_keypad is None or compiled_keypad.layout != tuple(layout):
+            compiled_keypad = CompiledKeypad(
+                self.transkey_data,
+                self.keyboard_type,
+                self.servlet_data.qwerty_info if self.keyboard_type == "qwerty" else self.servlet_data.number_info,
+                layout,
+                precompute=False
+            )
+            self.__compiled_keypad = compiled_keypad
+
+        if precompute:
+            compiled_keypad.precompute()
+
+        return compiled_keypad
 
     def encrypt_password(self, pw: str, layout: list[int]):
         """
@@ -48,52 +383,34 @@ class Keypad:
             (암호화된 비밀번호, 암호화된 비밀번호의 HMAC 해시값)
         """
 
-        encrypted = ""
+        # 입력에 필요한 키만 암호화 (미리 계산된 키는 재사용)
+        return self.compile(layout, precompute=False).encrypt_password(pw)
 
-        for val in pw:
-            if self.keyboard_type == "qwerty":
-                keyboard = self.servlet_data.qwerty_info
-            else:
-                keyboard = self.servlet_data.number_info
+    async def encrypt_password_async(self, pw: str, layout: list[int]):
+        """
+        `encrypt_password` 와 같지만, executor가 설정되어 있다면 SEED 암호화를 executor에서 실행합니다.
 
-            keyboard_index = layout.index(
-                SPECIAL_CHARS.index(val) if val in SPECIAL_CHARS # val이 특수문자라면 특수문자 키패드에서 val의 위치
-                else LOWER_CHARS.index(val.lower()) if self.keyboard_type == "qwerty" # qwerty 키패드라면 qwerty 키패드에서 val의 위치
-                else int(val) # 숫자 키패드에서 val의 위치
-            )
+        파라미터:
+            * pw (str): 비밀번호
+            * layout (list[int]): 키패드 배열
 
-            try:
-                geo = keyboard[keyboard_index]
-            except (IndexError, ValueError):
-                raise Exception("입력할 수 없는 키가 입력되었습니다.") # 키패드에 존재하지 않는 키
+        반환값:
+            (암호화된 비밀번호, 암호화된 비밀번호의 HMAC 해시값)
+        """
 
-            geo = list(map(str, geo))
-            if self.keyboard_type == "qwerty": # qwerty 키패드라면
-                if val in SPECIAL_CHARS: # 특수문자라면
-                    geo_string = "s " + " ".join(geo)
-                elif val == val.upper(): # 대문자라면
-                    geo_string = "u " + " ".join(geo)
-                else: # 소문자 또는 숫자라면
-                    geo_string = "l " + " ".join(geo)
-            else: # 숫자 키패드라면
-                geo_string = " ".join(geo)
+        compiled_keypad = self.compile(layout, precompute=False)
+        if self.executor is None or len(pw) == 0:
+            return compiled_keypad.encrypt_password(pw)
 
-            encrypted += "$" + Seed.SeedEnc(geo_string, self.transkey_data.get_session_key())
+        return await asyncio.get_running_loop().run_in_executor(self.executor, compiled_keypad.encrypt_password, pw)
 
-        encrypted_hmac = hmac.new(
-            msg=encrypted.encode(),
-            key=self.transkey_data.generated_session_key.encode(),
-            digestmod=hashlib.sha256
-        ).hexdigest()
-
-        return (encrypted, encrypted_hmac)
-
-    async def get_keypad_layout(self):
+    async def get_key_index(self):
         """
-        키패드 사진을 분석하여 키패드 배열을 가져옵니다.
+        키패드의 `keyIndex` 를 가져옵니다.
+        빈 문자열만 암호화하는 경우처럼 키패드 배열이 필요 없다면 `get_keypad_layout` 대신 사용합니다.
 
         반환값:
-            키패드 배열
+            `keyIndex`
         """
 
         key_index_request = await self.client.post(
@@ -116,6 +433,17 @@ class Keypad:
             }
         )
         self.key_index = key_index_request.text
+        return self.key_index
+
+    async def get_keypad_layout(self):
+        """
+        키패드 사진을 분석하여 키패드 배열을 가져옵니다.
+
+        반환값:
+            키패드 배열
+        """
+
+        await self.get_key_index()
 
         key_image_response = await self.client.get(
             "/transkeyServlet",
@@ -136,42 +464,19 @@ class Keypad:
             }
         )
 
-        key_image = Image.open(BytesIO(key_image_response.content))
-        keys: list[Image.Image] = []
-
-        for y in range(4 if self.keyboard_type == "qwerty" else 3): # 키패드 세로 칸만큼 반복
-            for x in range(11 if self.keyboard_type == "qwerty" else 4): # 키패드 가로 칸만큼 반복
-                if self.keyboard_type == "qwerty": # qwerty 키패드라면
-                    if (x == 0 and y == 3) or ((x == 9 or x == 10) and y == 3): # shift or backspace
-                        continue # 불필요한 키는 건너뛰기
-
-                img = key_image.crop([
-                    x * 54 + 22 if self.keyboard_type == "qwerty" else x * 160 + 70, # 시작점 x 좌표
-                    y * 80 + 30 if self.keyboard_type == "qwerty" else y * 102 + 45, # 시작점 y 좌표
-                    x * 54 + 37 if self.keyboard_type == "qwerty" else x * 160 + 90, # 끝점 x 좌표
-                    y * 80 + 75 if self.keyboard_type == "qwerty" else y * 102 + 70 # 끝점 y 좌표
-                ]) # 키패드 칸의 중앙만 남게 사진을 잘라냄
-
-                keys.append(img)
-
-        layout: list[int] = []
-        i = 0
-        for key in keys:
-            key_img_bytes = BytesIO()
-            key.save(key_img_bytes, "BMP")
-            key_payload = key_img_bytes.getvalue()
-
-            enc = hashlib.md5()
-            enc.update(key_payload)
-            key_hash = enc.hexdigest() # 키 사진의 해시
-
-            if self.keyboard_type == "qwerty":
-                if key_hash == BLANK_KEY_HASH:
-                    layout.append(-1) # 빈 칸
-                else:
-                    layout.append(i)
-                    i += 1
+        # 같은 키패드 사진이라면 디코딩하지 않고 캐시된 배열 사용
+        digest = KeypadLayoutCache.digest(key_image_response.content)
+        layout = self.layout_cache.get(self.keyboard_type, digest)
+        if layout is None:
+            if self.matcher is not None: # 템플릿 분류기
+                recognize, args = self.matcher.recognize, (key_image_response.content,)
+            else: # 칸별 해시
+                recognize, args = recognize_keypad_layout, (key_image_response.content, self.keyboard_type)
+
+            if self.executor is None:
+                layout = recognize(*args)
             else:
-                layout.append(NUMBER_KEY_HASHES.index(key_hash)) # 사진의 해시를 이용해 어떤 키인지 찾아냄
+                layout = await asyncio.get_running_loop().run_in_executor(self.executor, recognize, *args)
+            self.layout_cache.set(self.keyboard_type, digest, layout)
 
         return layout
@@ -0,0 +1,242 @@
+from io import BytesIO
+from typing import Literal, Optional
+from PIL import Image
+from .keypad import KEY_BOXES, recognize_keypad_layout
+
+def import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("KeypadTemplateMatcher를 사용하려면 numpy가 필요합니다. (pip install numpy)")
+
+    return numpy
+
+class KeypadTemplateMatcher:
+    """
+    키패드 사진의 칸을 템플릿과 비교하여 키를 분류하는 NumPy 기반 분류기입니다.
+    해시가 정확히 일치해야 하는 기본 인식과 달리, 렌더링이 조금 바뀌어도 가장 가까운 키로 분류합니다.
+    `numpy` 가 설치되어 있어야 합니다. (`pip install cultureland.py[numpy]`)
+
+    ```py
+    # 기존 해시 인식으로 분류 가능한 키패드 사진들로 템플릿 생성
+    matcher = KeypadTemplateMatcher.fit([image1, image2], "number")
+    matcher.save("number_templates.npz")
+
+    matcher = KeypadTemplateMatcher.load("number_templates.npz")
+    layout, confidence = matcher.classify(image)
+    ```
+    """
+
+    def __init__(self, keyboard_type: Literal["qwerty", "number"], templates, labels: list[int], min_confidence = 0.2):
+        """
+        파라미터:
+            * keyboard_type (str): 키패드 종류 `qwerty` | `number`
+            * templates (numpy.ndarray): 템플릿 (키 수, 높이, 너비, 3)
+            * labels (list[int]): 템플릿별 키 (`number` 0~9, 10 = 빈 칸 | `qwerty` 0 이상 = 키 번호, -1 = 빈 칸)
+            * min_confidence (float): `recognize` 에서 허용할 최소 신뢰도 (default: 0.2)
+        """
+
+        np = import_numpy()
+
+        boxes = KEY_BOXES[keyboard_type]
+        x0, y0, x1, y1 = boxes[0]
+        templates = np.asarray(templates, dtype=np.float32)
+        if templates.shape[1:] != (y1 - y0, x1 - x0, 3) or templates.shape[0] != len(labels):
+            raise ValueError("템플릿의 크기가 키패드 칸의 크기와 일치하지 않습니다.")
+
+        self.__keyboard_type = keyboard_type
+        self.__templates = templates.reshape(len(labels), (y1 - y0) * (x1 - x0) * 3)
+        self.__template_norms = (self.__templates ** 2).sum(axis=1)
+        self.__labels = np.asarray(labels, dtype=np.int64)
+        # 신뢰도를 비교할 분류 (qwerty는 키 번호와 관계없이 키 / 빈 칸만 구분)
+        self.__classes = self.__labels if keyboard_type == "number" else np.where(self.__labels == -1, -1, 0)
+        self.__min_confidence = min_confidence
+
+        # 모든 칸을 한 번에 잘라내기 위한 인덱스 (칸 수, 높이, 1) / (칸 수, 1, 너비)
+        self.__rows = np.array([np.arange(box[1], box[3]) for box in boxes])[:, :, None]
+        self.__columns = np.array([np.arange(box[0], box[2]) for box in boxes])[:, None, :]
+        self.__size = (max(box[3] for box in boxes), max(box[2] for box in boxes))
+
+    @property
+    def keyboard_type(self):
+        """
+        키패드 종류
+        """
+        return self.__keyboard_type
+
+    @property
+    def min_confidence(self):
+        """
+        `recognize` 에서 허용할 최소 신뢰도
+        """
+        return self.__min_confidence
+
+    def get_cells(self, content: bytes):
+        """
+        키패드 사진의 모든 칸을 (칸 수, 높이, 너비, 3) 배열로 잘라냅니다.
+
+        파라미터:
+            * content (bytes): 키패드 사진
+
+        반환값:
+            numpy.ndarray
+        """
+
+        np = import_numpy()
+
+        key_image = Image.open(BytesIO(content))
+        if key_image.mode != "RGB":
+            key_image = key_image.convert("RGB")
+
+        pixels = np.asarray(key_image)
+        height, width = self.__size
+        if pixels.shape[0] < height or pixels.shape[1] < width: # 사진 밖 영역은 검은색 (PIL crop과 동일)
+            pixels = np.pad(pixels, ((0, max(height - pixels.shape[0], 0)), (0, max(width - pixels.shape[1], 0)), (0, 0)))
+
+        return pixels[self.__rows, self.__columns].astype(np.float32)
+
+    def classify(self, content: bytes):
+        """
+        키패드 사진을 분석하여 키패드 배열과 신뢰도를 가져옵니다.
+        신뢰도는 칸마다 가장 가까운 템플릿과 다른 분류 중 가장 가까운 템플릿의 거리 차이로 계산하며, 가장 낮은 칸의 값을 반환합니다.
+
+        파라미터:
+            * content (bytes): 키패드 사진
+
+        반환값:
+            (키패드 배열, 신뢰도 0~1)
+        """
+
+        np = import_numpy()
+
+        cells = self.get_cells(content).reshape(len(self.__rows), -1)
+
+        # 모든 칸과 모든 템플릿 사이의 제곱 거리 (칸 수, 템플릿 수)
+        distances = (cells ** 2).sum(axis=1)[:, None] - 2 * cells @ self.__templates.T + self.__template_norms[None, :]
+        distances = np.maximum(distances, 0)
+
+        nearest = distances.argmin(axis=1)
+        labels = self.__labels[nearest]
+
+        if len(np.unique(self.__classes)) > 1:
+            best = distances[np.arange(len(nearest)), nearest]
+            other = self.__classes[None, :] != self.__classes[nearest][:, None]
+            second = np.where(other, distances, np.inf).min(axis=1)
+            confidence = float(((second - best) / (second + best + 1e-9)).min())
+        else:
+            confidence = 1.0
+
+        if self.__keyboard_type == "number":
+            return (labels.tolist(), confidence)
+
+        layout: list[int] = []
+        i = 0
+        for label in labels.tolist():
+            if label == -1:
+                layout.append(-1) # 빈 칸
+            else:
+                layout.append(i)
+                i += 1
+
+        return (layout, confidence)
+
+    def recognize(self, content: bytes):
+        """
+        `classify` 와 같지만, 신뢰도가 `min_confidence` 보다 낮으면 오류가 발생합니다.
+
+        파라미터:
+            * content (bytes): 키패드 사진
+
+        반환값:
+            키패드 배열
+        """
+
+        layout, confidence = self.classify(content)
+        if confidence < self.__min_confidence:
+            raise ValueError(f"키패드 사진을 인식할 수 없습니다. (신뢰도: {confidence:.3f})")
+
+        return layout
+
+    @staticmethod
+    def fit(contents: list[bytes], keyboard_type: Literal["qwerty", "number"], min_confidence = 0.2, layouts: Optional[list[list[int]]] = None):
+        """
+        기존 해시 인식으로 분류 가능한 키패드 사진들로 템플릿을 생성합니다.
+        같은 키로 분류된 칸들의 평균을 템플릿으로 사용합니다.
+
+        파라미터:
+            * contents (list[bytes]): 키패드 사진 목록
+            * keyboard_type (str): 키패드 종류 `qwerty` | `number`
+            * min_confidence (float): `recognize` 에서 허용할 최소 신뢰도 (default: 0.2)
+            * layouts (list[list[int]] | None): 사진별 키패드 배열, 해시 인식이 불가능한 사진을 직접 분류할 때 사용 (default: 해시 인식)
+
+        반환값:
+            KeypadTemplateMatcher
+        """
+
+        np = import_numpy()
+
+        x0, y0, x1, y1 = KEY_BOXES[keyboard_type][0]
+        empty = np.zeros((0, y1 - y0, x1 - x0, 3), dtype=np.float32)
+        slicer = KeypadTemplateMatcher(keyboard_type, empty, [])
+
+        if layouts is not None and len(layouts) != len(contents):
+            raise ValueError("키패드 사진과 키패드 배열의 개수가 일치하지 않습니다.")
+
+        sums: dict[int, object] = {}
+        counts: dict[int, int] = {}
+        for i, content in enumerate(contents):
+            cells = slicer.get_cells(content)
+            layout = recognize_keypad_layout(content, keyboard_type) if layouts is None else layouts[i]
+            if len(layout) != len(cells):
+                raise ValueError("키패드 배열의 길이가 키패드 칸의 수와 일치하지 않습니다.")
+
+            for cell, key in zip(cells, layout):
+                label = key # qwerty는 빈 칸을 제외한 키 순서가 고정되어 있으므로 키 번호별로 템플릿 생성
+                sums[label] = sums[label] + cell if label in sums else cell.copy()
+                counts[label] = counts.get(label, 0) + 1
+
+        if len(sums) == 0:
+            raise ValueError("템플릿을 생성할 키패드 사진이 없습니다.")
+
+        labels = sorted(sums)
+        templates = np.stack([sums[label] / counts[label] for label in labels])
+        return KeypadTemplateMatcher(keyboard_type, templates, labels, min_confidence)
+
+    def save(self, path: str):
+        """
+        템플릿을 `.npz` 파일로 저장합니다.
+        """
+
+        np = import_numpy()
+
+        x0, y0, x1, y1 = KEY_BOXES[self.__keyboard_type][0]
+        np.savez_compressed(
+            path,
+            keyboard_type=np.array(self.__keyboard_type),
+            templates=self.__templates.reshape(len(self.__labels), y1 - y0, x1 - x0, 3),
+            labels=self.__labels,
+            min_confidence=np.array(self.__min_confidence)
+        )
+
+    @staticmethod
+    def load(path: str, min_confidence: Optional[float] = None):
+        """
+        `.npz` 파일에서 템플릿을 불러옵니다.
+
+        파라미터:
+            * path (str): 템플릿 파일 경로
+            * min_confidence (float | None): 최소 신뢰도 (default: 파일에 저장된 값)
+
+        반환값:
+            KeypadTemplateMatcher
+        """
+
+        np = import_numpy()
+
+        with np.load(path) as data:
+            return KeypadTemplateMatcher(
+                str(data["keyboard_type"]),
+                data["templates"],
+                data["labels"].tolist(),
+                float(data["min_confidence"]) if min_confidence is None else min_confidence
+            )
@@ -0,0 +1,112 @@
+import asyncio
+
+from collections import deque
+from concurrent.futures import Executor
+from typing import Optional
+from .transkey import create_transkey_data
+from ._types import TranskeyData
+
+class TranskeyPool:
+    """
+    미리 생성된 트랜스키 세션 정보를 보관하는 풀입니다.
+    세션 키 생성과 RSA 암호화를 백그라운드에서 처리하여 요청 시 대기 없이 세션을 꺼내 쓸 수 있습니다.
+    꺼낸 세션 정보는 한 번만 사용됩니다.
+
+    ```py
+    pool = TranskeyPool(8)
+    await pool.start() # 풀 채우기
+    client = Cultureland(transkey_pool=pool)
+    ```
+    """
+
+    def __init__(self, size = 4, executor: Optional[Executor] = None):
+        """
+        파라미터:
+            * size (int): 미리 생성해둘 세션 수 (default: 4)
+            * executor (Executor | None): 세션을 생성할 executor (default: 이벤트 루프의 기본 executor)
+        """
+
+        if size < 1:
+            raise ValueError("풀 크기는 1 이상이어야 합니다.")
+
+        self.__size = size
+        self.__executor = executor
+        self.__ready: deque[TranskeyData] = deque()
+        self.__refill_task: Optional[asyncio.Task] = None
+
+    @property
+    def size(self):
+        """
+        미리 생성해둘 세션 수
+        """
+        return self.__size
+
+    @property
+    def available(self):
+        """
+        현재 사용 가능한 세션 수
+        """
+        return len(self.__ready)
+
+    @staticmethod
+    def generate():
+        """
+        RSA 암호화까지 완료된 트랜스키 세션 정보를 생성합니다.
+
+        반환값:
+            TranskeyData
+        """
+
+        transkey_data = create_transkey_data()
+        transkey_data.get_encrypted_session_key() # RSA 암호화 미리 수행
+        transkey_data.round_key # SEED 라운드 키 미리 생성
+        return transkey_data
+
+    async def start(self):
+        """
+        풀이 가득 찰 때까지 세션을 생성합니다.
+        """
+
+        self.__schedule_refill()
+        await asyncio.shield(self.__refill_task)
+
+    async def get(self):
+        """
+        풀에서 세션 정보를 하나 꺼냅니다.
+        풀이 비어있다면 즉시 생성하며, 꺼낸 만큼 백그라운드에서 다시 채웁니다.
+
+        반환값:
+            TranskeyData
+        """
+
+        if self.__ready:
+            transkey_data = self.__ready.popleft()
+        else:
+            transkey_data = await asyncio.get_running_loop().run_in_executor(self.__executor, TranskeyPool.generate)
+
+        self.__schedule_refill()
+        return transkey_data
+
+    async def close(self):
+        """
+        백그라운드 작업을 중지하고 남은 세션을 버립니다.
+        """
+
+        if self.__refill_task and not self.__refill_task.done():
+            self.__refill_task.cancel()
+            try:
+                await self.__refill_task
+            except asyncio.CancelledError:
+                pass
+
+        self.__refill_task = None
+        self.__ready.clear()
+
+    def __schedule_refill(self):
+        if self.__refill_task is None or self.__refill_task.done():
+            self.__refill_task = asyncio.get_running_loop().create_task(self.__refill())
+
+    async def __refill(self):
+        loop = asyncio.get_running_loop()
+        while len(self.__ready) < self.__size:
+            self.__ready.append(await loop.run_in_executor(self.__executor, TranskeyPool.generate))
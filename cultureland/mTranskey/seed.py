@@ -2,6 +2,7 @@
 # https://seed.kisa.or.kr/kisa/algorithm/EgovSeedInfo.do
 
 from functools import reduce
+from typing import Optional, Union
 
 SS0 = [0x2989a1a8, 0x05858184, 0x16c6d2d4, 0x13c3d3d0, 0x14445054, 0x1d0d111c, 0x2c8ca0ac, 0x25052124, 0x1d4d515c, 0x03434340, 0x18081018, 0x1e0e121c, 0x11415150, 0x3cccf0fc, 0x0acac2c8, 0x23436360, 0x28082028, 0x04444044, 0x20002020, 0x1d8d919c, 0x20c0e0e0, 0x22c2e2e0, 0x08c8c0c8, 0x17071314, 0x2585a1a4, 0x0f8f838c, 0x03030300, 0x3b4b7378, 0x3b8bb3b8, 0x13031310, 0x12c2d2d0, 0x2ecee2ec, 0x30407070, 0x0c8c808c, 0x3f0f333c, 0x2888a0a8, 0x32023230, 0x1dcdd1dc, 0x36c6f2f4, 0x34447074, 0x2ccce0ec, 0x15859194, 0x0b0b0308, 0x17475354, 0x1c4c505c, 0x1b4b5358, 0x3d8db1bc, 0x01010100, 0x24042024, 0x1c0c101c, 0x33437370, 0x18889098, 0x10001010, 0x0cccc0cc, 0x32c2f2f0, 0x19c9d1d8, 0x2c0c202c, 0x27c7e3e4, 0x32427270, 0x03838380, 0x1b8b9398, 0x11c1d1d0, 0x06868284, 0x09c9c1c8, 0x20406060, 0x10405050, 0x2383a3a0, 0x2bcbe3e8, 0x0d0d010c, 0x3686b2b4, 0x1e8e929c, 0x0f4f434c, 0x3787b3b4, 0x1a4a5258, 0x06c6c2c4, 0x38487078, 0x2686a2a4, 0x12021210, 0x2f8fa3ac, 0x15c5d1d4, 0x21416160, 0x03c3c3c0, 0x3484b0b4, 0x01414140, 0x12425250, 0x3d4d717c, 0x0d8d818c, 0x08080008, 0x1f0f131c, 0x19899198, 0x00000000, 0x19091118, 0x04040004, 0x13435350, 0x37c7f3f4, 0x21c1e1e0, 0x3dcdf1fc, 0x36467274, 0x2f0f232c, 0x27072324, 0x3080b0b0, 0x0b8b8388, 0x0e0e020c, 0x2b8ba3a8, 0x2282a2a0, 0x2e4e626c, 0x13839390, 0x0d4d414c, 0x29496168, 0x3c4c707c, 0x09090108, 0x0a0a0208, 0x3f8fb3bc, 0x2fcfe3ec, 0x33c3f3f0, 0x05c5c1c4, 0x07878384, 0x14041014, 0x3ecef2fc, 0x24446064, 0x1eced2dc, 0x2e0e222c, 0x0b4b4348, 0x1a0a1218, 0x06060204, 0x21012120, 0x2b4b6368, 0x26466264, 0x02020200, 0x35c5f1f4, 0x12829290, 0x0a8a8288, 0x0c0c000c, 0x3383b3b0, 0x3e4e727c, 0x10c0d0d0, 0x3a4a7278, 0x07474344, 0x16869294, 0x25c5e1e4, 0x26062224, 0x00808080, 0x2d8da1ac, 0x1fcfd3dc, 0x2181a1a0, 0x30003030, 0x37073334, 0x2e8ea2ac, 0x36063234, 0x15051114, 0x22022220, 0x38083038, 0x34c4f0f4, 0x2787a3a4, 0x05454144, 0x0c4c404c, 0x01818180, 0x29c9e1e8, 0x04848084, 0x17879394, 0x35053134, 0x0bcbc3c8, 0x0ecec2cc, 0x3c0c303c, 0x31417170, 0x11011110, 0x07c7c3c4, 0x09898188, 0x35457174, 0x3bcbf3f8, 0x1acad2d8, 0x38c8f0f8, 0x14849094, 0x19495158, 0x02828280, 0x04c4c0c4, 0x3fcff3fc, 0x09494148, 0x39093138, 0x27476364, 0x00c0c0c0, 0x0fcfc3cc, 0x17c7d3d4, 0x3888b0b8, 0x0f0f030c, 0x0e8e828c, 0x02424240, 0x23032320, 0x11819190, 0x2c4c606c, 0x1bcbd3d8, 0x2484a0a4, 0x34043034, 0x31c1f1f0, 0x08484048, 0x02c2c2c0, 0x2f4f636c, 0x3d0d313c, 0x2d0d212c, 0x00404040, 0x3e8eb2bc, 0x3e0e323c, 0x3c8cb0bc, 0x01c1c1c0, 0x2a8aa2a8, 0x3a8ab2b8, 0x0e4e424c, 0x15455154, 0x3b0b3338, 0x1cccd0dc, 0x28486068, 0x3f4f737c, 0x1c8c909c, 0x18c8d0d8, 0x0a4a4248, 0x16465254, 0x37477374, 0x2080a0a0, 0x2dcde1ec, 0x06464244, 0x3585b1b4, 0x2b0b2328, 0x25456164, 0x3acaf2f8, 0x23c3e3e0, 0x3989b1b8, 0x3181b1b0, 0x1f8f939c, 0x1e4e525c, 0x39c9f1f8, 0x26c6e2e4, 0x3282b2b0, 0x31013130, 0x2acae2e8, 0x2d4d616c, 0x1f4f535c, 0x24c4e0e4, 0x30c0f0f0, 0x0dcdc1cc, 0x08888088, 0x16061214, 0x3a0a3238, 0x18485058, 0x14c4d0d4, 0x22426260, 0x29092128, 0x07070304, 0x33033330, 0x28c8e0e8, 0x1b0b1318, 0x05050104, 0x39497178, 0x10809090, 0x2a4a6268, 0x2a0a2228, 0x1a8a9298]
 SS1 = [0x38380830, 0xe828c8e0, 0x2c2d0d21, 0xa42686a2, 0xcc0fcfc3, 0xdc1eced2, 0xb03383b3, 0xb83888b0, 0xac2f8fa3, 0x60204060, 0x54154551, 0xc407c7c3, 0x44044440, 0x6c2f4f63, 0x682b4b63, 0x581b4b53, 0xc003c3c3, 0x60224262, 0x30330333, 0xb43585b1, 0x28290921, 0xa02080a0, 0xe022c2e2, 0xa42787a3, 0xd013c3d3, 0x90118191, 0x10110111, 0x04060602, 0x1c1c0c10, 0xbc3c8cb0, 0x34360632, 0x480b4b43, 0xec2fcfe3, 0x88088880, 0x6c2c4c60, 0xa82888a0, 0x14170713, 0xc404c4c0, 0x14160612, 0xf434c4f0, 0xc002c2c2, 0x44054541, 0xe021c1e1, 0xd416c6d2, 0x3c3f0f33, 0x3c3d0d31, 0x8c0e8e82, 0x98188890, 0x28280820, 0x4c0e4e42, 0xf436c6f2, 0x3c3e0e32, 0xa42585a1, 0xf839c9f1, 0x0c0d0d01, 0xdc1fcfd3, 0xd818c8d0, 0x282b0b23, 0x64264662, 0x783a4a72, 0x24270723, 0x2c2f0f23, 0xf031c1f1, 0x70324272, 0x40024242, 0xd414c4d0, 0x40014141, 0xc000c0c0, 0x70334373, 0x64274763, 0xac2c8ca0, 0x880b8b83, 0xf437c7f3, 0xac2d8da1, 0x80008080, 0x1c1f0f13, 0xc80acac2, 0x2c2c0c20, 0xa82a8aa2, 0x34340430, 0xd012c2d2, 0x080b0b03, 0xec2ecee2, 0xe829c9e1, 0x5c1d4d51, 0x94148490, 0x18180810, 0xf838c8f0, 0x54174753, 0xac2e8ea2, 0x08080800, 0xc405c5c1, 0x10130313, 0xcc0dcdc1, 0x84068682, 0xb83989b1, 0xfc3fcff3, 0x7c3d4d71, 0xc001c1c1, 0x30310131, 0xf435c5f1, 0x880a8a82, 0x682a4a62, 0xb03181b1, 0xd011c1d1, 0x20200020, 0xd417c7d3, 0x00020202, 0x20220222, 0x04040400, 0x68284860, 0x70314171, 0x04070703, 0xd81bcbd3, 0x9c1d8d91, 0x98198991, 0x60214161, 0xbc3e8eb2, 0xe426c6e2, 0x58194951, 0xdc1dcdd1, 0x50114151, 0x90108090, 0xdc1cccd0, 0x981a8a92, 0xa02383a3, 0xa82b8ba3, 0xd010c0d0, 0x80018181, 0x0c0f0f03, 0x44074743, 0x181a0a12, 0xe023c3e3, 0xec2ccce0, 0x8c0d8d81, 0xbc3f8fb3, 0x94168692, 0x783b4b73, 0x5c1c4c50, 0xa02282a2, 0xa02181a1, 0x60234363, 0x20230323, 0x4c0d4d41, 0xc808c8c0, 0x9c1e8e92, 0x9c1c8c90, 0x383a0a32, 0x0c0c0c00, 0x2c2e0e22, 0xb83a8ab2, 0x6c2e4e62, 0x9c1f8f93, 0x581a4a52, 0xf032c2f2, 0x90128292, 0xf033c3f3, 0x48094941, 0x78384870, 0xcc0cccc0, 0x14150511, 0xf83bcbf3, 0x70304070, 0x74354571, 0x7c3f4f73, 0x34350531, 0x10100010, 0x00030303, 0x64244460, 0x6c2d4d61, 0xc406c6c2, 0x74344470, 0xd415c5d1, 0xb43484b0, 0xe82acae2, 0x08090901, 0x74364672, 0x18190911, 0xfc3ecef2, 0x40004040, 0x10120212, 0xe020c0e0, 0xbc3d8db1, 0x04050501, 0xf83acaf2, 0x00010101, 0xf030c0f0, 0x282a0a22, 0x5c1e4e52, 0xa82989a1, 0x54164652, 0x40034343, 0x84058581, 0x14140410, 0x88098981, 0x981b8b93, 0xb03080b0, 0xe425c5e1, 0x48084840, 0x78394971, 0x94178793, 0xfc3cccf0, 0x1c1e0e12, 0x80028282, 0x20210121, 0x8c0c8c80, 0x181b0b13, 0x5c1f4f53, 0x74374773, 0x54144450, 0xb03282b2, 0x1c1d0d11, 0x24250521, 0x4c0f4f43, 0x00000000, 0x44064642, 0xec2dcde1, 0x58184850, 0x50124252, 0xe82bcbe3, 0x7c3e4e72, 0xd81acad2, 0xc809c9c1, 0xfc3dcdf1, 0x30300030, 0x94158591, 0x64254561, 0x3c3c0c30, 0xb43686b2, 0xe424c4e0, 0xb83b8bb3, 0x7c3c4c70, 0x0c0e0e02, 0x50104050, 0x38390931, 0x24260622, 0x30320232, 0x84048480, 0x68294961, 0x90138393, 0x34370733, 0xe427c7e3, 0x24240420, 0xa42484a0, 0xc80bcbc3, 0x50134353, 0x080a0a02, 0x84078783, 0xd819c9d1, 0x4c0c4c40, 0x80038383, 0x8c0f8f83, 0xcc0ecec2, 0x383b0b33, 0x480a4a42, 0xb43787b3]
@@ -9,6 +10,11 @@ SS2 = [0xa1a82989, 0x81840585, 0xd2d416c6, 0xd3d013c3, 0x50541444, 0x111c1d0d, 0
 SS3 = [0x08303838, 0xc8e0e828, 0x0d212c2d, 0x86a2a426, 0xcfc3cc0f, 0xced2dc1e, 0x83b3b033, 0x88b0b838, 0x8fa3ac2f, 0x40606020, 0x45515415, 0xc7c3c407, 0x44404404, 0x4f636c2f, 0x4b63682b, 0x4b53581b, 0xc3c3c003, 0x42626022, 0x03333033, 0x85b1b435, 0x09212829, 0x80a0a020, 0xc2e2e022, 0x87a3a427, 0xc3d3d013, 0x81919011, 0x01111011, 0x06020406, 0x0c101c1c, 0x8cb0bc3c, 0x06323436, 0x4b43480b, 0xcfe3ec2f, 0x88808808, 0x4c606c2c, 0x88a0a828, 0x07131417, 0xc4c0c404, 0x06121416, 0xc4f0f434, 0xc2c2c002, 0x45414405, 0xc1e1e021, 0xc6d2d416, 0x0f333c3f, 0x0d313c3d, 0x8e828c0e, 0x88909818, 0x08202828, 0x4e424c0e, 0xc6f2f436, 0x0e323c3e, 0x85a1a425, 0xc9f1f839, 0x0d010c0d, 0xcfd3dc1f, 0xc8d0d818, 0x0b23282b, 0x46626426, 0x4a72783a, 0x07232427, 0x0f232c2f, 0xc1f1f031, 0x42727032, 0x42424002, 0xc4d0d414, 0x41414001, 0xc0c0c000, 0x43737033, 0x47636427, 0x8ca0ac2c, 0x8b83880b, 0xc7f3f437, 0x8da1ac2d, 0x80808000, 0x0f131c1f, 0xcac2c80a, 0x0c202c2c, 0x8aa2a82a, 0x04303434, 0xc2d2d012, 0x0b03080b, 0xcee2ec2e, 0xc9e1e829, 0x4d515c1d, 0x84909414, 0x08101818, 0xc8f0f838, 0x47535417, 0x8ea2ac2e, 0x08000808, 0xc5c1c405, 0x03131013, 0xcdc1cc0d, 0x86828406, 0x89b1b839, 0xcff3fc3f, 0x4d717c3d, 0xc1c1c001, 0x01313031, 0xc5f1f435, 0x8a82880a, 0x4a62682a, 0x81b1b031, 0xc1d1d011, 0x00202020, 0xc7d3d417, 0x02020002, 0x02222022, 0x04000404, 0x48606828, 0x41717031, 0x07030407, 0xcbd3d81b, 0x8d919c1d, 0x89919819, 0x41616021, 0x8eb2bc3e, 0xc6e2e426, 0x49515819, 0xcdd1dc1d, 0x41515011, 0x80909010, 0xccd0dc1c, 0x8a92981a, 0x83a3a023, 0x8ba3a82b, 0xc0d0d010, 0x81818001, 0x0f030c0f, 0x47434407, 0x0a12181a, 0xc3e3e023, 0xcce0ec2c, 0x8d818c0d, 0x8fb3bc3f, 0x86929416, 0x4b73783b, 0x4c505c1c, 0x82a2a022, 0x81a1a021, 0x43636023, 0x03232023, 0x4d414c0d, 0xc8c0c808, 0x8e929c1e, 0x8c909c1c, 0x0a32383a, 0x0c000c0c, 0x0e222c2e, 0x8ab2b83a, 0x4e626c2e, 0x8f939c1f, 0x4a52581a, 0xc2f2f032, 0x82929012, 0xc3f3f033, 0x49414809, 0x48707838, 0xccc0cc0c, 0x05111415, 0xcbf3f83b, 0x40707030, 0x45717435, 0x4f737c3f, 0x05313435, 0x00101010, 0x03030003, 0x44606424, 0x4d616c2d, 0xc6c2c406, 0x44707434, 0xc5d1d415, 0x84b0b434, 0xcae2e82a, 0x09010809, 0x46727436, 0x09111819, 0xcef2fc3e, 0x40404000, 0x02121012, 0xc0e0e020, 0x8db1bc3d, 0x05010405, 0xcaf2f83a, 0x01010001, 0xc0f0f030, 0x0a22282a, 0x4e525c1e, 0x89a1a829, 0x46525416, 0x43434003, 0x85818405, 0x04101414, 0x89818809, 0x8b93981b, 0x80b0b030, 0xc5e1e425, 0x48404808, 0x49717839, 0x87939417, 0xccf0fc3c, 0x0e121c1e, 0x82828002, 0x01212021, 0x8c808c0c, 0x0b13181b, 0x4f535c1f, 0x47737437, 0x44505414, 0x82b2b032, 0x0d111c1d, 0x05212425, 0x4f434c0f, 0x00000000, 0x46424406, 0xcde1ec2d, 0x48505818, 0x42525012, 0xcbe3e82b, 0x4e727c3e, 0xcad2d81a, 0xc9c1c809, 0xcdf1fc3d, 0x00303030, 0x85919415, 0x45616425, 0x0c303c3c, 0x86b2b436, 0xc4e0e424, 0x8bb3b83b, 0x4c707c3c, 0x0e020c0e, 0x40505010, 0x09313839, 0x06222426, 0x02323032, 0x84808404, 0x49616829, 0x83939013, 0x07333437, 0xc7e3e427, 0x04202424, 0x84a0a424, 0xcbc3c80b, 0x43535013, 0x0a02080a, 0x87838407, 0xc9d1d819, 0x4c404c0c, 0x83838003, 0x8f838c0f, 0xcec2cc0e, 0x0b33383b, 0x4a42480a, 0x87b3b437]
 KC = [0x9e3779b9, 0x3c6ef373, 0x78dde6e6, 0xf1bbcdcc, 0xe3779b99, 0xc6ef3733, 0x8dde6e67, 0x1bbcdccf, 0x3779b99e, 0x6ef3733c, 0xdde6e678, 0xbbcdccf1, 0x779b99e3, 0xef3733c6, 0xde6e678d, 0xbcdccf1b]
 
+# mTranskey CBC IV ("MobileTransKey10")
+SEED_IV = (0x4d, 0x6f, 0x62, 0x69, 0x6c, 0x65, 0x54, 0x72, 0x61, 0x6e, 0x73, 0x4b, 0x65, 0x79, 0x31, 0x30)
+HEX_BYTES = tuple(hex(i)[2:] for i in range(256)) # 바이트 -> 패딩 없는 16진수 문자열
+SS_ARRAY = None # SeedEncBatch에서 사용하는 NumPy SS0~SS3 (numpy.ndarray, 최초 사용 시 생성)
+
 class Seed:
     @staticmethod
     def GetB0(A: int):
@@ -462,11 +468,125 @@ class Seed:
         Seed.ArrayCopy(f, 0, e, 0, blockSize * 16 + remainLen)
 
     @staticmethod
-    def SeedEnc(geo: str, sessionKey: list[int]):
-        iv = [0x4d, 0x6f, 0x62, 0x69, 0x6c, 0x65, 0x54, 0x72, 0x61, 0x6e, 0x73, 0x4b, 0x65, 0x79, 0x31, 0x30]
+    def SeedRoundKeyFast(key: list[int]):
+        """
+        `SeedRoundKey` 와 동일한 라운드 키를 부호 없는 32비트 정수로 생성합니다.
+
+        파라미터:
+            * key (list[int]): 세션 키 (16바이트)
+
+        반환값:
+            라운드 키 (tuple[int, ...], 32개)
+        """
+
+        A = ((key[0] & 0xff) << 24) | ((key[1] & 0xff) << 16) | ((key[2] & 0xff) << 8) | (key[3] & 0xff)
+        B = ((key[4] & 0xff) << 24) | ((key[5] & 0xff) << 16) | ((key[6] & 0xff) << 8) | (key[7] & 0xff)
+        C = ((key[8] & 0xff) << 24) | ((key[9] & 0xff) << 16) | ((key[10] & 0xff) << 8) | (key[11] & 0xff)
+        D = ((key[12] & 0xff) << 24) | ((key[13] & 0xff) << 16) | ((key[14] & 0xff) << 8) | (key[15] & 0xff)
+
+        roundKey: list[int] = []
+        for i in range(16):
+            # 기존 구현은 부호 있는 정수를 >> 하므로 산술 시프트(부호 확장)를 그대로 재현
+            if i % 2 == 1: # EncRoundKeyUpdate0
+                a = A
+                A = ((A >> 8) | (0xff000000 if A & 0x80000000 else 0)) ^ ((B << 24) & 0xffffffff)
+                B = ((B >> 8) | (0xff000000 if B & 0x80000000 else 0)) ^ ((a << 24) & 0xffffffff)
+            elif i != 0: # EncRoundKeyUpdate1
+                a = C
+                C = ((C << 8) & 0xffffffff) ^ ((D >> 24) | (0xffffff00 if D & 0x80000000 else 0))
+                D = ((D << 8) & 0xffffffff) ^ ((a >> 24) | (0xffffff00 if a & 0x80000000 else 0))
+
+            b = (A + C - KC[i]) & 0xffffffff
+            c = (B - D + KC[i]) & 0xffffffff
+            roundKey.append(SS0[b & 0xff] ^ SS1[(b >> 8) & 0xff] ^ SS2[(b >> 16) & 0xff] ^ SS3[b >> 24])
+            roundKey.append(SS0[c & 0xff] ^ SS1[(c >> 8) & 0xff] ^ SS2[(c >> 16) & 0xff] ^ SS3[c >> 24])
+
+        return tuple(roundKey)
+
+    @staticmethod
+    def SeedEncryptBlockFast(L0: int, L1: int, R0: int, R1: int, roundKey: tuple[int, ...]):
+        """
+        부호 없는 32비트 정수 4개로 이루어진 블록 하나를 암호화합니다.
+        `SeedEncrypt` 와 달리 라운드 함수와 SS0~SS3 조회가 인라인되어 있습니다.
+
+        반환값:
+            암호화된 블록 (tuple[int, int, int, int])
+        """
+
+        ss0, ss1, ss2, ss3 = SS0, SS1, SS2, SS3
+
+        for i in range(0, 32, 4):
+            # SeedRound(L, R)
+            T0 = R0 ^ roundKey[i]
+            T1 = R1 ^ roundKey[i + 1] ^ T0
+            T1 = ss0[T1 & 0xff] ^ ss1[(T1 >> 8) & 0xff] ^ ss2[(T1 >> 16) & 0xff] ^ ss3[T1 >> 24]
+            T0 = (T0 + T1) & 0xffffffff
+            T0 = ss0[T0 & 0xff] ^ ss1[(T0 >> 8) & 0xff] ^ ss2[(T0 >> 16) & 0xff] ^ ss3[T0 >> 24]
+            T1 = (T1 + T0) & 0xffffffff
+            T1 = ss0[T1 & 0xff] ^ ss1[(T1 >> 8) & 0xff] ^ ss2[(T1 >> 16) & 0xff] ^ ss3[T1 >> 24]
+            L0 ^= (T0 + T1) & 0xffffffff
+            L1 ^= T1
+
+            # SeedRound(R, L)
+            T0 = L0 ^ roundKey[i + 2]
+            T1 = L1 ^ roundKey[i + 3] ^ T0
+            T1 = ss0[T1 & 0xff] ^ ss1[(T1 >> 8) & 0xff] ^ ss2[(T1 >> 16) & 0xff] ^ ss3[T1 >> 24]
+            T0 = (T0 + T1) & 0xffffffff
+            T0 = ss0[T0 & 0xff] ^ ss1[(T0 >> 8) & 0xff] ^ ss2[(T0 >> 16) & 0xff] ^ ss3[T0 >> 24]
+            T1 = (T1 + T0) & 0xffffffff
+            T1 = ss0[T1 & 0xff] ^ ss1[(T1 >> 8) & 0xff] ^ ss2[(T1 >> 16) & 0xff] ^ ss3[T1 >> 24]
+            R0 ^= (T0 + T1) & 0xffffffff
+            R1 ^= T1
+
+        return (R0, R1, L0, L1)
+
+    @staticmethod
+    def SeedEncryptCbcFast(roundKey: tuple[int, ...], iv: tuple[int, ...], inData: list[int], length: int):
+        """
+        `SeedEncryptCbc` 와 동일한 결과를 반환하는 CBC 암호화입니다.
+
+        파라미터:
+            * roundKey (tuple[int, ...]): `SeedRoundKeyFast` 로 생성한 라운드 키
+            * iv (tuple[int, ...]): 초기화 벡터 (16바이트)
+            * inData (list[int]): 평문
+            * length (int): 평문 길이
+
+        반환값:
+            암호문 (list[int])
+        """
+
+        blockSize = length // 16
+        remainLen = length % 16
+        outData: list[int] = []
+
+        c0 = (iv[0] << 24) | (iv[1] << 16) | (iv[2] << 8) | iv[3]
+        c1 = (iv[4] << 24) | (iv[5] << 16) | (iv[6] << 8) | iv[7]
+        c2 = (iv[8] << 24) | (iv[9] << 16) | (iv[10] << 8) | iv[11]
+        c3 = (iv[12] << 24) | (iv[13] << 16) | (iv[14] << 8) | iv[15]
+
+        for i in range(0, blockSize * 16, 16):
+            c0, c1, c2, c3 = Seed.SeedEncryptBlockFast(
+                c0 ^ (((inData[i] & 0xff) << 24) | ((inData[i + 1] & 0xff) << 16) | ((inData[i + 2] & 0xff) << 8) | (inData[i + 3] & 0xff)),
+                c1 ^ (((inData[i + 4] & 0xff) << 24) | ((inData[i + 5] & 0xff) << 16) | ((inData[i + 6] & 0xff) << 8) | (inData[i + 7] & 0xff)),
+                c2 ^ (((inData[i + 8] & 0xff) << 24) | ((inData[i + 9] & 0xff) << 16) | ((inData[i + 10] & 0xff) << 8) | (inData[i + 11] & 0xff)),
+                c3 ^ (((inData[i + 12] & 0xff) << 24) | ((inData[i + 13] & 0xff) << 16) | ((inData[i + 14] & 0xff) << 8) | (inData[i + 15] & 0xff)),
+                roundKey
+            )
+            for w in (c0, c1, c2, c3):
+                outData += (w >> 24, (w >> 16) & 0xff, (w >> 8) & 0xff, w & 0xff)
+
+        if remainLen != 0: # 남은 데이터는 암호화하지 않고 그대로 복사
+            outData += inData[blockSize * 16:blockSize * 16 + remainLen]
+
+        return outData
+
+    @staticmethod
+    def SeedEncData(geo: str):
+        """
+        키 좌표를 `SeedEnc` 의 64바이트 평문으로 변환합니다.
+        """
+
         inData = [0] * 64
-        outData = [0] * 64
-        roundKey = [0] * 32
 
         for i in range(len(geo)):
             if geo[i] in ["l", "u", "s", "d", " "]:
@@ -477,7 +597,115 @@ class Seed:
         inData[i + 1] = 32
         inData[i + 2] = 101
 
-        Seed.SeedSetKey(roundKey, sessionKey)
-        Seed.SeedEncryptCbc(roundKey, iv, inData, 64, outData)
+        return inData
+
+    @staticmethod
+    def SeedEnc(geo: str, sessionKey: Optional[list[int]] = None, fast = True, roundKey: Optional[tuple[int, ...]] = None):
+        """
+        키 좌표를 세션 키로 암호화합니다.
+        미리 생성한 라운드 키(`roundKey`)를 넘기면 키 확장을 건너뜁니다.
+
+        파라미터:
+            * geo (str): 키 좌표 | `l 123 45`
+            * sessionKey (list[int] | None): 세션 키
+            * fast (bool): 부호 없는 정수 기반의 빠른 구현 사용 여부 (default: True)
+            * roundKey (tuple[int, ...] | None): `SeedRoundKeyFast` 로 생성한 라운드 키
+
+        반환값:
+            쉼표로 구분된 16진수 암호문
+        """
+
+        inData = Seed.SeedEncData(geo)
+
+        if roundKey is None:
+            if sessionKey is None:
+                raise ValueError("sessionKey 또는 roundKey가 필요합니다.")
+
+            if fast:
+                roundKey = Seed.SeedRoundKeyFast(sessionKey)
+            else:
+                roundKey = [0] * 32
+                Seed.SeedSetKey(roundKey, sessionKey)
+
+        if fast:
+            outData = Seed.SeedEncryptCbcFast(roundKey, SEED_IV, inData, 64)
+        else:
+            outData = [0] * 64
+            Seed.SeedEncryptCbc(list(roundKey), list(SEED_IV), inData, 64, outData)
+
+        return ",".join(HEX_BYTES[c] for c in outData)
+
+    @staticmethod
+    def SeedEncBatch(geos: list[str], roundKeys: Union[tuple[int, ...], list[tuple[int, ...]]]):
+        """
+        여러 키 좌표를 NumPy로 한 번에 암호화합니다.
+        배치 차원으로 벡터화되어 있어 수백 개 이상의 입력을 암호화할 때 `SeedEnc` 보다 빠릅니다.
+        `numpy` 가 설치되어 있어야 합니다. (`pip install cultureland.py[numpy]`)
+
+        파라미터:
+            * geos (list[str]): 키 좌표 목록 | `["l 123 45", "1 2"]`
+            * roundKeys (tuple[int, ...] | list[tuple[int, ...]]): 모든 입력에 사용할 라운드 키, 또는 입력마다 사용할 라운드 키 목록
+
+        반환값:
+            쉼표로 구분된 16진수 암호문 목록 (`SeedEnc` 와 동일)
+        """
+
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("SeedEncBatch를 사용하려면 numpy가 필요합니다. (pip install numpy)")
+
+        if len(geos) == 0:
+            return []
+
+        global SS_ARRAY
+        if SS_ARRAY is None:
+            SS_ARRAY = np.array([SS0, SS1, SS2, SS3], dtype=np.uint32)
+        ss0, ss1, ss2, ss3 = SS_ARRAY
+
+        def G(x):
+            return ss0[x & 0xff] ^ ss1[(x >> 8) & 0xff] ^ ss2[(x >> 16) & 0xff] ^ ss3[x >> 24]
+
+        # (N, 64) 바이트 -> (N, 16) 빅 엔디안 32비트 워드
+        inData = np.array([Seed.SeedEncData(geo) for geo in geos], dtype=np.uint8)
+        words = inData.view(">u4").astype(np.uint32)
+
+        # (32, 1) 또는 (32, N) 라운드 키 (배치 차원으로 브로드캐스트)
+        rk = np.array(roundKeys, dtype=np.uint32)
+        if rk.ndim == 1:
+            rk = rk[:, None]
+        else:
+            if rk.shape[0] != len(geos):
+                raise ValueError("roundKeys의 개수가 geos의 개수와 일치하지 않습니다.")
+            rk = np.ascontiguousarray(rk.T)
+
+        iv = np.frombuffer(bytes(SEED_IV), dtype=">u4").astype(np.uint32)
+        c0, c1, c2, c3 = (np.full(len(geos), w, dtype=np.uint32) for w in iv)
+        outWords = np.empty_like(words)
+
+        for block in range(4):
+            L0 = c0 ^ words[:, block * 4]
+            L1 = c1 ^ words[:, block * 4 + 1]
+            R0 = c2 ^ words[:, block * 4 + 2]
+            R1 = c3 ^ words[:, block * 4 + 3]
+
+            for i in range(0, 32, 4):
+                T0 = R0 ^ rk[i]
+                T1 = G(R1 ^ rk[i + 1] ^ T0)
+                T0 = G(T0 + T1)
+                T1 = G(T1 + T0)
+                L0 = L0 ^ (T0 + T1)
+                L1 = L1 ^ T1
+
+                T0 = L0 ^ rk[i + 2]
+                T1 = G(L1 ^ rk[i + 3] ^ T0)
+                T0 = G(T0 + T1)
+                T1 = G(T1 + T0)
+                R0 = R0 ^ (T0 + T1)
+                R1 = R1 ^ T1
+
+            c0, c1, c2, c3 = R0, R1, L0, L1
+            outWords[:, block * 4:block * 4 + 4] = np.stack((c0, c1, c2, c3), axis=1)
 
-        return ",".join(hex(c)[2:] for c in outData)
+        outData = outWords.astype(">u4").view(np.uint8).reshape(len(geos), 64)
+        return [",".join([HEX_BYTES[c] for c in row]) for row in outData.tolist()]
@@ -1,3 +1,4 @@
+import asyncio
 import math
 import os
 import random
@@ -5,18 +6,38 @@ import re
 import time
 import httpx
 
-from typing import Literal
-from .keypad import Keypad
+from concurrent.futures import Executor
+from typing import Awaitable, Literal, Optional, TypeVar
+from .keypad import Keypad, KeypadLayoutCache
+from .key_info import KeyInfoCache, KEY_INFO_CACHE
+from .matcher import KeypadTemplateMatcher
 from ._types import TranskeyData, ServletData
 
+T = TypeVar("T")
+
+def create_transkey_data():
+    """
+    새로운 트랜스키 세션 정보를 생성합니다.
+
+    반환값:
+        TranskeyData
+    """
+
+    return TranskeyData(
+        transkey_uuid=os.urandom(32).hex(),
+        generated_session_key=os.urandom(8).hex(),
+        allocation_index=random.SystemRandom().randrange(2 ** 32 - 1)
+    )
+
 class mTranskey:
-    def __init__(self, client: httpx.AsyncClient):
+    def __init__(self, client: httpx.AsyncClient, transkey_data: Optional[TranskeyData] = None, key_info_cache: Optional[KeyInfoCache] = None, layout_cache: Optional[KeypadLayoutCache] = None, executor: Optional[Executor] = None, matchers: Optional[list[KeypadTemplateMatcher]] = None):
         self.client = client
-        self.transkey_data = TranskeyData(
-            transkey_uuid=os.urandom(32).hex(),
-            generated_session_key=os.urandom(8).hex(),
-            allocation_index=random.SystemRandom().randrange(2 ** 32 - 1)
-        )
+        self.transkey_data = transkey_data or create_transkey_data()
+        self.key_info_cache = key_info_cache or KEY_INFO_CACHE
+        self.layout_cache = layout_cache
+        self.executor = executor
+        self.matchers = matchers or [] # 키패드 종류별 템플릿 분류기
+        self.timings: dict[str, float] = {} # 서블릿 요청 단계별 소요 시간 (초)
 
     async def get_servlet_data(self):
         """
@@ -25,23 +46,58 @@ class mTranskey:
         반환값:
             * request_token (str): `TK_requestToken`
             * init_time (str): `initTime`
-            * qwerty_info (list[int]): qwerty 키패드 키 좌표
-            * number_info (list[int]): 숫자 키패드 키 좌표
+            * qwerty_info (tuple[tuple[int, int], ...]): qwerty 키패드 키 좌표
+            * number_info (tuple[tuple[int, int], ...]): 숫자 키패드 키 좌표
+
+        요청 단계별 소요 시간은 `timings` 에 기록됩니다. (`getToken` `getInitTime` `getKeyInfo` `total`)
         """
 
+        started_at = time.perf_counter()
+
+        # getToken -> getKeyInfo 만 순서가 필요하고, getInitTime은 독립적이므로 동시에 요청
+        async def get_key_info_after_token():
+            request_token = await self.__timed("getToken", self.__get_request_token())
+            key_info = await self.__timed("getKeyInfo", self.__get_key_info(request_token))
+            return request_token, key_info
+
+        (request_token, (qwerty_info, number_info)), init_time = await asyncio.gather(
+            get_key_info_after_token(),
+            self.__timed("getInitTime", self.__get_init_time())
+        )
+
+        self.timings["total"] = time.perf_counter() - started_at
+
+        return ServletData(
+            request_token,
+            init_time,
+            qwerty_info,
+            number_info
+        )
+
+    async def __timed(self, phase: str, coroutine: Awaitable[T]) -> T:
+        started_at = time.perf_counter()
+        try:
+            return await coroutine
+        finally:
+            self.timings[phase] = time.perf_counter() - started_at
+
+    async def __get_request_token(self):
         # TK_requestToken
         request_token_response = await self.client.get("/transkeyServlet?op=getToken&" + str(math.floor(time.time() * 1000)))
         request_token_regex = re.compile("var TK_requestToken=([\\d-]+);")
         request_token_match = request_token_regex.search(request_token_response.text)
-        request_token = request_token_match[1] if request_token_match else "0"
+        return request_token_match[1] if request_token_match else "0"
 
+    async def __get_init_time(self):
         # initTime
         init_time_response = await self.client.get("/transkeyServlet?op=getInitTime")
         init_time_regex = re.compile("var initTime='([\\d-]+)';")
         init_time_match = init_time_regex.search(init_time_response.text)
-        init_time = init_time_match[1] if init_time_match else "0"
+        return init_time_match[1] if init_time_match else "0"
 
+    async def __get_key_info(self, request_token: str):
         # keyInfo (키 좌표)
+        # 이 요청으로 서버에 세션 키가 전달되므로 키 좌표가 캐시되어 있어도 생략하지 않음
         key_positions_response = await self.client.post(
             "/transkeyServlet",
             data={
@@ -54,35 +110,7 @@ class mTranskey:
             }
         )
 
-        [qwerty, number] = key_positions_response.text.split("var numberMobile = new Array();")
-        points_regex = re.compile("key\\.addPoint\\((\\d+), (\\d+)\\);")
-
-        # keyInfo.qwerty
-        qwerty_info = []
-        qwerty_points = qwerty.split("qwertyMobile.push(key);")
-        qwerty_points.pop()
-
-        for p in qwerty_points:
-            points = points_regex.findall(p)
-            key = points[0]
-            qwerty_info.append([int(key[0]), int(key[1])]) # 키 좌표
-
-        # keyInfo.number
-        number_info = []
-        number_points = number.split("numberMobile.push(key);")
-        number_points.pop()
-
-        for p in number_points:
-            points = points_regex.findall(p)
-            key = points[0]
-            number_info.append([int(key[0]), int(key[1])]) # 키 좌표
-
-        return ServletData(
-            request_token,
-            init_time,
-            qwerty_info,
-            number_info
-        )
+        return self.key_info_cache.parse(key_positions_response.text)
 
     def create_keypad(self, servlet_data: ServletData, keyboard_type: Literal["qwerty", "number"], name: str, input_name: str, field_type = "password"):
         """
@@ -106,5 +134,8 @@ class mTranskey:
             keyboard_type,
             name,
             input_name,
-            field_type
+            field_type,
+            self.layout_cache,
+            self.executor,
+            next((matcher for matcher in self.matchers if matcher.keyboard_type == keyboard_type), None)
         )
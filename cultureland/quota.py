@@ -0,0 +1,270 @@
+import contextlib
+import sqlite3
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from ._types import CulturelandCharge
+
+"""
+할당량 저장 포맷 버전
+저장 형식이 바뀌면 올려서 이전 버전의 기록을 무시하게 합니다.
+"""
+QUOTA_TRACKER_VERSION = 1
+
+"""
+컬쳐랜드 서버 기준 시간대 (KST)
+"""
+KST = timezone(timedelta(hours=9))
+
+class QuotaTracker:
+    """
+    서버가 요청을 보낸 뒤에야 알려주는 계정별 한도를 로컬에서 추적합니다.
+    한도를 넘길 것이 확실한 요청은 트랜스키, 키패드 작업 전에 바로 실패합니다.
+    한도는 한국 시간 자정마다 초기화되며, `path` 를 지정하면 재시작 후에도 유지됩니다.
+    같은 `path` 를 사용하는 여러 프로세스는 SQLite 트랜잭션으로 할당량을 함께 기록하고 조회합니다.
+
+    * 상품권 조회: 하루 10회
+    * 충전 실패: 하루 20회 (`등록제한(20번 등록실패)`)
+    * 선물 한도: `get_gift_limit` 으로 확인한 잔여 한도
+    """
+
+    def __init__(self, path: Optional[str] = None, voucher_lookup_limit = 10, charge_failure_limit = 20):
+        """
+        파라미터:
+            * path (str | None): 할당량을 저장할 SQLite 데이터베이스 경로 (default: 메모리)
+            * voucher_lookup_limit (int): 하루 상품권 조회 한도 (default: 10)
+            * charge_failure_limit (int): 하루 충전 실패 한도 (default: 20)
+        """
+
+        self.__path = path
+        self.__voucher_lookup_limit = voucher_lookup_limit
+        self.__charge_failure_limit = charge_failure_limit
+
+        # 트랜잭션을 직접 시작하기 위해 자동 트랜잭션 사용 안 함
+        self.__connection = sqlite3.connect(path or ":memory:", isolation_level=None)
+        self.__create_tables()
+
+    @property
+    def path(self):
+        """
+        할당량을 저장할 SQLite 데이터베이스 경로
+        """
+        return self.__path
+
+    def __create_tables(self):
+        version = self.__connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != QUOTA_TRACKER_VERSION:
+            # 이전 버전의 기록은 무시
+            self.__connection.executescript(f"""
+                BEGIN IMMEDIATE;
+                DROP TABLE IF EXISTS quotas;
+                PRAGMA user_version = {QUOTA_TRACKER_VERSION};
+                COMMIT;
+            """)
+
+        self.__connection.execute("""
+            CREATE TABLE IF NOT EXISTS quotas (
+                account TEXT PRIMARY KEY,
+                day TEXT NOT NULL,
+                voucher_lookups INTEGER NOT NULL,
+                charge_failures INTEGER NOT NULL,
+                gift_remain INTEGER
+            )
+        """)
+
+    @staticmethod
+    def today():
+        """
+        한국 시간 기준 오늘 날짜를 가져옵니다.
+
+        반환값:
+            오늘 날짜 | `20241231`
+        """
+
+        return datetime.now(KST).strftime("%Y%m%d")
+
+    def __state(self, account: str):
+        # 다른 프로세스의 기록도 반영되도록 매번 데이터베이스에서 읽음
+        row = self.__connection.execute(
+            "SELECT day, voucher_lookups, charge_failures, gift_remain FROM quotas WHERE account = ?",
+            (account,)
+        ).fetchone()
+
+        # 날짜가 바뀌었다면 계정의 할당량 초기화
+        today = QuotaTracker.today()
+        if row is None or row[0] != today:
+            return {
+                "voucher_lookups": 0,
+                "charge_failures": 0,
+                "gift_remain": None
+            }
+
+        return {
+            "voucher_lookups": row[1],
+            "charge_failures": row[2],
+            "gift_remain": row[3]
+        }
+
+    @contextlib.contextmanager
+    def __update(self, account: str):
+        # 읽고 쓰는 사이에 다른 프로세스가 기록하지 못하도록 쓰기 잠금을 먼저 잡음
+        self.__connection.execute("BEGIN IMMEDIATE")
+        try:
+            state = self.__state(account)
+            yield state
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO quotas VALUES (?, ?, ?, ?, ?)",
+                (account, QuotaTracker.today(), state["voucher_lookups"], state["charge_failures"], state["gift_remain"])
+            )
+        except BaseException:
+            self.__connection.execute("ROLLBACK")
+            raise
+
+        self.__connection.execute("COMMIT")
+
+    def remaining_voucher_lookups(self, account: str):
+        """
+        오늘 남은 상품권 조회 횟수를 가져옵니다.
+
+        파라미터:
+            * account (str): 계정 ID
+
+        반환값:
+            남은 조회 횟수 (int)
+        """
+
+        return max(0, self.__voucher_lookup_limit - self.__state(account)["voucher_lookups"])
+
+    def remaining_charge_failures(self, account: str):
+        """
+        오늘 남은 충전 실패 허용 횟수를 가져옵니다.
+
+        파라미터:
+            * account (str): 계정 ID
+
+        반환값:
+            남은 충전 실패 허용 횟수 (int)
+        """
+
+        return max(0, self.__charge_failure_limit - self.__state(account)["charge_failures"])
+
+    def remaining_gift(self, account: str) -> Optional[int]:
+        """
+        남은 선물 한도를 가져옵니다.
+
+        파라미터:
+            * account (str): 계정 ID
+
+        반환값:
+            남은 선물 한도 (오늘 `get_gift_limit` 으로 확인한 적이 없다면 None)
+        """
+
+        return self.__state(account)["gift_remain"]
+
+    def check_voucher_lookup(self, account: str):
+        """
+        상품권 조회 한도가 남아있는지 확인합니다. 남아있지 않다면 오류가 발생합니다.
+
+        파라미터:
+            * account (str): 계정 ID
+        """
+
+        if self.remaining_voucher_lookups(account) == 0:
+            raise Exception("일일 조회수를 초과하셨습니다.")
+
+    def check_charge(self, account: str):
+        """
+        충전 실패 한도가 남아있는지 확인합니다. 남아있지 않다면 오류가 발생합니다.
+
+        파라미터:
+            * account (str): 계정 ID
+        """
+
+        if self.remaining_charge_failures(account) == 0:
+            raise Exception("등록제한(20번 등록실패)")
+
+    def check_gift(self, account: str, amount: int):
+        """
+        선물 한도가 충분한지 확인합니다. 부족하다면 오류가 발생합니다.
+
+        파라미터:
+            * account (str): 계정 ID
+            * amount (int): 선물할 총 금액
+        """
+
+        remain = self.remaining_gift(account)
+        if remain is not None and amount > remain:
+            raise Exception("선물 한도를 초과하였습니다.")
+
+    def record_voucher_lookup(self, account: str, exhausted = False):
+        """
+        상품권 조회 요청을 기록합니다.
+
+        파라미터:
+            * account (str): 계정 ID
+            * exhausted (bool): 서버가 일일 조회수 초과를 반환했는지 여부 (default: False)
+        """
+
+        with self.__update(account) as state:
+            state["voucher_lookups"] = self.__voucher_lookup_limit if exhausted else state["voucher_lookups"] + 1
+
+    def record_charge(self, account: str, results: list[CulturelandCharge]):
+        """
+        충전 결과를 기록합니다.
+
+        파라미터:
+            * account (str): 계정 ID
+            * results (list[CulturelandCharge]): 충전 결과
+        """
+
+        with self.__update(account) as state:
+            for result in results:
+                if result.message == "등록제한(20번 등록실패)":
+                    state["charge_failures"] = self.__charge_failure_limit
+                elif result.message == "상품권 번호 불일치":
+                    state["charge_failures"] += 1
+
+    def record_gift_limit(self, account: str, remain: int):
+        """
+        서버에서 확인한 남은 선물 한도를 기록합니다.
+
+        파라미터:
+            * account (str): 계정 ID
+            * remain (int): 남은 선물 한도
+        """
+
+        with self.__update(account) as state:
+            state["gift_remain"] = remain
+
+    def record_gift(self, account: str, amount: int):
+        """
+        선물한 금액을 남은 선물 한도에서 차감합니다.
+
+        파라미터:
+            * account (str): 계정 ID
+            * amount (int): 선물한 총 금액
+        """
+
+        with self.__update(account) as state:
+            if state["gift_remain"] is not None:
+                state["gift_remain"] = max(0, state["gift_remain"] - amount)
+
+    def reset(self, account: Optional[str] = None):
+        """
+        할당량 기록을 초기화합니다.
+
+        파라미터:
+            * account (str | None): 초기화할 계정 ID (default: 모든 계정)
+        """
+
+        if account is None:
+            self.__connection.execute("DELETE FROM quotas")
+        else:
+            self.__connection.execute("DELETE FROM quotas WHERE account = ?", (account,))
+
+    def close(self):
+        """
+        데이터베이스 연결을 닫습니다.
+        """
+
+        self.__connection.close()
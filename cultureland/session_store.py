@@ -0,0 +1,326 @@
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import sqlite3
+import tempfile
+import time
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from ._types import CulturelandUser
+
+"""
+세션 저장 포맷 버전
+저장 형식이 바뀌면 올려서 이전 버전의 세션을 무시하게 합니다.
+"""
+SESSION_STORE_VERSION = 1
+
+"""
+비밀번호 검증값을 만들 때 사용하는 PBKDF2 반복 횟수
+"""
+CREDENTIAL_ITERATIONS = 100000
+
+def create_credential(password: str):
+    """
+    세션과 함께 저장할 비밀번호 검증값을 만듭니다.
+    다른 프로세스가 저장한 세션을 재개할 때 같은 비밀번호로 로그인한 세션인지 확인하는 데 사용하며, 비밀번호는 저장하지 않습니다.
+
+    파라미터:
+        * password (str): 컬쳐랜드 비밀번호
+
+    반환값:
+        비밀번호 검증값 (`pbkdf2_sha256$반복 횟수$솔트$해시`)
+    """
+
+    salt = secrets.token_bytes(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, CREDENTIAL_ITERATIONS)
+    return f"pbkdf2_sha256${CREDENTIAL_ITERATIONS}${salt.hex()}${digest.hex()}"
+
+def verify_credential(password: str, credential: Optional[str]):
+    """
+    비밀번호가 비밀번호 검증값과 일치하는지 확인합니다.
+
+    파라미터:
+        * password (str): 컬쳐랜드 비밀번호
+        * credential (str | None): 비밀번호 검증값
+
+    반환값:
+        일치 여부 (bool, 검증값이 없거나 형식이 잘못되었다면 False)
+    """
+
+    try:
+        algorithm, iterations, salt, digest = (credential or "").split("$")
+        if algorithm != "pbkdf2_sha256":
+            return False
+
+        expected = hashlib.pbkdf2_hmac("sha256", password.encode(), bytes.fromhex(salt), int(iterations))
+        return hmac.compare_digest(expected, bytes.fromhex(digest))
+    except ValueError:
+        return False
+
+class SessionData:
+    """
+    로그인 없이 세션을 재개하는 데 필요한 정보입니다.
+    비밀번호는 저장하지 않고, 비밀번호 검증값(`create_credential`)만 저장합니다.
+    """
+
+    def __init__(self, id: str, keep_login_info: str, cookies: list[dict], user_info: Optional[CulturelandUser] = None, saved_at: Optional[float] = None, credential: Optional[str] = None):
+        self.__id = id
+        self.__keep_login_info = keep_login_info
+        self.__cookies = cookies
+        self.__user_info = user_info
+        self.__saved_at = time.time() if saved_at is None else saved_at
+        self.__credential = credential
+
+    @property
+    def id(self):
+        """
+        컬쳐랜드 ID
+        """
+        return self.__id
+
+    @property
+    def keep_login_info(self):
+        """
+        로그인 유지 쿠키
+        """
+        return self.__keep_login_info
+
+    @property
+    def cookies(self):
+        """
+        세션 쿠키 목록 (name, value, domain, path)
+        """
+        return self.__cookies
+
+    @property
+    def user_info(self):
+        """
+        유저 정보
+        """
+        return self.__user_info
+
+    @property
+    def saved_at(self):
+        """
+        저장 시각 (Unix Timestamp)
+        """
+        return self.__saved_at
+
+    @property
+    def credential(self):
+        """
+        비밀번호 검증값 (로그인 유지 쿠키로 로그인했다면 None)
+        """
+        return self.__credential
+
+    def to_json(self):
+        """
+        세션 정보를 JSON으로 변환합니다.
+        """
+
+        user_info = self.__user_info
+        return json.dumps({
+            "version": SESSION_STORE_VERSION,
+            "id": self.__id,
+            "keep_login_info": self.__keep_login_info,
+            "cookies": self.__cookies,
+            "user_info": None if user_info is None else {
+                "phone": user_info.phone,
+                "safe_level": user_info.safe_level,
+                "safe_password": user_info.safe_password,
+                "user_id": user_info.user_id,
+                "user_key": user_info.user_key,
+                "user_ip": user_info.user_ip,
+                "category": user_info.category,
+                "register_date": user_info.register_date,
+                "index": user_info.index
+            },
+            "saved_at": self.__saved_at,
+            "credential": self.__credential
+        }, ensure_ascii=False)
+
+    @staticmethod
+    def from_json(text: str):
+        """
+        JSON에서 세션 정보를 불러옵니다.
+
+        반환값:
+            세션 정보 (형식이 잘못되었거나 이전 버전이라면 None)
+        """
+
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return None # 손상된 세션
+
+        if not isinstance(data, dict) or data.get("version") != SESSION_STORE_VERSION:
+            return None # 이전 버전의 세션
+
+        try:
+            user_info = data["user_info"]
+            return SessionData(
+                id=data["id"],
+                keep_login_info=data["keep_login_info"],
+                cookies=data["cookies"],
+                user_info=None if user_info is None else CulturelandUser(**user_info),
+                saved_at=data["saved_at"],
+                credential=data.get("credential")
+            )
+        except (KeyError, TypeError):
+            return None # 필드가 빠지거나 잘못된 세션
+
+class SessionStore(ABC):
+    """
+    계정별 세션을 저장하는 저장소의 인터페이스입니다.
+    `load`, `save`, `delete` 를 구현하여 다른 저장소(Redis 등)를 사용할 수 있습니다.
+    """
+
+    @abstractmethod
+    def load(self, account: str) -> Optional[SessionData]:
+        """
+        저장된 세션을 불러옵니다.
+
+        파라미터:
+            * account (str): 계정 ID
+
+        반환값:
+            세션 정보 (저장된 세션이 없다면 None)
+        """
+
+    @abstractmethod
+    def save(self, account: str, session: SessionData):
+        """
+        세션을 저장합니다.
+
+        파라미터:
+            * account (str): 계정 ID
+            * session (SessionData): 세션 정보
+        """
+
+    @abstractmethod
+    def delete(self, account: str):
+        """
+        저장된 세션을 삭제합니다.
+
+        파라미터:
+            * account (str): 계정 ID
+        """
+
+class FileSessionStore(SessionStore):
+    """
+    계정마다 하나의 JSON 파일에 세션을 저장합니다.
+    세션 쿠키가 포함되므로 파일은 소유자만 읽을 수 있게 생성됩니다.
+    """
+
+    def __init__(self, directory: str):
+        """
+        파라미터:
+            * directory (str): 세션 파일을 저장할 디렉토리
+        """
+
+        self.__directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def directory(self):
+        """
+        세션 파일을 저장할 디렉토리
+        """
+        return self.__directory
+
+    def __path(self, account: str):
+        # 계정 ID를 파일 이름으로 그대로 쓰지 않도록 해시 사용
+        return os.path.join(self.__directory, hashlib.sha256(account.encode()).hexdigest() + ".json")
+
+    def load(self, account: str):
+        try:
+            with open(self.__path(account), "r", encoding="utf-8") as f:
+                return SessionData.from_json(f.read())
+        except OSError:
+            return None # 저장된 세션이 없는 경우
+
+    def save(self, account: str, session: SessionData):
+        # 여러 프로세스가 같은 계정을 저장해도 임시 파일이 겹치지 않도록 고유한 임시 파일 사용 (소유자만 읽기 가능)
+        fd, temp_path = tempfile.mkstemp(dir=self.__directory, prefix=".session.", suffix=".tmp")
+        try:
+            with open(fd, "w", encoding="utf-8") as f:
+                f.write(session.to_json())
+
+            os.replace(temp_path, self.__path(account))
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def delete(self, account: str):
+        try:
+            os.remove(self.__path(account))
+        except FileNotFoundError:
+            pass
+
+class SQLiteSessionStore(SessionStore):
+    """
+    SQLite 데이터베이스에 세션을 저장합니다.
+    세션 쿠키가 포함되므로 새로 만드는 데이터베이스 파일은 소유자만 읽을 수 있게 생성됩니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        파라미터:
+            * path (str): SQLite 데이터베이스 경로
+        """
+
+        self.__path = path
+
+        # SQLite는 기본 권한으로 파일을 만들므로 미리 소유자만 읽을 수 있는 빈 파일을 생성 (저널 파일도 같은 권한 사용)
+        if path != ":memory:" and not path.startswith("file:"):
+            try:
+                os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600))
+            except FileExistsError:
+                pass
+
+        self.__connection = sqlite3.connect(path)
+
+        with self.__connection:
+            self.__connection.execute("""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    account TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    saved_at REAL NOT NULL
+                )
+            """)
+
+    @property
+    def path(self):
+        """
+        SQLite 데이터베이스 경로
+        """
+        return self.__path
+
+    def load(self, account: str):
+        row = self.__connection.execute(
+            "SELECT data FROM sessions WHERE account = ?",
+            (account,)
+        ).fetchone()
+
+        return SessionData.from_json(row[0]) if row else None
+
+    def save(self, account: str, session: SessionData):
+        with self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?)",
+                (account, session.to_json(), session.saved_at)
+            )
+
+    def delete(self, account: str):
+        with self.__connection:
+            self.__connection.execute("DELETE FROM sessions WHERE account = ?", (account,))
+
+    def close(self):
+        """
+        데이터베이스 연결을 닫습니다.
+        """
+
+        self.__connection.close()
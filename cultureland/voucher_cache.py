@@ -0,0 +1,274 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import tempfile
+import time
+
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+from .pin import Pin
+from ._types import CulturelandVoucher, SpendHistory
+
+"""
+상품권 조회 캐시 포맷 버전
+저장 형식이 바뀌면 올려서 이전 버전의 디스크 캐시를 무시하게 합니다.
+"""
+VOUCHER_CACHE_VERSION = 2
+
+class VoucherCache:
+    """
+    핀번호별 상품권 조회 결과(`check_voucher`)를 캐싱합니다.
+    같은 핀번호를 동시에 조회하면 한 번만 요청하고 결과를 공유하여 일일 조회수를 아낍니다.
+    `path` 를 지정하면 디스크에도 저장하며, 핀번호는 비밀 키로 만든 HMAC-SHA256으로만 저장됩니다.
+    핀번호는 형식이 정해져 있어 단순 해시는 대입으로 되돌릴 수 있으므로, 비밀 키를 지정하지 않으면 `path + ".key"` 에 생성하여 재사용합니다.
+    캐시 파일과 키 파일은 소유자만 읽을 수 있게 생성됩니다.
+    """
+
+    def __init__(self, ttl: float = 600, path: Optional[str] = None, maxsize = 1024, secret: Optional[bytes] = None):
+        """
+        파라미터:
+            * ttl (float): 캐시 유효 시간 (초, default: 600)
+            * path (str | None): 디스크 캐시 파일 경로
+            * maxsize (int): 최대 캐시 개수 (default: 1024)
+            * secret (bytes | None): 캐시 키를 만들 비밀 키 (default: `path + ".key"` 에 저장된 키, path가 없다면 임의의 키)
+        """
+
+        if maxsize < 1:
+            raise ValueError("maxsize는 1 이상이어야 합니다.")
+
+        self.__ttl = ttl
+        self.__path = path
+        self.__maxsize = maxsize
+        self.__secret = secret or (VoucherCache.__load_secret(path + ".key") if path else secrets.token_bytes(32))
+        self.__entries: OrderedDict[str, tuple[float, CulturelandVoucher]] = OrderedDict()
+        self.__in_flight: dict[str, asyncio.Task[CulturelandVoucher]] = {}
+        self.__hits = 0
+        self.__misses = 0
+
+        if path:
+            self.__load()
+
+    @property
+    def ttl(self):
+        """
+        캐시 유효 시간 (초)
+        """
+        return self.__ttl
+
+    @property
+    def hits(self):
+        """
+        캐시 적중 횟수 (진행 중인 요청 공유 포함)
+        """
+        return self.__hits
+
+    @property
+    def misses(self):
+        """
+        실제 조회 요청 횟수
+        """
+        return self.__misses
+
+    @property
+    def size(self):
+        """
+        캐시된 상품권 수
+        """
+        return len(self.__entries)
+
+    def key(self, pin: Pin):
+        """
+        핀번호의 캐시 키를 생성합니다.
+
+        파라미터:
+            * pin (Pin): 상품권의 핀번호
+
+        반환값:
+            비밀 키로 만든 핀번호의 HMAC-SHA256 (str)
+        """
+
+        return hmac.new(self.__secret, str(pin).encode(), hashlib.sha256).hexdigest()
+
+    @staticmethod
+    def __load_secret(path: str):
+        try:
+            with open(path, "rb") as f:
+                secret = f.read()
+            if len(secret) >= 32:
+                return secret
+        except FileNotFoundError:
+            pass
+
+        # 임시 파일에 쓴 뒤 링크하여, 여러 프로세스가 동시에 만들어도 먼저 만든 키 하나만 사용
+        secret = secrets.token_bytes(32)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".voucher_cache_key.")
+        try:
+            with open(fd, "wb") as f:
+                f.write(secret)
+
+            try:
+                os.link(temp_path, path)
+            except FileExistsError:
+                with open(path, "rb") as f:
+                    return f.read()
+        finally:
+            os.remove(temp_path)
+
+        return secret
+
+    def get(self, pin: Pin):
+        """
+        유효한 캐시가 있다면 상품권 정보를 반환합니다.
+
+        파라미터:
+            * pin (Pin): 상품권의 핀번호
+
+        반환값:
+            상품권 정보 (CulturelandVoucher | None)
+        """
+
+        key = self.key(pin)
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+
+        if time.time() - entry[0] > self.__ttl:
+            del self.__entries[key]
+            return None
+
+        self.__entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, pin: Pin, voucher: CulturelandVoucher):
+        """
+        상품권 정보를 캐시에 저장합니다.
+
+        파라미터:
+            * pin (Pin): 상품권의 핀번호
+            * voucher (CulturelandVoucher): 상품권 정보
+        """
+
+        key = self.key(pin)
+        self.__entries[key] = (time.time(), voucher)
+        self.__entries.move_to_end(key)
+
+        while len(self.__entries) > self.__maxsize:
+            self.__entries.popitem(last=False)
+
+        if self.__path:
+            self.__save()
+
+    def invalidate(self, pin: Pin):
+        """
+        상품권 정보를 캐시에서 제거합니다. 충전 등으로 잔액이 바뀐 경우 사용합니다.
+
+        파라미터:
+            * pin (Pin): 상품권의 핀번호
+        """
+
+        if self.__entries.pop(self.key(pin), None) is not None and self.__path:
+            self.__save()
+
+    def clear(self):
+        """
+        캐시를 비웁니다.
+        """
+
+        self.__entries.clear()
+
+        if self.__path and os.path.exists(self.__path):
+            os.remove(self.__path)
+
+    async def get_or_fetch(self, pin: Pin, fetch: Callable[[], Awaitable[CulturelandVoucher]]):
+        """
+        캐시된 상품권 정보를 반환하거나, 없다면 조회하여 저장합니다.
+        같은 핀번호의 조회가 진행 중이라면 새로 요청하지 않고 그 결과를 기다립니다.
+
+        파라미터:
+            * pin (Pin): 상품권의 핀번호
+            * fetch (Callable[[], Awaitable[CulturelandVoucher]]): 상품권 정보를 조회하는 함수
+
+        반환값:
+            상품권 정보 (CulturelandVoucher)
+        """
+
+        voucher = self.get(pin)
+        if voucher is not None:
+            self.__hits += 1
+            return voucher
+
+        key = self.key(pin)
+        task = self.__in_flight.get(key)
+        if task is not None:
+            self.__hits += 1
+        else:
+            self.__misses += 1
+            task = asyncio.ensure_future(self.__fetch(pin, key, fetch))
+            self.__in_flight[key] = task
+
+        # 기다리던 호출이 취소되어도 다른 호출의 조회는 계속되도록 shield
+        return await asyncio.shield(task)
+
+    async def __fetch(self, pin: Pin, key: str, fetch: Callable[[], Awaitable[CulturelandVoucher]]):
+        try:
+            voucher = await fetch()
+            self.set(pin, voucher)
+            return voucher
+        finally:
+            del self.__in_flight[key]
+
+    def __load(self):
+        try:
+            with open(self.__path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return # 캐시 파일이 없거나 손상된 경우
+
+        if not isinstance(data, dict) or data.get("version") != VOUCHER_CACHE_VERSION:
+            return # 이전 버전의 캐시
+
+        now = time.time()
+        for key, entry in data["entries"].items():
+            if now - entry["timestamp"] > self.__ttl:
+                continue # 만료된 캐시
+
+            self.__entries[key] = (entry["timestamp"], CulturelandVoucher(
+                amount=entry["amount"],
+                balance=entry["balance"],
+                cert_no=entry["cert_no"],
+                created_date=entry["created_date"],
+                expiry_date=entry["expiry_date"],
+                spend_history=[SpendHistory(*history) for history in entry["spend_history"]]
+            ))
+
+    def __save(self):
+        # 여러 프로세스가 같은 캐시 파일을 저장해도 임시 파일이 겹치지 않도록 고유한 임시 파일 사용 (소유자만 읽기 가능)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.__path)), prefix=".voucher_cache.")
+        try:
+            with open(fd, "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": VOUCHER_CACHE_VERSION,
+                    "entries": {
+                        key: {
+                            "timestamp": timestamp,
+                            "amount": voucher.amount,
+                            "balance": voucher.balance,
+                            "cert_no": voucher.cert_no,
+                            "created_date": voucher.created_date,
+                            "expiry_date": voucher.expiry_date,
+                            "spend_history": [
+                                (history.title, history.merchant_name, history.amount, history.timestamp)
+                                for history in voucher.spend_history
+                            ]
+                        }
+                        for key, (timestamp, voucher) in self.__entries.items()
+                    }
+                }, f, ensure_ascii=False)
+
+            os.replace(temp_path, self.__path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
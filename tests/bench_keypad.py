@@ -0,0 +1,75 @@
+"""
+키패드 사진 분석(칸별 해시 계산)의 이전 구현과 `get_key_hashes` 의 속도와 메모리 할당을 비교합니다.
+사진은 `tests/keypads` 의 키패드 사진을 사용하며, 서버가 팔레트(P) 사진을 내려주는 경우도 함께 측정합니다.
+
+pip install -e . && python tests/bench_keypad.py
+"""
+
+import hashlib
+import os
+import timeit
+import tracemalloc
+
+from io import BytesIO
+from typing import Literal
+from PIL import Image
+from cultureland.mTranskey.keypad import KEY_BOXES, get_key_hashes
+
+KEYPADS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "keypads")
+
+def get_key_hashes_old(key_image: Image.Image, keyboard_type: Literal["qwerty", "number"]):
+    # 이전 구현: 칸마다 잘라낸 사진을 BMP로 저장한 뒤 해싱
+    key_hashes: list[str] = []
+    for box in KEY_BOXES[keyboard_type]:
+        key_img_bytes = BytesIO()
+        key_image.crop(box).save(key_img_bytes, "BMP")
+        key_hashes.append(hashlib.md5(key_img_bytes.getvalue()).hexdigest())
+
+    return key_hashes
+
+def load_keypad(keyboard_type: str, mode: str):
+    with open(os.path.join(KEYPADS, f"{keyboard_type}_0.png"), "rb") as f:
+        key_image = Image.open(BytesIO(f.read()))
+
+    if mode == "P":
+        key_image = key_image.convert("P", palette=Image.Palette.ADAPTIVE)
+
+    # PNG로 다시 저장하여 실제 응답처럼 디코딩부터 측정
+    content = BytesIO()
+    key_image.save(content, "PNG")
+    return content.getvalue()
+
+def decode_and_hash(content: bytes, keyboard_type: str, hash_keys):
+    return hash_keys(Image.open(BytesIO(content)), keyboard_type)
+
+def measure_peak(content: bytes, keyboard_type: str, hash_keys):
+    decode_and_hash(content, keyboard_type, hash_keys) # 모듈, 코덱 초기화 제외
+
+    # 디코딩부터 해싱까지 Python 할당(PIL 사진 객체 포함)의 최대 사용량
+    tracemalloc.start()
+    decode_and_hash(content, keyboard_type, hash_keys)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak
+
+def main():
+    # decode: PNG 디코딩부터 해싱까지 / hash: 디코딩된 사진의 해싱만
+    print(f"{'keypad':<10} {'mode':<4} {'impl':<14} {'decode (ms)':>12} {'hash (ms)':>10} {'peak (KB)':>10}")
+
+    for keyboard_type in ["number", "qwerty"]:
+        for mode in ["RGB", "P"]:
+            content = load_keypad(keyboard_type, mode)
+            key_image = Image.open(BytesIO(content))
+            key_image.load()
+            assert decode_and_hash(content, keyboard_type, get_key_hashes) == decode_and_hash(content, keyboard_type, get_key_hashes_old)
+
+            for name, hash_keys in [("old (BMP)", get_key_hashes_old), ("get_key_hashes", get_key_hashes)]:
+                runs = 200
+                elapsed = min(timeit.repeat(lambda: decode_and_hash(content, keyboard_type, hash_keys), number=runs, repeat=7)) / runs
+                hash_elapsed = min(timeit.repeat(lambda: hash_keys(key_image, keyboard_type), number=runs, repeat=7)) / runs
+                peak = measure_peak(content, keyboard_type, hash_keys)
+                print(f"{keyboard_type:<10} {mode:<4} {name:<14} {elapsed * 1000:>12.3f} {hash_elapsed * 1000:>10.3f} {peak / 1024:>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+SEED 암호화 구현별 속도를 비교하고, 입력 수별로 `SeedEncBatch` 가 스칼라 구현보다 빨라지는 지점을 찾습니다.
+
+pip install -e .[numpy] && python tests/bench_seed.py
+"""
+
+import random
+import timeit
+
+from cultureland.mTranskey.seed import Seed
+
+SIZES = [1, 5, 10, 20, 50, 100, 500]
+
+def measure(case, size: int):
+    # 한 번에 최소 약 0.2초 동안 실행하여 작은 입력의 측정 오차를 줄임
+    runs = max(1, 2000 // size)
+    return min(timeit.repeat(case, number=runs, repeat=3)) / runs
+
+def main():
+    rng = random.Random(0)
+    session_key = [rng.randrange(16) for _ in range(16)]
+    round_key = Seed.SeedRoundKeyFast(session_key)
+
+    try:
+        import numpy # noqa: F401
+        has_numpy = True
+    except ImportError:
+        has_numpy = False
+
+    # 구현별 입력 하나당 시간
+    geos = [f"{rng.randrange(1000)} {rng.randrange(1000)}" for _ in range(100)]
+    cases = {
+        "SeedEnc (slow)": lambda: [Seed.SeedEnc(geo, session_key, fast=False) for geo in geos],
+        "SeedEnc (fast)": lambda: [Seed.SeedEnc(geo, session_key) for geo in geos],
+        "SeedEnc (fast, roundKey)": lambda: [Seed.SeedEnc(geo, roundKey=round_key) for geo in geos]
+    }
+    if has_numpy:
+        cases["SeedEncBatch"] = lambda: Seed.SeedEncBatch(geos, round_key)
+
+    for name, case in cases.items():
+        elapsed = measure(case, len(geos))
+        print(f"{name:<28} {elapsed * 1000:8.2f} ms / {len(geos)} keys ({elapsed / len(geos) * 1e6:.1f} us/key)")
+
+    if not has_numpy:
+        print("\nnumpy가 설치되어 있지 않아 입력 수별 비교를 건너뜁니다.")
+        return
+
+    # 입력 수별 스칼라 구현(미리 만든 라운드 키 사용)과 배치 구현 비교
+    print(f"\n{'N':>5} {'scalar (ms)':>12} {'batch (ms)':>12} {'speedup':>8}")
+    crossover = None
+    for size in SIZES:
+        sized_geos = [f"{rng.randrange(1000)} {rng.randrange(1000)}" for _ in range(size)]
+        scalar = measure(lambda: [Seed.SeedEnc(geo, roundKey=round_key) for geo in sized_geos], size)
+        batch = measure(lambda: Seed.SeedEncBatch(sized_geos, round_key), size)
+
+        if crossover is None and batch < scalar:
+            crossover = size
+
+        print(f"{size:>5} {scalar * 1000:>12.3f} {batch * 1000:>12.3f} {scalar / batch:>7.2f}x")
+
+    print(f"\nSeedEncBatch가 더 빨라지는 입력 수: {crossover if crossover else f'{SIZES[-1]}개 초과'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+import pytest
+
+@pytest.fixture
+def anyio_backend():
+    # 비동기 테스트는 httpx가 의존하는 anyio의 pytest 플러그인으로 asyncio에서 실행
+    return "asyncio"
@@ -0,0 +1,96 @@
+"""
+`test_matcher.py` 에서 사용하는 키패드 사진을 생성합니다.
+칸의 위치와 크기는 실제 키패드와 같고(`KEY_BOXES`), 키는 7-세그먼트 모양으로 그립니다.
+잡음이 섞인 사진은 테스트에서 직접 만듭니다.
+
+    python tests/keypads/generate.py
+"""
+
+import json
+import os
+import random
+from PIL import Image, ImageDraw
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+SIZES = {
+    "number": (640, 306),
+    "qwerty": (594, 320)
+}
+
+# 세그먼트: a(위), b(오른쪽 위), c(오른쪽 아래), d(아래), e(왼쪽 아래), f(왼쪽 위), g(가운데)
+DIGIT_SEGMENTS = ["abcdef", "bc", "abdeg", "abcdg", "bcfg", "acdfg", "acdefg", "abc", "abcdefg", "abcdfg"]
+
+# qwerty 키패드는 빈 칸을 제외한 키 순서가 고정되어 있으므로 키 번호별로 같은 모양을 사용
+_rng = random.Random(0)
+KEY_SEGMENTS = ["".join(segment for segment in "abcdefg" if _rng.random() < 0.6) or "g" for _ in range(41)]
+
+def draw_segments(draw: ImageDraw.ImageDraw, x: int, y: int, width: int, height: int, segments: str, thickness: int):
+    half = height // 2
+    rectangles = {
+        "a": (x, y, x + width, y + thickness),
+        "b": (x + width - thickness, y, x + width, y + half),
+        "c": (x + width - thickness, y + half, x + width, y + height),
+        "d": (x, y + height - thickness, x + width, y + height),
+        "e": (x, y + half, x + thickness, y + height),
+        "f": (x, y, x + thickness, y + half),
+        "g": (x, y + half - thickness // 2, x + width, y + half + thickness - thickness // 2)
+    }
+    for segment in segments:
+        draw.rectangle(rectangles[segment], fill=(40, 40, 40))
+
+def draw_number_keypad(layout: list[int]):
+    image = Image.new("RGB", SIZES["number"], (255, 255, 255))
+    draw = ImageDraw.Draw(image)
+    for i, key in enumerate(layout):
+        x, y = i % 4, i // 4
+        draw.rectangle((x * 160 + 2, y * 102 + 2, x * 160 + 157, y * 102 + 99), outline=(200, 200, 200))
+        if key != 10: # 빈 칸
+            draw_segments(draw, x * 160 + 72, y * 102 + 47, 16, 21, DIGIT_SEGMENTS[key], 3)
+
+    return image
+
+def draw_qwerty_keypad(layout: list[int]):
+    image = Image.new("RGB", SIZES["qwerty"], (255, 255, 255))
+    draw = ImageDraw.Draw(image)
+    cells = [(x, y) for y in range(4) for x in range(11) if not ((x == 0 and y == 3) or ((x == 9 or x == 10) and y == 3))]
+    for (x, y), key in zip(cells, layout):
+        if key == -1: # 빈 칸
+            continue
+
+        draw.rectangle((x * 54 + 4, y * 80 + 4, x * 54 + 50, y * 80 + 76), fill=(220, 220, 220))
+        draw_segments(draw, x * 54 + 24, y * 80 + 35, 11, 35, KEY_SEGMENTS[key], 1)
+
+    return image
+
+def main():
+    rng = random.Random(20261017)
+    layouts: dict[str, dict[str, list[int]]] = { "number": {}, "qwerty": {} }
+
+    for i in range(4):
+        layout = list(range(11)) + [10]
+        rng.shuffle(layout)
+        layouts["number"][f"number_{i}.png"] = layout
+
+    for i in range(2):
+        blanks = set(rng.sample(range(41), 4))
+        layout: list[int] = []
+        key = 0
+        for j in range(41):
+            if j in blanks:
+                layout.append(-1)
+            else:
+                layout.append(key)
+                key += 1
+        layouts["qwerty"][f"qwerty_{i}.png"] = layout
+
+    for keyboard_type, files in layouts.items():
+        for name, layout in files.items():
+            image = draw_number_keypad(layout) if keyboard_type == "number" else draw_qwerty_keypad(layout)
+            image.save(os.path.join(DIRECTORY, name))
+
+    with open(os.path.join(DIRECTORY, "layouts.json"), "w") as f:
+        json.dump(layouts, f, indent=4)
+
+if __name__ == "__main__":
+    main()
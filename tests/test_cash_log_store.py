@@ -0,0 +1,131 @@
+import time
+import pytest
+
+from cultureland import CashLogStore, CulturelandCashLog
+
+pytestmark = pytest.mark.anyio
+
+DAY = 86400
+
+def create_cash_log(days_ago: float, amount = 1000, balance = 0):
+    return CulturelandCashLog(
+        title="충전",
+        merchant_code="M0001",
+        merchant_name="컬쳐랜드",
+        amount=amount,
+        balance=balance,
+        spend_type="충전",
+        timestamp=int(time.time() - days_ago * DAY)
+    )
+
+class FakeClient:
+    """
+    `iter_culture_cash_logs` 만 흉내내는 클라이언트
+    """
+
+    id = "user"
+
+    def __init__(self, cash_logs: list[CulturelandCashLog]):
+        self.cash_logs = cash_logs
+        self.requested_days: list[int] = []
+        self.closed = 0
+        self.fail_after: int | None = None # 이 개수만큼 반환한 뒤 실패
+        self.repeat_page_boundary = False # 페이지 사이에 새 내역이 생겨 이전 페이지의 마지막 내역이 다시 나오는 경우
+        self.iterators = [] # 가비지 컬렉션으로 닫히지 않도록 참조 유지
+
+    def iter_culture_cash_logs(self, days: int, page_size = 20):
+        iterator = self.__iter_culture_cash_logs(days, page_size)
+        self.iterators.append(iterator)
+        return iterator
+
+    async def __iter_culture_cash_logs(self, days: int, page_size: int):
+        self.requested_days.append(days)
+        cutoff = time.time() - days * DAY
+        cash_logs = sorted((cash_log for cash_log in self.cash_logs if cash_log.timestamp >= cutoff), key=lambda cash_log: -cash_log.timestamp)
+
+        try:
+            for i, cash_log in enumerate(cash_logs):
+                if self.fail_after is not None and i == self.fail_after:
+                    raise Exception("잘못된 응답이 반환되었습니다.")
+
+                yield cash_log
+                if self.repeat_page_boundary and (i + 1) % page_size == 0:
+                    yield cash_log
+        finally:
+            self.closed += 1
+
+async def test_first_sync_uses_days():
+    store = CashLogStore()
+    client = FakeClient([create_cash_log(1), create_cash_log(20), create_cash_log(40)])
+
+    assert await store.sync(client) == 2
+    assert client.requested_days == [30]
+    assert store.high_water_mark("user") == client.cash_logs[0].timestamp
+
+async def test_sync_after_long_gap():
+    store = CashLogStore()
+    client = FakeClient([create_cash_log(50)])
+    assert await store.sync(client, days=60) == 1
+
+    # 동기화가 30일 넘게 멈춘 사이 생긴 내역도 모두 가져옴
+    client.cash_logs += [create_cash_log(45, amount=2000), create_cash_log(1, amount=3000)]
+    assert await store.sync(client) == 2
+    assert client.requested_days[-1] >= 51
+    assert [cash_log.amount for cash_log in store.query("user")] == [3000, 2000, 1000]
+    assert store.high_water_mark("user") == client.cash_logs[2].timestamp
+
+async def test_sync_stops_at_high_water_mark_and_closes():
+    store = CashLogStore()
+    client = FakeClient([create_cash_log(10 + i * 0.3, amount=i) for i in range(5)])
+    await store.sync(client)
+
+    client.cash_logs.append(create_cash_log(1, amount=100))
+    assert await store.sync(client, page_size=2) == 1
+
+    # 오래된 내역에서 멈췄을 때도 내역 iterator가 바로 닫힘
+    assert client.closed == 2
+    assert len(store.query("user")) == 6
+
+async def test_page_boundary_dedupe():
+    store = CashLogStore()
+    # 같은 시각의 서로 다른 내역 포함
+    client = FakeClient([create_cash_log(1, amount=i, balance=i) for i in range(25)])
+    client.repeat_page_boundary = True
+
+    assert await store.sync(client, page_size=10) == 25
+    assert len(store.query("user")) == 25
+
+    # 최근 내역 시각과 같은 시각의 내역은 다시 내려오지만 중복 저장되지 않음
+    assert await store.sync(client, page_size=10) == 0
+    assert len(store.query("user")) == 25
+
+async def test_partial_failure_retry():
+    store = CashLogStore()
+    client = FakeClient([create_cash_log(20)])
+    await store.sync(client)
+    high_water_mark = store.high_water_mark("user")
+
+    client.cash_logs += [create_cash_log(10 - i * 0.1, amount=i) for i in range(30)]
+    client.fail_after = 15
+    with pytest.raises(Exception):
+        await store.sync(client, page_size=10)
+
+    # 실패하면 최근 내역 시각을 갱신하지 않음
+    assert store.high_water_mark("user") == high_water_mark
+    assert client.closed == 2
+
+    client.fail_after = None
+    await store.sync(client, page_size=10)
+    assert len(store.query("user")) == 31
+    assert store.high_water_mark("user") == max(cash_log.timestamp for cash_log in client.cash_logs)
+
+async def test_query_filters():
+    store = CashLogStore()
+    client = FakeClient([create_cash_log(5, amount=1000), create_cash_log(3, amount=2000), create_cash_log(1, amount=1000)])
+    await store.sync(client)
+
+    assert [cash_log.amount for cash_log in store.query("user", amount=1000)] == [1000, 1000]
+    assert len(store.query("user", since=client.cash_logs[1].timestamp)) == 2
+    assert len(store.query("user", until=client.cash_logs[1].timestamp)) == 2
+    assert len(store.query("user", limit=1)) == 1
+    assert store.query("other") == []
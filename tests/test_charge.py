@@ -0,0 +1,152 @@
+import asyncio
+import math
+import random
+import httpx
+import pytest
+
+from cultureland import Cultureland, CulturelandCharge, Pin, PreparedCharge
+
+pytestmark = pytest.mark.anyio
+
+def mobile_pins(count: int, start = 0):
+    return [Pin(f"3110-0123-4567-{i:04d}") for i in range(start, start + count)]
+
+def online_pins(count: int, start = 0):
+    return [Pin(f"2000-0123-4567-{i:06d}") for i in range(start, start + count)]
+
+def create_client():
+    def handler(request: httpx.Request):
+        if request.url.path == "/mmb/isLogin.json":
+            return httpx.Response(200, json=True)
+        return httpx.Response(404)
+
+    return Cultureland(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+class FakeCharger:
+    """
+    `prepare_charge` 와 `__submit_charge` 를 대신하여 호출 순서를 기록합니다.
+    """
+
+    def __init__(self, prepare_delay = 0.0, submit_delay = 0.0, fail_submit: int | None = None, first_prepare_delay: float | None = None):
+        self.prepare_delay = prepare_delay
+        self.first_prepare_delay = prepare_delay if first_prepare_delay is None else first_prepare_delay
+        self.submit_delay = submit_delay
+        self.fail_submit = fail_submit # 이 번째 제출에서 실패
+        self.events: list[tuple[str, int]] = []
+        self.batches: list[PreparedCharge] = []
+        self.submitted: list[PreparedCharge] = []
+        self.tasks: list[asyncio.Task] = []
+
+    def install(self, monkeypatch):
+        charger = self
+
+        async def prepare_charge(self, *pins: Pin, ttl: float = 300):
+            charger.tasks.append(asyncio.current_task())
+            index = len(charger.batches)
+            prepared = PreparedCharge(pins, all(len(pin.parts[3]) == 4 for pin in pins), {}, ttl)
+            charger.batches.append(prepared)
+
+            charger.events.append(("prepare_start", index))
+            try:
+                await asyncio.sleep(charger.first_prepare_delay if index == 0 else charger.prepare_delay)
+            except asyncio.CancelledError:
+                charger.events.append(("prepare_cancelled", index))
+                raise
+            charger.events.append(("prepare_end", index))
+            return prepared
+
+        async def submit_charge(self, prepared: PreparedCharge):
+            prepared.consume()
+            index = len(charger.submitted)
+            charger.submitted.append(prepared)
+
+            charger.events.append(("submit_start", index))
+            await asyncio.sleep(charger.submit_delay)
+            if index == charger.fail_submit:
+                raise Exception("잘못된 응답이 반환되었습니다.")
+            charger.events.append(("submit_end", index))
+            return [CulturelandCharge("충전 완료", 1000, pin) for pin in prepared.pins]
+
+        monkeypatch.setattr(Cultureland, "prepare_charge", prepare_charge)
+        monkeypatch.setattr(Cultureland, "_Cultureland__submit_charge", submit_charge)
+        return self
+
+async def charge_all(pins):
+    return [result async for result in create_client().charge_many(pins)]
+
+@pytest.mark.parametrize("mobile, online, sizes", [
+    (25, 0, [10, 10, 5]),
+    (0, 23, [10, 10, 3]),
+    (20, 0, [10, 10]),
+    (8, 7, [10, 5]), # 문화상품권 7개와 모바일문화상품권 3개를 함께 충전
+    (20, 5, [10, 10, 5]),
+    (15, 13, [10, 10, 8])
+])
+async def test_batch_packing(monkeypatch, mobile, online, sizes):
+    charger = FakeCharger().install(monkeypatch)
+    pins = mobile_pins(mobile) + online_pins(online)
+    random.Random(mobile * 100 + online).shuffle(pins)
+
+    results = await charge_all(pins)
+
+    assert sorted(len(prepared.pins) for prepared in charger.submitted) == sorted(sizes)
+    assert len(charger.submitted) == math.ceil(len(pins) / 10)
+    assert sorted(str(result.pin) for result in results) == sorted(str(pin) for pin in pins)
+
+    # 문화상품권(18자리)은 모바일문화상품권 전용 페이지로 충전하지 않음
+    for prepared in charger.submitted:
+        assert prepared.only_mobile_vouchers == all(len(pin.parts[3]) == 4 for pin in prepared.pins)
+
+async def test_async_iterable_input(monkeypatch):
+    charger = FakeCharger().install(monkeypatch)
+
+    async def pins():
+        for pin in mobile_pins(12):
+            await asyncio.sleep(0)
+            yield pin
+
+    results = await charge_all(pins())
+    assert len(results) == 12
+    assert [len(prepared.pins) for prepared in charger.submitted] == [10, 2]
+
+async def test_invalid_pin(monkeypatch):
+    FakeCharger().install(monkeypatch)
+
+    class InvalidPin:
+        parts = None
+
+    with pytest.raises(ValueError):
+        await charge_all([InvalidPin()])
+
+async def test_prepare_overlaps_submit(monkeypatch):
+    charger = FakeCharger(prepare_delay=0.02, submit_delay=0.05).install(monkeypatch)
+    await charge_all(mobile_pins(30))
+
+    events = charger.events
+    for i in range(2):
+        # 다음 묶음의 암호화는 현재 묶음의 충전이 끝나기 전에 시작
+        assert events.index(("prepare_start", i + 1)) < events.index(("submit_end", i))
+
+async def test_early_close_cancels_preparation(monkeypatch):
+    # 첫 묶음은 바로 준비되고, 다음 묶음은 첫 결과를 받은 뒤에도 준비 중
+    charger = FakeCharger(prepare_delay=0.2, first_prepare_delay=0).install(monkeypatch)
+
+    charges = create_client().charge_many(mobile_pins(30))
+    first = await charges.__anext__()
+    assert str(first.pin) == "3110-0123-4567-0000"
+    await charges.aclose()
+
+    assert len(charger.submitted) == 1
+    assert all(task.done() for task in charger.tasks)
+    assert ("prepare_cancelled", 1) in charger.events
+
+async def test_submit_error_cancels_preparation(monkeypatch):
+    charger = FakeCharger(prepare_delay=0.2, first_prepare_delay=0, fail_submit=0).install(monkeypatch)
+
+    charges = create_client().charge_many(mobile_pins(30))
+    with pytest.raises(Exception):
+        await charges.__anext__()
+
+    assert len(charger.submitted) == 1
+    assert all(task.done() for task in charger.tasks)
+    assert ("prepare_cancelled", 1) in charger.events
@@ -0,0 +1,220 @@
+import asyncio
+import hashlib
+import os
+import time
+import httpx
+import pytest
+
+from cultureland import Cultureland, CulturelandLogin, CulturelandUser, LoginCoordinator, SessionData, SQLiteSessionStore
+from cultureland.login_coordinator import LOCK_POLL_INTERVAL, lock_file, unlock_file
+from cultureland.session_store import create_credential
+
+pytestmark = pytest.mark.anyio
+
+PASSWORD = "correct"
+
+def create_session(id = "user", credential: str | None = None, saved_at: float | None = None):
+    return SessionData(
+        id=id,
+        keep_login_info="KEEP",
+        cookies=[{ "name": "SESSION", "value": "abc", "domain": "m.cultureland.co.kr", "path": "/" }],
+        saved_at=saved_at,
+        credential=credential
+    )
+
+def create_client(**kwargs):
+    def handler(request: httpx.Request):
+        if request.url.path == "/mmb/isLogin.json":
+            return httpx.Response(200, json="SESSION=abc" in (request.headers.get("cookie") or ""))
+        return httpx.Response(404)
+
+    return Cultureland(httpx.AsyncClient(transport=httpx.MockTransport(handler)), **kwargs)
+
+@pytest.fixture
+def logins(monkeypatch):
+    """
+    실제 요청 대신 호출을 기록하고, 비밀번호가 틀리면 오류가 발생하는 로그인
+    """
+
+    calls: list[tuple[str, str | None]] = []
+
+    async def login(self: Cultureland, id: str, password: str | None):
+        calls.append((id, password))
+        await asyncio.sleep(0.05)
+        if password is not None and password != PASSWORD:
+            raise Exception("아이디 또는 비밀번호가 일치하지 않습니다.")
+
+        user_id = id if password is not None else "keep_user"
+        self._Cultureland__id = user_id
+        self._Cultureland__password = password
+        self._Cultureland__keep_login_info = "KEEP"
+        self._Cultureland__user_info = CulturelandUser("01000000000", 1, True, user_id, 1, "127.0.0.1", "0")
+        self.client.cookies.set("SESSION", "abc", "m.cultureland.co.kr", "/")
+        return CulturelandLogin(user_id, "KEEP")
+
+    monkeypatch.setattr(Cultureland, "_Cultureland__login", login)
+    return calls
+
+async def test_same_credentials_share_one_login():
+    coordinator = LoginCoordinator()
+    calls = 0
+    adopted = []
+
+    async def login():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return CulturelandLogin("user", "KEEP"), create_session()
+
+    owner = object()
+    results = await asyncio.gather(
+        coordinator.run(owner, "user", login, credential=PASSWORD),
+        *[coordinator.run(object(), "user", login, adopt=adopted.append, credential=PASSWORD) for _ in range(3)]
+    )
+
+    assert calls == 1
+    assert len(adopted) == 3
+    assert all(result.user_id == "user" for result in results)
+
+async def test_password_mismatch_runs_separate_login():
+    coordinator = LoginCoordinator()
+    adopted = []
+
+    async def login(password: str):
+        await asyncio.sleep(0.05)
+        if password != PASSWORD:
+            raise Exception("아이디 또는 비밀번호가 일치하지 않습니다.")
+        return CulturelandLogin("user", "KEEP"), create_session()
+
+    correct, wrong = await asyncio.gather(
+        coordinator.run(object(), "user", lambda: login(PASSWORD), adopt=adopted.append, credential=PASSWORD),
+        coordinator.run(object(), "user", lambda: login("WRONG"), adopt=adopted.append, credential="WRONG"),
+        return_exceptions=True
+    )
+
+    assert isinstance(correct, CulturelandLogin)
+    assert isinstance(wrong, Exception)
+    assert adopted == [] # 각자 로그인했으므로 세션을 가져오지 않음
+
+async def test_password_mismatch_on_client(logins):
+    coordinator = LoginCoordinator()
+    correct, wrong = create_client(login_coordinator=coordinator), create_client(login_coordinator=coordinator)
+
+    results = await asyncio.gather(
+        correct.login("user", PASSWORD),
+        wrong.login("user", "WRONG"),
+        return_exceptions=True
+    )
+
+    assert isinstance(results[0], CulturelandLogin)
+    assert isinstance(results[1], Exception)
+    assert sorted(logins) == [("user", "WRONG"), ("user", PASSWORD)]
+    assert await correct.is_login()
+    assert not await wrong.is_login()
+
+async def test_cancelled_caller_does_not_cancel_login():
+    coordinator = LoginCoordinator()
+    started = asyncio.Event()
+    calls = 0
+
+    async def login():
+        nonlocal calls
+        calls += 1
+        started.set()
+        await asyncio.sleep(0.05)
+        return CulturelandLogin("user", "KEEP"), create_session()
+
+    owner = asyncio.ensure_future(coordinator.run(object(), "user", login, credential=PASSWORD))
+    await started.wait()
+    waiter = asyncio.ensure_future(coordinator.run(object(), "user", login, adopt=lambda session: None, credential=PASSWORD))
+    await asyncio.sleep(0)
+
+    # 처음 로그인을 시작한 호출이 취소되어도 기다리는 호출은 결과를 받음
+    owner.cancel()
+    result = await waiter
+    assert result.user_id == "user"
+    assert calls == 1
+
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+
+    # 끝난 로그인은 다시 공유되지 않음
+    await coordinator.run(object(), "user", login, adopt=lambda session: None, credential=PASSWORD)
+    assert calls == 2
+
+async def test_keep_login_clients_share_one_login(logins):
+    coordinator = LoginCoordinator()
+    clients = [create_client(login_coordinator=coordinator) for _ in range(4)]
+
+    await asyncio.gather(*[client.login("KEEP_COOKIE") for client in clients])
+    assert logins == [("KEEP_COOKIE", None)]
+    assert all([await client.is_login() for client in clients])
+    assert all(client.id == "keep_user" for client in clients)
+
+    # 다른 로그인 유지 쿠키는 따로 로그인
+    await asyncio.gather(clients[0].login("KEEP_COOKIE"), clients[1].login("OTHER_COOKIE"))
+    assert sorted(logins[1:]) == [("KEEP_COOKIE", None), ("OTHER_COOKIE", None)]
+
+async def test_resume_checks_password(logins, tmp_path):
+    store = SQLiteSessionStore(":memory:")
+    coordinator = LoginCoordinator(str(tmp_path))
+
+    # 다른 프로세스가 로그인을 기다리는 동안 저장한 세션
+    store.save("user", create_session(credential=create_credential(PASSWORD), saved_at=time.time() + 60))
+
+    wrong = create_client(login_coordinator=coordinator, session_store=store)
+    with pytest.raises(Exception):
+        await wrong.login("user", "WRONG")
+    assert logins == [("user", "WRONG")] # 저장된 세션을 재개하지 않고 직접 로그인
+
+    correct = create_client(login_coordinator=coordinator, session_store=store)
+    result = await correct.login("user", PASSWORD)
+    assert result.user_id == "user"
+    assert logins == [("user", "WRONG")] # 저장된 세션으로 재개
+    assert correct.password == PASSWORD
+
+async def test_resume_ignores_session_without_credential(logins, tmp_path):
+    store = SQLiteSessionStore(":memory:")
+    coordinator = LoginCoordinator(str(tmp_path))
+    store.save("user", create_session(saved_at=time.time() + 60))
+
+    client = create_client(login_coordinator=coordinator, session_store=store)
+    await client.login("user", PASSWORD)
+    assert logins == [("user", PASSWORD)]
+
+async def test_cancel_while_waiting_for_file_lock(tmp_path):
+    coordinator = LoginCoordinator(str(tmp_path))
+    calls = 0
+
+    async def login():
+        nonlocal calls
+        calls += 1
+        return CulturelandLogin("user", "KEEP"), create_session()
+
+    # 다른 프로세스가 잠금을 가지고 있는 상태
+    path = tmp_path / (hashlib.sha256(b"user").hexdigest() + ".lock")
+    held = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    assert lock_file(held)
+
+    try:
+        existing = asyncio.all_tasks()
+        caller = asyncio.ensure_future(coordinator.run(object(), "user", login, credential=PASSWORD))
+        await asyncio.sleep(LOCK_POLL_INTERVAL * 3)
+        assert not caller.done()
+
+        # 이벤트 루프 종료 때처럼 잠금을 기다리는 공유 로그인 작업까지 모두 취소
+        tasks = asyncio.all_tasks() - existing
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert caller.cancelled()
+    finally:
+        unlock_file(held)
+        os.close(held)
+
+    assert calls == 0
+
+    # 취소된 대기가 잠금을 남기지 않았으므로 다음 로그인은 바로 잠금을 얻음
+    result = await asyncio.wait_for(coordinator.run(object(), "user", login, credential=PASSWORD), 1)
+    assert result.user_id == "user"
+    assert calls == 1
@@ -0,0 +1,104 @@
+import json
+import os
+import pytest
+
+from io import BytesIO
+from PIL import Image
+
+np = pytest.importorskip("numpy")
+
+from cultureland.mTranskey.matcher import KeypadTemplateMatcher
+
+KEYPADS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "keypads")
+
+with open(os.path.join(KEYPADS, "layouts.json")) as f:
+    LAYOUTS: dict[str, dict[str, list[int]]] = json.load(f)
+
+def read_keypad(name: str):
+    with open(os.path.join(KEYPADS, name), "rb") as f:
+        return f.read()
+
+def add_noise(content: bytes, seed: int, sigma = 12.0, brightness = 8.0):
+    pixels = np.asarray(Image.open(BytesIO(content)).convert("RGB")).astype(np.float32)
+    pixels += np.random.default_rng(seed).normal(0, sigma, pixels.shape) + brightness
+    image = Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8))
+
+    content_bytes = BytesIO()
+    image.save(content_bytes, "PNG")
+    return content_bytes.getvalue()
+
+def fit(keyboard_type: str, names: list[str]):
+    return KeypadTemplateMatcher.fit(
+        [read_keypad(name) for name in names],
+        keyboard_type,
+        layouts=[LAYOUTS[keyboard_type][name] for name in names]
+    )
+
+@pytest.mark.parametrize("keyboard_type", ["number", "qwerty"])
+def test_recognize_fitted_keypads(keyboard_type):
+    names = list(LAYOUTS[keyboard_type])
+    matcher = fit(keyboard_type, names)
+
+    for name in names:
+        layout, confidence = matcher.classify(read_keypad(name))
+        assert layout == LAYOUTS[keyboard_type][name]
+        assert confidence > 0.9
+
+def test_recognize_unseen_number_keypad():
+    names = list(LAYOUTS["number"])
+    matcher = fit("number", names[:-1]) # 마지막 사진은 학습에서 제외
+
+    assert matcher.recognize(read_keypad(names[-1])) == LAYOUTS["number"][names[-1]]
+
+@pytest.mark.parametrize("keyboard_type", ["number", "qwerty"])
+def test_recognize_noisy_keypads(keyboard_type):
+    names = list(LAYOUTS[keyboard_type])
+    matcher = fit(keyboard_type, names)
+
+    for seed, name in enumerate(names):
+        content = add_noise(read_keypad(name), seed)
+        assert matcher.recognize(content) == LAYOUTS[keyboard_type][name]
+
+def test_recognize_rejects_low_confidence():
+    names = list(LAYOUTS["number"])
+    matcher = fit("number", names)
+
+    blank = BytesIO()
+    Image.new("RGB", (640, 306), (128, 128, 128)).save(blank, "PNG")
+
+    _, confidence = matcher.classify(blank.getvalue())
+    assert confidence < matcher.min_confidence
+    with pytest.raises(ValueError):
+        matcher.recognize(blank.getvalue())
+
+def test_save_load(tmp_path):
+    names = list(LAYOUTS["number"])
+    matcher = fit("number", names)
+
+    path = str(tmp_path / "number_templates.npz")
+    matcher.save(path)
+
+    loaded = KeypadTemplateMatcher.load(path)
+    assert loaded.keyboard_type == "number"
+    assert loaded.min_confidence == matcher.min_confidence
+    assert KeypadTemplateMatcher.load(path, min_confidence=0.5).min_confidence == 0.5
+
+    for seed, name in enumerate(names):
+        content = add_noise(read_keypad(name), seed)
+        assert loaded.classify(content) == matcher.classify(content)
+
+def test_fit_requires_recognizable_keypads():
+    content = read_keypad(next(iter(LAYOUTS["number"])))
+
+    # 직접 그린 사진은 해시 인식으로 분류할 수 없음
+    with pytest.raises(ValueError):
+        KeypadTemplateMatcher.fit([content], "number")
+
+    with pytest.raises(ValueError):
+        KeypadTemplateMatcher.fit([content], "number", layouts=[])
+
+    with pytest.raises(ValueError):
+        KeypadTemplateMatcher.fit([content], "number", layouts=[[0, 1, 2]])
+
+    with pytest.raises(ValueError):
+        KeypadTemplateMatcher.fit([], "number")
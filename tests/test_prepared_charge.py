@@ -0,0 +1,87 @@
+import httpx
+import pytest
+
+from cultureland import Cultureland, Pin, PreparedCharge
+from cultureland import _types as types_module
+
+PIN = Pin("3110-0123-4567-8901")
+
+def create_client(requests: list[str]):
+    def handler(request: httpx.Request):
+        requests.append(request.url.path)
+        if request.url.path == "/mmb/isLogin.json":
+            return httpx.Response(200, json=True)
+        if request.url.path == "/csh/cshGiftCardProcess.do":
+            return httpx.Response(302, headers={ "location": "/csh/cshGiftCardResult.do" })
+        if request.url.path == "/csh/cshGiftCardResult.do":
+            return httpx.Response(200, text="<table><tbody><tr><td></td><td></td><td>충전 완료</td><td>5,000원</td></tr></tbody></table>")
+        return httpx.Response(200)
+
+    return Cultureland(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+def test_consume_twice():
+    prepared = PreparedCharge((PIN,), True, {}, 60)
+    assert not prepared.submitted
+
+    prepared.consume()
+    assert prepared.submitted
+
+    with pytest.raises(Exception, match="이미 제출된 충전 요청입니다."):
+        prepared.consume()
+
+def test_consume_expired(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(types_module.time, "monotonic", lambda: now[0])
+
+    prepared = PreparedCharge((PIN,), True, {}, 60)
+    assert prepared.expires_at == 1060.0
+
+    now[0] += 59.9
+    assert not prepared.expired
+
+    now[0] += 0.1
+    assert prepared.expired
+    with pytest.raises(Exception, match="만료된 충전 요청입니다."):
+        prepared.consume()
+
+    # 만료된 요청은 제출된 것으로 바뀌지 않음
+    assert not prepared.submitted
+
+@pytest.mark.anyio
+async def test_submit_twice_sends_no_request():
+    requests: list[str] = []
+    client = create_client(requests)
+    prepared = PreparedCharge((PIN,), True, {}, 60)
+
+    assert (await client.submit_charge(prepared)).message == "충전 완료"
+
+    # 두 번째 제출은 충전 요청을 보내기 전에 실패
+    del requests[:]
+    with pytest.raises(Exception, match="이미 제출된 충전 요청입니다."):
+        await client.submit_charge(prepared)
+    assert all(path == "/mmb/isLogin.json" for path in requests)
+
+@pytest.mark.anyio
+async def test_submit_expired_sends_no_request(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(types_module.time, "monotonic", lambda: now[0])
+
+    requests: list[str] = []
+    client = create_client(requests)
+    prepared = PreparedCharge((PIN,), True, {}, 60)
+    now[0] += 61
+
+    with pytest.raises(Exception, match="만료된 충전 요청입니다."):
+        await client.submit_charge(prepared)
+    assert all(path == "/mmb/isLogin.json" for path in requests)
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("count, ttl", [(0, 300), (11, 300), (1, 0), (1, -1)])
+async def test_prepare_charge_invalid_arguments(count, ttl):
+    requests: list[str] = []
+    client = create_client(requests)
+    pins = [Pin(f"3110-0123-4567-{i:04d}") for i in range(count)]
+
+    with pytest.raises(ValueError):
+        await client.prepare_charge(*pins, ttl=ttl)
+    assert requests == []
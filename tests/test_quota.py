@@ -0,0 +1,107 @@
+import multiprocessing
+import pytest
+
+from cultureland import CulturelandCharge, QuotaTracker
+
+def record_lookups(path: str, count: int):
+    tracker = QuotaTracker(path, voucher_lookup_limit=1000)
+    for _ in range(count):
+        tracker.record_voucher_lookup("user")
+    tracker.close()
+
+@pytest.fixture
+def today(monkeypatch):
+    """
+    한국 시간 기준 오늘 날짜를 바꿀 수 있도록 고정
+    """
+
+    day = ["20241231"]
+    monkeypatch.setattr(QuotaTracker, "today", staticmethod(lambda: day[0]))
+    return day
+
+def test_limits(today):
+    tracker = QuotaTracker(voucher_lookup_limit=2, charge_failure_limit=3)
+
+    tracker.check_voucher_lookup("user")
+    tracker.record_voucher_lookup("user")
+    tracker.record_voucher_lookup("user")
+    assert tracker.remaining_voucher_lookups("user") == 0
+    with pytest.raises(Exception):
+        tracker.check_voucher_lookup("user")
+    assert tracker.remaining_voucher_lookups("other") == 2
+
+    tracker.record_charge("user", [CulturelandCharge("상품권 번호 불일치", 0), CulturelandCharge("충전 완료", 1000)])
+    assert tracker.remaining_charge_failures("user") == 2
+    tracker.record_charge("user", [CulturelandCharge("등록제한(20번 등록실패)", 0)])
+    with pytest.raises(Exception):
+        tracker.check_charge("user")
+
+    assert tracker.remaining_gift("user") is None
+    tracker.check_gift("user", 10 ** 9) # 확인한 적이 없다면 제한하지 않음
+    tracker.record_gift_limit("user", 50000)
+    tracker.record_gift("user", 30000)
+    assert tracker.remaining_gift("user") == 20000
+    with pytest.raises(Exception):
+        tracker.check_gift("user", 30000)
+
+def test_day_rollover(today):
+    tracker = QuotaTracker(voucher_lookup_limit=2)
+    tracker.record_voucher_lookup("user", exhausted=True)
+    tracker.record_gift_limit("user", 1000)
+    assert tracker.remaining_voucher_lookups("user") == 0
+
+    # 한국 시간 자정이 지나면 초기화
+    today[0] = "20250101"
+    assert tracker.remaining_voucher_lookups("user") == 2
+    assert tracker.remaining_gift("user") is None
+
+    tracker.record_voucher_lookup("user")
+    assert tracker.remaining_voucher_lookups("user") == 1
+
+def test_reload(today, tmp_path):
+    path = str(tmp_path / "quota.db")
+
+    tracker = QuotaTracker(path)
+    tracker.record_voucher_lookup("user")
+    tracker.record_gift_limit("user", 5000)
+    tracker.close()
+
+    tracker = QuotaTracker(path)
+    assert tracker.remaining_voucher_lookups("user") == 9
+    assert tracker.remaining_gift("user") == 5000
+
+    tracker.reset("user")
+    assert tracker.remaining_voucher_lookups("user") == 10
+    tracker.close()
+
+    # 다음 날 다시 불러오면 초기화
+    tracker = QuotaTracker(path)
+    tracker.record_voucher_lookup("user")
+    tracker.close()
+    today[0] = "20250101"
+    assert QuotaTracker(path).remaining_voucher_lookups("user") == 10
+
+def test_shared_path(today, tmp_path):
+    path = str(tmp_path / "quota.db")
+    first, second = QuotaTracker(path), QuotaTracker(path)
+
+    # 다른 인스턴스의 기록을 덮어쓰지 않고, 바로 조회됨
+    first.record_voucher_lookup("user")
+    second.record_voucher_lookup("user")
+    first.record_voucher_lookup("user")
+    assert first.remaining_voucher_lookups("user") == 7
+    assert second.remaining_voucher_lookups("user") == 7
+
+def test_shared_path_across_processes(tmp_path):
+    path = str(tmp_path / "quota.db")
+    QuotaTracker(path).close()
+
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=record_lookups, args=(path, 50)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert [process.exitcode for process in processes] == [0, 0, 0, 0]
+    assert QuotaTracker(path, voucher_lookup_limit=1000).remaining_voucher_lookups("user") == 800
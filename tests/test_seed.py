@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from cultureland.mTranskey.seed import Seed
+
+def random_geo(rng: random.Random):
+    # 키패드가 만드는 키 좌표와 같은 형식 | `l 123 45`, `123 45`
+    prefix = rng.choice(["", "l ", "u ", "s ", "d "])
+    return prefix + f"{rng.randrange(1000)} {rng.randrange(1000)}"
+
+def random_session_key(rng: random.Random, nibble = True):
+    # 실제 세션 키는 16진수 한 자리(0~15)씩이지만, 키 확장 검증을 위해 바이트 전체 범위도 사용
+    return [rng.randrange(16 if nibble else 256) for _ in range(16)]
+
+def reference_round_key(session_key: list[int]):
+    round_key = [0] * 32
+    Seed.SeedSetKey(round_key, list(session_key))
+    return round_key
+
+def reference_enc(geo: str, session_key: list[int]):
+    out_data = [0] * 64
+    Seed.SeedEncryptCbc(reference_round_key(session_key), [0x4d, 0x6f, 0x62, 0x69, 0x6c, 0x65, 0x54, 0x72, 0x61, 0x6e, 0x73, 0x4b, 0x65, 0x79, 0x31, 0x30], Seed.SeedEncData(geo), 64, out_data)
+    return ",".join(hex(c)[2:] for c in out_data)
+
+@pytest.mark.parametrize("nibble", [True, False])
+def test_round_key_fast_matches_seed_set_key(nibble):
+    rng = random.Random(1)
+
+    for _ in range(500):
+        session_key = random_session_key(rng, nibble)
+        expected = [k & 0xffffffff for k in reference_round_key(session_key)]
+        assert list(Seed.SeedRoundKeyFast(session_key)) == expected
+
+@pytest.mark.parametrize("nibble", [True, False])
+def test_seed_enc_fast_matches_slow(nibble):
+    rng = random.Random(2)
+
+    for _ in range(500):
+        session_key = random_session_key(rng, nibble)
+        geo = random_geo(rng)
+
+        slow = Seed.SeedEnc(geo, session_key, fast=False)
+        assert slow == reference_enc(geo, session_key)
+        assert Seed.SeedEnc(geo, session_key) == slow
+        assert Seed.SeedEnc(geo, roundKey=Seed.SeedRoundKeyFast(session_key)) == slow
+
+def test_seed_enc_requires_key():
+    with pytest.raises(ValueError):
+        Seed.SeedEnc("1 2")
+
+def test_seed_enc_batch_shared_round_key():
+    pytest.importorskip("numpy")
+    rng = random.Random(3)
+
+    session_key = random_session_key(rng)
+    round_key = Seed.SeedRoundKeyFast(session_key)
+    geos = [random_geo(rng) for _ in range(300)]
+
+    assert Seed.SeedEncBatch(geos, round_key) == [Seed.SeedEnc(geo, session_key, fast=False) for geo in geos]
+
+def test_seed_enc_batch_per_input_round_keys():
+    pytest.importorskip("numpy")
+    rng = random.Random(4)
+
+    session_keys = [random_session_key(rng, nibble=False) for _ in range(300)]
+    geos = [random_geo(rng) for _ in range(300)]
+
+    assert Seed.SeedEncBatch(geos, [Seed.SeedRoundKeyFast(key) for key in session_keys]) == [
+        Seed.SeedEnc(geo, key, fast=False) for geo, key in zip(geos, session_keys)
+    ]
+
+def test_seed_enc_batch_edge_cases():
+    pytest.importorskip("numpy")
+
+    assert Seed.SeedEncBatch([], Seed.SeedRoundKeyFast([0] * 16)) == []
+
+    with pytest.raises(ValueError):
+        Seed.SeedEncBatch(["1 2", "3 4"], [Seed.SeedRoundKeyFast([0] * 16)] * 3)
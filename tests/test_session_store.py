@@ -0,0 +1,101 @@
+import json
+import os
+import sqlite3
+import pytest
+
+from cultureland import CulturelandUser, FileSessionStore, SessionData, SessionStore, SQLiteSessionStore
+from cultureland.session_store import create_credential, verify_credential
+
+def create_session(saved_at = 1700000000.0):
+    return SessionData(
+        id="user",
+        keep_login_info="KEEP",
+        cookies=[{ "name": "SESSION", "value": "abc", "domain": "m.cultureland.co.kr", "path": "/" }],
+        user_info=CulturelandUser("01000000000", 1, True, "user", 1, "127.0.0.1", "0"),
+        saved_at=saved_at,
+        credential=create_credential("password")
+    )
+
+@pytest.fixture(params=["file", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "file":
+        yield FileSessionStore(str(tmp_path / "sessions"))
+        return
+
+    store = SQLiteSessionStore(str(tmp_path / "sessions.db"))
+    yield store
+    store.close()
+
+def corrupt(store: SessionStore, account: str, data: str):
+    # 저장소에 저장된 세션을 직접 덮어씀
+    if isinstance(store, FileSessionStore):
+        [name] = [name for name in os.listdir(store.directory) if name.endswith(".json")]
+        with open(os.path.join(store.directory, name), "w", encoding="utf-8") as f:
+            f.write(data)
+    else:
+        connection = sqlite3.connect(store.path)
+        with connection:
+            connection.execute("UPDATE sessions SET data = ? WHERE account = ?", (data, account))
+        connection.close()
+
+def test_round_trip(store: SessionStore):
+    assert store.load("user") is None
+
+    session = create_session()
+    store.save("user", session)
+    loaded = store.load("user")
+
+    assert loaded.id == session.id
+    assert loaded.keep_login_info == session.keep_login_info
+    assert loaded.cookies == session.cookies
+    assert loaded.user_info.user_key == session.user_info.user_key
+    assert loaded.saved_at == session.saved_at
+    assert verify_credential("password", loaded.credential)
+    assert not verify_credential("wrong", loaded.credential)
+
+    # 덮어쓰기
+    store.save("user", create_session(saved_at=1800000000.0))
+    assert store.load("user").saved_at == 1800000000.0
+    assert store.load("other") is None
+
+    store.delete("user")
+    assert store.load("user") is None
+    store.delete("user") # 없는 세션 삭제는 무시
+
+def test_version_mismatch(store: SessionStore):
+    store.save("user", create_session())
+
+    data = json.loads(create_session().to_json())
+    data["version"] = 0
+    corrupt(store, "user", json.dumps(data))
+    assert store.load("user") is None
+
+@pytest.mark.parametrize("data", [
+    "{",
+    "[]",
+    "null",
+    "",
+    '{"version": 1}',
+    '{"version": 1, "id": "user", "keep_login_info": "KEEP", "cookies": [], "user_info": {"unknown": 1}, "saved_at": 0}'
+])
+def test_corrupt_data(store: SessionStore, data: str):
+    store.save("user", create_session())
+    corrupt(store, "user", data)
+    assert store.load("user") is None
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX 파일 권한")
+def test_permissions(tmp_path):
+    FileSessionStore(str(tmp_path / "sessions")).save("user", create_session())
+    [name] = os.listdir(tmp_path / "sessions") # 임시 파일이 남지 않음
+    assert os.stat(tmp_path / "sessions" / name).st_mode & 0o777 == 0o600
+
+    SQLiteSessionStore(str(tmp_path / "sessions.db")).save("user", create_session())
+    assert os.stat(tmp_path / "sessions.db").st_mode & 0o777 == 0o600
+
+def test_incomplete_store_fails_on_instantiation():
+    class IncompleteStore(SessionStore):
+        def load(self, account: str):
+            return None
+
+    with pytest.raises(TypeError):
+        IncompleteStore()
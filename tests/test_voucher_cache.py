@@ -0,0 +1,142 @@
+import asyncio
+import hashlib
+import os
+import httpx
+import pytest
+
+from cultureland import Cultureland, CulturelandVoucher, Pin, PreparedCharge, VoucherCache
+from cultureland import voucher_cache as voucher_cache_module
+
+pytestmark = pytest.mark.anyio
+
+PIN = Pin("3110-0123-4567-8901")
+
+def create_voucher(balance = 5000):
+    return CulturelandVoucher(
+        amount=5000,
+        balance=balance,
+        cert_no="12345678",
+        created_date="20240101",
+        expiry_date="20290101",
+        spend_history=[]
+    )
+
+async def test_single_flight():
+    cache = VoucherCache()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return create_voucher()
+
+    vouchers = await asyncio.gather(*[cache.get_or_fetch(PIN, fetch) for _ in range(5)])
+    assert calls == 1
+    assert all(voucher is vouchers[0] for voucher in vouchers)
+    assert (cache.misses, cache.hits) == (1, 4)
+
+    # 캐시된 결과 반환
+    await cache.get_or_fetch(PIN, fetch)
+    assert calls == 1
+    assert cache.hits == 5
+
+async def test_failed_fetch_is_not_cached():
+    cache = VoucherCache()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise Exception("일일 조회수를 초과하셨습니다.")
+
+    results = await asyncio.gather(*[cache.get_or_fetch(PIN, fail) for _ in range(3)], return_exceptions=True)
+    assert all(isinstance(result, Exception) for result in results)
+    assert cache.size == 0
+
+    async def fetch():
+        return create_voucher()
+
+    assert (await cache.get_or_fetch(PIN, fetch)).balance == 5000
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(voucher_cache_module.time, "time", lambda: now[0])
+
+    cache = VoucherCache(ttl=60)
+    cache.set(PIN, create_voucher())
+    now[0] += 60
+    assert cache.get(PIN) is not None
+
+    now[0] += 1
+    assert cache.get(PIN) is None
+    assert cache.size == 0
+
+def test_maxsize():
+    cache = VoucherCache(maxsize=2)
+    pins = [Pin(f"3110-0123-4567-890{i}") for i in range(3)]
+    for pin in pins:
+        cache.set(pin, create_voucher())
+
+    assert cache.size == 2
+    assert cache.get(pins[0]) is None
+    assert cache.get(pins[2]) is not None
+
+def test_key_is_keyed_hmac(tmp_path):
+    path = str(tmp_path / "vouchers.json")
+    cache = VoucherCache(path=path)
+
+    # 단순 해시가 아니며, 같은 경로의 캐시는 같은 키를 사용
+    assert cache.key(PIN) != hashlib.sha256(str(PIN).encode()).hexdigest()
+    assert VoucherCache(path=path).key(PIN) == cache.key(PIN)
+    assert VoucherCache().key(PIN) != VoucherCache().key(PIN)
+    assert VoucherCache(secret=b"secret").key(PIN) == VoucherCache(secret=b"secret").key(PIN)
+
+def test_disk_cache(tmp_path):
+    path = str(tmp_path / "vouchers.json")
+    VoucherCache(path=path).set(PIN, create_voucher(balance=3000))
+
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+    assert str(PIN) not in content and "".join(PIN.parts) not in content
+    assert hashlib.sha256(str(PIN).encode()).hexdigest() not in content
+
+    if os.name == "posix":
+        assert os.stat(path).st_mode & 0o777 == 0o600
+        assert os.stat(path + ".key").st_mode & 0o777 == 0o600
+
+    # 임시 파일이 남지 않음
+    assert sorted(os.listdir(tmp_path)) == ["vouchers.json", "vouchers.json.key"]
+
+    assert VoucherCache(path=path).get(PIN).balance == 3000
+    assert VoucherCache(path=path, secret=b"other").get(PIN) is None
+
+def test_disk_cache_ignores_corrupt_file(tmp_path):
+    path = str(tmp_path / "vouchers.json")
+    with open(path, "w") as f:
+        f.write("{")
+
+    cache = VoucherCache(path=path)
+    assert cache.size == 0
+    cache.set(PIN, create_voucher())
+    assert VoucherCache(path=path).size == 1
+
+async def test_invalidate_on_charge():
+    def handler(request: httpx.Request):
+        if request.url.path == "/mmb/isLogin.json":
+            return httpx.Response(200, json=True)
+        if request.url.path == "/csh/cshGiftCardProcess.do":
+            return httpx.Response(302, headers={ "location": "/csh/cshGiftCardResult.do" })
+        if request.url.path == "/csh/cshGiftCardResult.do":
+            return httpx.Response(200, text="<table><tbody><tr><td></td><td></td><td>충전 완료</td><td>5,000원</td></tr></tbody></table>")
+        return httpx.Response(200)
+
+    cache = VoucherCache()
+    cache.set(PIN, create_voucher())
+    other = Pin("3110-0123-4567-8902")
+    cache.set(other, create_voucher())
+
+    client = Cultureland(httpx.AsyncClient(transport=httpx.MockTransport(handler)), voucher_cache=cache)
+    result = await client.submit_charge(PreparedCharge((PIN,), True, {}, 60))
+
+    assert result.message == "충전 완료"
+    assert cache.get(PIN) is None # 충전한 상품권만 제거
+    assert cache.get(other) is not None